@@ -0,0 +1,30 @@
+import { api } from "@/api/axios-config";
+
+// Largest page the list endpoints serve (MAX_PAGE_SIZE on the service)
+export const PAGE_SIZE = 200;
+
+export interface Page<T> {
+  success: boolean;
+  status_code: number;
+  data: T[];
+  next_cursor?: string | null;
+}
+
+// Fetch every page of a keyset-paginated list endpoint by following next_cursor
+export const fetchAllPages = async <T>(
+  url: string,
+  params: Record<string, unknown> = {}
+): Promise<Page<T>> => {
+  const rows: T[] = [];
+  let cursor: string | null | undefined;
+  for (;;) {
+    const { data: page } = await api.get<Page<T>>(url, {
+      params: { ...params, limit: PAGE_SIZE, ...(cursor ? { cursor } : {}) },
+    });
+    rows.push(...page.data);
+    if (!page.next_cursor) {
+      return { ...page, data: rows, next_cursor: null };
+    }
+    cursor = page.next_cursor;
+  }
+};
@@ -1,4 +1,4 @@
-import { api } from "@/api/axios-config";
+import { fetchAllPages } from "@/api/pagination";
 
 // API response types
 export interface CandidateUserDTO {
@@ -22,10 +22,7 @@ export interface CandidatesByJobResponse {
   data: CandidateDTO[];
 }
 
-// Service: fetch candidates by job description id
-export const fetchCandidatesByJob = async (jdId: number | string) => {
-  const { data } = await api.get<CandidatesByJobResponse>(`/candidates/by-job`, {
-    params: { jd_id: jdId },
-  });
-  return data;
+// Service: fetch all candidates for a job description id (every page)
+export const fetchCandidatesByJob = async (jdId: number | string): Promise<CandidatesByJobResponse> => {
+  return await fetchAllPages<CandidateDTO>(`/candidates/by-job`, { jd_id: jdId });
 };
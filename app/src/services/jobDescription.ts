@@ -1,4 +1,4 @@
-import { api } from "@/api/axios-config";
+import { fetchAllPages } from "@/api/pagination";
 import type { Job } from "@/types/jobDescription";
 
 export interface ApiResponse<T> {
@@ -7,7 +7,7 @@ export interface ApiResponse<T> {
     data: T;
 }
 
-// job description api
-export const jobDescription = async () => {
-    return await api.get<ApiResponse<Job[]>>("/jd");
+// job description api: the list is paginated, so follow every page
+export const jobDescription = async (): Promise<{ data: ApiResponse<Job[]> }> => {
+    return { data: await fetchAllPages<Job>("/jd/") };
 };
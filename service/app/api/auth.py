@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from .. import schemas, crud, auth
+from ..db.connection import get_db
 from fastapi.responses import JSONResponse
 
 
@@ -8,7 +9,7 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=schemas.UserOut)
-async def register(user_create: schemas.UserCreate, db: AsyncSession = Depends(auth.get_db)):
+async def register(user_create: schemas.UserCreate, db: AsyncSession = Depends(get_db)):
     existing = await crud.get_user_by_email(db, user_create.email)
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
@@ -19,7 +20,7 @@ async def register(user_create: schemas.UserCreate, db: AsyncSession = Depends(a
 from fastapi.responses import JSONResponse
 
 @router.post("/login", response_model=schemas.LoginResponse)
-async def login(form_data: schemas.LoginRequest, db: AsyncSession = Depends(auth.get_db)):
+async def login(form_data: schemas.LoginRequest, db: AsyncSession = Depends(get_db)):
     try:
         user = await crud.get_user_by_email(db, form_data.email)
         if not user:
@@ -32,7 +33,7 @@ async def login(form_data: schemas.LoginRequest, db: AsyncSession = Depends(auth
                 }
             )
         
-        if not auth.verify_password(form_data.password, user.password):
+        if not await auth.verify_password_async(form_data.password, user.password):
             return JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={
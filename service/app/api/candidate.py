@@ -1,12 +1,17 @@
 # app/api/candidate.py
-from fastapi import APIRouter, Depends, status, HTTPException
+import secrets
+from fastapi import APIRouter, Depends, status, HTTPException, Query, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from app import crud, schemas
+from typing import List, Optional
+from datetime import datetime
+from app import auth, crud, schemas
+from app import candidate_import
 from app.db.connection import get_db
 from app.dependencies import require_roles
-from app.models import Interview, InterviewStatus
+from app.models import Candidate, Interview, InterviewStatus
 from app.schemas import ScheduleStatusRequest
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, cursor_id, paginate
+from app.serialization import FastJSONResponse, candidate_row_to_dict
 from sqlalchemy import select
 
 
@@ -15,38 +20,68 @@ router = APIRouter(prefix="/api/candidates", tags=["Candidates"])
 # --- Get all candidates ---
 @router.get("/", response_model=schemas.CandidateListResponse)
 async def get_all_candidates(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,  # next_cursor from the previous page
+    jd_id: Optional[int] = None,
+    interview_status: Optional[InterviewStatus] = Query(None, alias="status"),
+    applied_from: Optional[datetime] = None,
+    applied_to: Optional[datetime] = None,
     db: AsyncSession = Depends(get_db),
-    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter")),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter", trust_claims=True)),
 ):
-    candidates = await crud.get_candidates(db)
-    # attach interview status
-    for c in candidates:
-        c.interview_status = c.interview.status.value if c.interview else "pending"
-    return {"success": True, "status_code": status.HTTP_200_OK, "data": candidates}
+    rows = await crud.get_candidate_rows(
+        db,
+        limit=limit + 1,
+        after_id=cursor_id(cursor),
+        jd_id=jd_id,
+        status=interview_status,
+        applied_from=applied_from,
+        applied_to=applied_to,
+    )
+    candidates, next_cursor = paginate(rows, limit)
+    # Rows already match CandidateOut, so serialize them directly
+    return FastJSONResponse({
+        "success": True,
+        "status_code": status.HTTP_200_OK,
+        "data": [candidate_row_to_dict(row) for row in candidates],
+        "next_cursor": next_cursor
+    })
 
 # --- Get candidates for a specific job ID ---
 @router.get("/by-job", response_model=schemas.CandidateListResponse)
 async def get_candidates_by_job(
     jd_id: int,  # query param: ?jd_id=1
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    interview_status: Optional[InterviewStatus] = Query(None, alias="status"),
+    applied_from: Optional[datetime] = None,
+    applied_to: Optional[datetime] = None,
     db: AsyncSession = Depends(get_db),
-    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter")),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter", trust_claims=True)),
 ):
-    candidates = await crud.get_candidates_by_jd(db, jd_id)
-    # Add interview status similar to get_all_candidates method
-    for c in candidates:
-        c.interview_status = c.interview.status.value if c.interview else "pending"
-    return {
+    rows = await crud.get_candidate_rows(
+        db,
+        limit=limit + 1,
+        after_id=cursor_id(cursor),
+        jd_id=jd_id,
+        status=interview_status,
+        applied_from=applied_from,
+        applied_to=applied_to,
+    )
+    candidates, next_cursor = paginate(rows, limit)
+    return FastJSONResponse({
         "success": True,
         "status_code": status.HTTP_200_OK,
-        "data": candidates
-    }
+        "data": [candidate_row_to_dict(row) for row in candidates],
+        "next_cursor": next_cursor
+    })
 
 # --- Get a single candidate by ID ---
 @router.get("/id/{candidate_id}", response_model=schemas.CandidateOut)  # changed path
 async def get_candidate(
     candidate_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter")),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter", trust_claims=True)),
 ):
     candidate = await crud.get_candidate_by_id(db, candidate_id)
     if not candidate:
@@ -60,6 +95,27 @@ async def get_candidate(
         )
     return candidate
 
+# --- Offline assessment of a candidate's interview ---
+@router.get("/id/{candidate_id}/assessment", response_model=schemas.AssessmentResponse)
+async def get_candidate_assessment(
+    candidate_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter", trust_claims=True)),
+):
+    row = await crud.get_candidate_assessment(db, candidate_id)
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "status_code": status.HTTP_404_NOT_FOUND,
+                "message": f"No interview found for candidate {candidate_id}"
+            }
+        )
+    data = dict(row._mapping)
+    data["attempts"] = data["attempts"] or 0
+    return {"success": True, "status_code": status.HTTP_200_OK, "data": data}
+
 @router.post("/schedule-status", response_model=schemas.InterviewOut)
 async def schedule_interview_status(
     payload: ScheduleStatusRequest,
@@ -90,3 +146,67 @@ async def schedule_interview_status(
 
     return interview
 
+
+# --- Schedule many candidates at once ---
+BULK_SCHEDULE_MAX_ENTRIES = 1000
+
+@router.post("/schedule-bulk", response_model=schemas.BulkScheduleResponse)
+async def schedule_interviews_bulk(
+    payload: schemas.BulkScheduleRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter"))
+):
+    if len(payload.entries) > BULK_SCHEDULE_MAX_ENTRIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "message": f"At most {BULK_SCHEDULE_MAX_ENTRIES} entries can be scheduled per request"
+            }
+        )
+    results = await crud.schedule_interviews_bulk(db, payload.entries)
+    return {
+        "success": True,
+        "status_code": status.HTTP_200_OK,
+        "scheduled": sum(1 for r in results if r["status"] == "scheduled"),
+        "data": results
+    }
+
+# --- Bulk import from a CSV / NDJSON upload ---
+IMPORT_MAX_ERRORS = 1000
+
+@router.post("/import", response_model=schemas.CandidateImportResponse)
+async def import_candidates(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),  # default: from file name
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter")),
+):
+    """Stream the upload in chunks; each chunk is committed on its own and bad rows are reported."""
+    fmt = candidate_import.detect_format(file, file_format)
+    # Accounts created here get a random password; candidates don't log in with it
+    password_hash = await auth.get_password_hash_async(secrets.token_urlsafe(32))
+
+    result = {"imported": 0, "users_created": 0, "failed": 0, "chunks": 0, "errors": [], "errors_truncated": False}
+
+    def add_errors(errors):
+        result["failed"] += len(errors)
+        for line, email, message in errors:
+            if len(result["errors"]) >= IMPORT_MAX_ERRORS:
+                result["errors_truncated"] = True
+                break
+            result["errors"].append({"line": line, "email": email, "message": message})
+
+    async for chunk in candidate_import.iter_chunks(candidate_import.iter_rows(file, fmt)):
+        result["chunks"] += 1
+        valid = [(line, row) for line, row in chunk if isinstance(row, schemas.CandidateImportRow)]
+        add_errors([(line, None, row) for line, row in chunk if isinstance(row, str)])
+        if not valid:
+            continue
+        chunk_result = await crud.import_candidate_chunk(db, valid, password_hash)
+        result["imported"] += chunk_result["imported"]
+        result["users_created"] += chunk_result["users_created"]
+        add_errors(chunk_result["errors"])
+
+    return {"success": True, "status_code": status.HTTP_200_OK, "data": result}
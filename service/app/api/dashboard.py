@@ -0,0 +1,30 @@
+# app/api/dashboard.py
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app import crud, schemas
+from app.db.connection import get_db
+from app.dependencies import require_roles
+
+
+router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
+
+# --- Aggregate candidate / interview counts ---
+@router.get("/stats", response_model=schemas.DashboardStatsResponse)
+async def get_dashboard_stats(
+    jd_id: Optional[int] = None,  # restrict to a single JD
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter", trust_claims=True)),
+):
+    stats = await crud.get_dashboard_stats(db, jd_id)
+    return {"success": True, "status_code": status.HTTP_200_OK, "data": stats}
+
+# --- Recompute counters from the source tables ---
+@router.post("/stats/rebuild", response_model=schemas.DashboardStatsResponse)
+async def rebuild_dashboard_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin")),
+):
+    await crud.rebuild_interview_stats(db)
+    stats = await crud.get_dashboard_stats(db)
+    return {"success": True, "status_code": status.HTTP_200_OK, "data": stats}
@@ -1,18 +1,22 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from app import crud, schemas, auth
 from app.db.connection import get_db
 from app.schemas import TokenData
 from app.models import JDListResponse
+from app.prompt_cache import prompt_cache
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, cursor_id, paginate
 
 router = APIRouter(prefix="/api/jd", tags=["Job Description"])
 
 # --- List all JDs ---
 @router.get("/", response_model=JDListResponse)
 async def get_jds(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,  # next_cursor from the previous page
     db: AsyncSession = Depends(get_db),
-    current_user: TokenData = Depends(auth.get_current_user)
+    current_user: TokenData = Depends(auth.get_current_user_claims)
 ):
     if current_user.role not in ["admin", "recruiter"]:
         raise HTTPException(
@@ -24,18 +28,20 @@ async def get_jds(
             }
         )
 
-    jds = await crud.get_jds(db)
+    rows = await crud.get_jds(db, limit=limit + 1, after_id=cursor_id(cursor))
+    jds, next_cursor = paginate(rows, limit)
     return {
         "success": True,
         "status_code": status.HTTP_200_OK,
-        "data": jds
+        "data": jds,
+        "next_cursor": next_cursor
     }
 
 # --- JD count ---
 @router.get("/count")
 async def get_jd_count(
     db: AsyncSession = Depends(get_db),
-    current_user: TokenData = Depends(auth.get_current_user)
+    current_user: TokenData = Depends(auth.get_current_user_claims)
 ):
     if current_user.role not in ["admin", "recruiter"]:
         raise HTTPException(
@@ -60,7 +66,7 @@ async def get_jd_count(
 async def get_jd_by_id(
     jd_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: TokenData = Depends(auth.get_current_user)
+    current_user: TokenData = Depends(auth.get_current_user_claims)
 ):
     if current_user.role not in ["admin", "recruiter"]:
         raise HTTPException(
@@ -90,3 +96,35 @@ async def get_jd_by_id(
     }
 
 
+# --- Interview prompt size for a JD ---
+@router.get("/{jd_id}/prompt-stats")
+async def get_jd_prompt_stats(
+    jd_id: int,
+    current_user: TokenData = Depends(auth.get_current_user_claims)
+):
+    if current_user.role not in ["admin", "recruiter"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "success": False,
+                "status_code": status.HTTP_403_FORBIDDEN,
+                "message": "You are not authorized to view this JD."
+            }
+        )
+
+    compiled = await prompt_cache.get("software_engineer", jd_id)
+    if compiled.jd_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "status_code": status.HTTP_404_NOT_FOUND,
+                "message": f"JD with id {jd_id} not found"
+            }
+        )
+
+    return {
+        "success": True,
+        "status_code": status.HTTP_200_OK,
+        "data": compiled.to_dict()
+    }
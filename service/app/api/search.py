@@ -0,0 +1,88 @@
+# app/api/search.py
+"""Ranked full-text search over JDs and candidates.
+
+Matching is answered by the GIN expression indexes declared in ``app.models``,
+so it stays fast as the tables grow. Ranking only covers the
+``SEARCH_RANK_WINDOW`` matches with the lowest ids. When a query matches more
+rows than that, the ranking is approximate: the response sets ``truncated``
+and ``approximate``, and a more specific query gives better results.
+Candidate search only considers candidate users (of ``jd_id``, when given).
+Every word in ``q`` must match, as a prefix ("kube" finds "Kubernetes").
+"""
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.db.connection import get_db
+from app.dependencies import require_roles
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, cursor_rank_id, paginate
+from app.serialization import FastJSONResponse, candidate_row_to_dict
+
+SEARCH_RANK_WINDOW = int(os.getenv("SEARCH_RANK_WINDOW", "1000"))
+
+router = APIRouter(prefix="/api/search", tags=["Search"])
+
+
+def _rank_key(row) -> dict:
+    return {"rank": row.rank, "id": row.id}
+
+
+def _truncated(rows) -> bool:
+    """Whether more rows matched than the window ranked."""
+    return bool(rows) and rows[0].matched >= SEARCH_RANK_WINDOW
+
+
+# --- Search JDs by title, skills and responsibilities ---
+@router.get("/jds", response_model=schemas.JDSearchResponse)
+async def search_jds(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,  # next_cursor from the previous page
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter", trust_claims=True)),
+):
+    terms = crud.prefix_tsquery(q)
+    rows = []
+    if terms:
+        rows = await crud.search_jds(db, terms, limit + 1, SEARCH_RANK_WINDOW, after=cursor_rank_id(cursor))
+    jds, next_cursor = paginate(rows, limit, key=_rank_key)
+    truncated = _truncated(rows)
+    return {
+        "success": True,
+        "status_code": status.HTTP_200_OK,
+        "data": [{name: value for name, value in row._mapping.items() if name != "matched"} for row in jds],
+        "next_cursor": next_cursor,
+        "truncated": truncated,
+        "approximate": truncated,
+    }
+
+
+# --- Search candidates by name and email ---
+@router.get("/candidates", response_model=schemas.CandidateSearchResponse)
+async def search_candidates(
+    q: str = Query(..., min_length=1, max_length=200),
+    jd_id: Optional[int] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter", trust_claims=True)),
+):
+    terms = crud.prefix_tsquery(q)
+    rows = []
+    if terms:
+        rows = await crud.search_candidates(
+            db, terms, limit + 1, SEARCH_RANK_WINDOW, after=cursor_rank_id(cursor), jd_id=jd_id
+        )
+    candidates, next_cursor = paginate(rows, limit, key=_rank_key)
+    truncated = _truncated(rows)
+    return FastJSONResponse({
+        "success": True,
+        "status_code": status.HTTP_200_OK,
+        "data": [{**candidate_row_to_dict(row), "rank": row.rank} for row in candidates],
+        "next_cursor": next_cursor,
+        "truncated": truncated,
+        "approximate": truncated,
+    })
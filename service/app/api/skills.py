@@ -0,0 +1,97 @@
+# app/api/skills.py
+"""Skill matching over the normalized skill index.
+
+JD skills are split and normalized once when a JD is written (``jd_skills``),
+and candidate skills once when an interview is assessed (``candidate_skills``).
+These endpoints read that inverted index instead of scanning skills text, so
+"which JDs need Kubernetes" is an index lookup. ``skills`` is a comma-separated
+list (or a repeated parameter); matching ignores case and extra whitespace.
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.db.connection import get_db
+from app.dependencies import require_roles
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, cursor_rank_id, paginate
+from app.serialization import FastJSONResponse, candidate_row_to_dict
+from app.skills import parse_skill_query
+
+MAX_QUERY_SKILLS = 50
+
+router = APIRouter(prefix="/api/skills", tags=["Skills"])
+
+
+def _skill_keys(skills: List[str]) -> List[str]:
+    keys = list(parse_skill_query(skills))
+    if not keys or len(keys) > MAX_QUERY_SKILLS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "message": f"Give between 1 and {MAX_QUERY_SKILLS} skills"
+            }
+        )
+    return keys
+
+
+def _score_key(row) -> dict:
+    return {"rank": row.score, "id": row.id}
+
+
+# --- JDs ranked by how many of the skills they ask for ---
+@router.get("/jds", response_model=schemas.SkillJDMatchResponse)
+async def match_jds(
+    skills: List[str] = Query(...),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,  # next_cursor from the previous page
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter", trust_claims=True)),
+):
+    rows = await crud.match_jds(db, _skill_keys(skills), limit + 1, after=cursor_rank_id(cursor))
+    jds, next_cursor = paginate(rows, limit, key=_score_key)
+    return {
+        "success": True,
+        "status_code": status.HTTP_200_OK,
+        "data": [dict(row._mapping) for row in jds],
+        "next_cursor": next_cursor,
+    }
+
+
+# --- Assessed candidates ranked by their scores on the skills ---
+@router.get("/candidates", response_model=schemas.SkillCandidateMatchResponse)
+async def match_candidates(
+    skills: List[str] = Query(...),
+    jd_id: Optional[int] = None,
+    min_score: int = Query(0, ge=0, le=100),  # ignore skills scored below this
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin", "recruiter", trust_claims=True)),
+):
+    rows = await crud.match_candidates(
+        db, _skill_keys(skills), limit + 1, after=cursor_rank_id(cursor), jd_id=jd_id, min_score=min_score
+    )
+    candidates, next_cursor = paginate(rows, limit, key=_score_key)
+    return FastJSONResponse({
+        "success": True,
+        "status_code": status.HTTP_200_OK,
+        "data": [
+            {**candidate_row_to_dict(row), "score": row.score, "matched_skills": row.matched_skills}
+            for row in candidates
+        ],
+        "next_cursor": next_cursor,
+    })
+
+
+# --- Re-derive the index from JD text and assessments ---
+@router.post("/rebuild", response_model=schemas.SkillIndexRebuildResponse)
+async def rebuild_skill_index(
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.UserOut = Depends(require_roles("admin")),
+):
+    counts = await crud.rebuild_skill_index(db)
+    return {"success": True, "status_code": status.HTTP_200_OK, "data": counts}
@@ -0,0 +1,316 @@
+# app/assessment_worker.py
+"""Offline scoring of completed interviews.
+
+``crud.complete_interview_from_turns`` queues an ``assessment_jobs`` row when an
+interview ends. This worker claims due jobs in batches, scores each transcript
+against the JD's required and preferred skills through an ``AssessmentClient``
+(at most ``ASSESSMENT_CONCURRENCY`` calls in flight), and writes the batch back
+in one transaction. A failed call is requeued with exponential backoff until
+``ASSESSMENT_MAX_ATTEMPTS``, then the job is marked failed.
+
+Scoring never runs in a process that serves live interviews unless asked to.
+Run it on its own:
+
+    python -m app.assessment_worker [--once]
+
+or set ``ASSESSMENT_WORKER=1`` on an API-only replica (``SERVICE_ROLE=api``) to
+run it inside the REST process. ``ASSESSMENT_CLIENT=stub`` scores locally with
+keyword matching, with no LLM calls, for development and load tests.
+"""
+import abc
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app import crud, metrics
+from app.db.connection import AsyncSessionLocal
+
+ASSESSMENT_WORKER = os.getenv("ASSESSMENT_WORKER", "0") == "1"
+ASSESSMENT_CLIENT = os.getenv("ASSESSMENT_CLIENT", "anthropic")
+ASSESSMENT_MODEL = os.getenv("ASSESSMENT_MODEL", "claude-3-5-haiku-20241022")
+ASSESSMENT_MAX_TRANSCRIPT_CHARS = int(os.getenv("ASSESSMENT_MAX_TRANSCRIPT_CHARS", "60000"))
+
+ASSESSMENT_INSTRUCTIONS = (
+    "You assess job interview transcripts. Score how well the candidate demonstrated "
+    "each listed skill, from 0 (not shown or clearly lacking) to 100 (expert, with "
+    "concrete evidence), judging only what the candidate said. Reply with JSON only: "
+    '{"skill_scores": {"<skill>": <0-100>, ...}, "overall_score": <0-100>, '
+    '"summary": "<two or three sentences>"}. Weigh required skills above preferred ones.'
+)
+
+
+class AssessmentClient(abc.ABC):
+    """Scores one transcript. Implementations raise on failures worth retrying."""
+
+    model = "unknown"
+
+    @abc.abstractmethod
+    async def score(self, transcript: str, required_skills: List[str], preferred_skills: List[str]) -> Dict[str, Any]:
+        """Return ``{"overall_score": int, "skill_scores": {skill: int}, "summary": str}``."""
+
+    async def close(self):
+        pass
+
+
+def _clamp(value) -> int:
+    return max(0, min(100, int(round(float(value)))))
+
+
+def _candidate_text(transcript: str) -> str:
+    """The candidate's side of a ``format_transcript`` transcript."""
+    parts = re.split(r"\[(INTERVIEWER|CANDIDATE)\]: ", transcript)
+    return " ".join(text for role, text in zip(parts[1::2], parts[2::2]) if role == "CANDIDATE")
+
+
+class StubAssessmentClient(AssessmentClient):
+    """Deterministic local scoring: how often the candidate mentions each skill."""
+
+    model = "stub"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    async def score(self, transcript, required_skills, preferred_skills):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        said = _candidate_text(transcript).lower()
+        skill_scores = {skill: min(100, 40 * said.count(skill.lower())) for skill in required_skills + preferred_skills}
+        required = [skill_scores[skill] for skill in required_skills] or list(skill_scores.values())
+        overall = sum(required) / len(required) if required else 0
+        return {
+            "overall_score": _clamp(overall),
+            "skill_scores": skill_scores,
+            "summary": f"Keyword match over {len(said.split())} candidate words.",
+        }
+
+
+class AnthropicAssessmentClient(AssessmentClient):
+    """Scores with one Claude call per transcript."""
+
+    def __init__(self, model: str = ASSESSMENT_MODEL, max_tokens: int = 800):
+        # Imported here so the REST app only loads the SDK when it runs the worker
+        from anthropic import AsyncAnthropic
+
+        self._client = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"), max_retries=0)
+        self.model = model
+        self.max_tokens = max_tokens
+
+    async def score(self, transcript, required_skills, preferred_skills):
+        request = (
+            f"Required skills: {', '.join(required_skills) or '(none listed)'}\n"
+            f"Preferred skills: {', '.join(preferred_skills) or '(none listed)'}\n\n"
+            f"Transcript:\n{transcript}"
+        )
+        response = await self._client.messages.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=0,
+            system=ASSESSMENT_INSTRUCTIONS,
+            messages=[{"role": "user", "content": request}],
+        )
+        text = "".join(block.text for block in response.content if block.type == "text")
+        match = re.search(r"\{.*\}", text, re.DOTALL)
+        if not match:
+            raise ValueError("assessment reply contained no JSON")
+        parsed = json.loads(match.group(0))
+        return {
+            "overall_score": _clamp(parsed["overall_score"]),
+            "skill_scores": {str(skill): _clamp(score) for skill, score in parsed.get("skill_scores", {}).items()},
+            "summary": str(parsed.get("summary", "")).strip() or None,
+        }
+
+    async def close(self):
+        await self._client.close()
+
+
+def create_client(name: str = ASSESSMENT_CLIENT) -> AssessmentClient:
+    if name == "stub":
+        return StubAssessmentClient()
+    if name == "anthropic":
+        return AnthropicAssessmentClient()
+    raise ValueError(f"ASSESSMENT_CLIENT must be 'anthropic' or 'stub', got {name!r}")
+
+
+class AssessmentWorker:
+    """Claims assessment jobs in batches and scores them with bounded concurrency."""
+
+    def __init__(
+        self,
+        client: Optional[AssessmentClient],
+        batch_size: int,
+        concurrency: int,
+        max_attempts: int,
+        poll_interval: float,
+        lease_seconds: float,
+        retry_base_seconds: float = 30.0,
+    ):
+        self.client = client
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.scored = 0
+        self.retried = 0
+        self.failed = 0
+        self.skipped = 0
+        self.batches = 0
+
+    @classmethod
+    def from_env(cls, client: Optional[AssessmentClient] = None) -> "AssessmentWorker":
+        return cls(
+            client=client,
+            batch_size=int(os.getenv("ASSESSMENT_BATCH_SIZE", "20")),
+            concurrency=int(os.getenv("ASSESSMENT_CONCURRENCY", "4")),
+            max_attempts=int(os.getenv("ASSESSMENT_MAX_ATTEMPTS", "5")),
+            poll_interval=float(os.getenv("ASSESSMENT_POLL_INTERVAL_SECONDS", "5")),
+            lease_seconds=float(os.getenv("ASSESSMENT_LEASE_SECONDS", "600")),
+        )
+
+    async def start(self):
+        if self._task is None or self._task.done():
+            if self.client is None:
+                self.client = create_client()
+            self._task = asyncio.create_task(self.run(), name="assessment-worker")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.client:
+            await self.client.close()
+
+    async def run(self):
+        async with AsyncSessionLocal() as db:
+            queued = await crud.enqueue_completed_interviews(db)
+        if queued:
+            logger.info(f"Queued {queued} completed interviews for assessment")
+        while True:
+            try:
+                processed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Assessment batch failed: {str(e)}")
+                processed = 0
+            if processed < self.batch_size:
+                # Queue drained; a full batch means more are probably waiting
+                await asyncio.sleep(self.poll_interval)
+
+    async def run_once(self) -> int:
+        """Claim, score and save one batch; returns the number of jobs claimed."""
+        async with AsyncSessionLocal() as db:
+            jobs = await crud.claim_assessment_jobs(db, self.batch_size, self.lease_seconds)
+        if not jobs:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        outcomes = await asyncio.gather(*(self._score(job, semaphore) for job in jobs))
+
+        scored, retry, failed, skipped = [], [], [], []
+        now = datetime.datetime.now(datetime.timezone.utc)
+        for job, (outcome, value) in zip(jobs, outcomes):
+            if outcome == "scored":
+                scored.append({
+                    **value,
+                    "job_id": job["job_id"],
+                    "interview_id": job["interview_id"],
+                    "candidate_id": job["candidate_id"],
+                    "jd_id": job["jd_id"],
+                })
+            elif outcome == "skipped":
+                skipped.append(job["job_id"])
+            elif job["attempts"] >= self.max_attempts:
+                failed.append((job["job_id"], value))
+            else:
+                delay = self.retry_base_seconds * 2 ** (job["attempts"] - 1)
+                retry.append((job["job_id"], now + datetime.timedelta(seconds=delay), value))
+
+        async with AsyncSessionLocal() as db:
+            await crud.save_assessment_results(db, scored, retry, failed, skipped)
+
+        for result, jobs_in_result in (("scored", scored), ("retry", retry), ("failed", failed), ("skipped", skipped)):
+            if jobs_in_result:
+                metrics.ASSESSMENT_JOBS.labels(result=result).inc(len(jobs_in_result))
+        self.scored += len(scored)
+        self.retried += len(retry)
+        self.failed += len(failed)
+        self.skipped += len(skipped)
+        self.batches += 1
+        logger.info(
+            f"Assessment batch: {len(scored)} scored, {len(retry)} retrying, "
+            f"{len(failed)} failed, {len(skipped)} skipped"
+        )
+        return len(jobs)
+
+    async def _score(self, job: dict, semaphore: asyncio.Semaphore):
+        transcript = (job["interview_qa"] or "").strip()
+        if not transcript:
+            return "skipped", None
+        if len(transcript) > ASSESSMENT_MAX_TRANSCRIPT_CHARS:
+            # Keep the end: answers get longer and more specific as the interview goes on
+            transcript = transcript[-ASSESSMENT_MAX_TRANSCRIPT_CHARS:]
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await self.client.score(transcript, job["required_skills"], job["preferred_skills"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Assessment of interview {job['interview_id']} failed (attempt {job['attempts']}): {e}")
+                return "error", f"{type(e).__name__}: {e}"[:1000]
+            finally:
+                metrics.ASSESSMENT_SECONDS.observe(time.perf_counter() - start)
+        return "scored", {**result, "model": self.client.model}
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "scored": self.scored,
+            "retried": self.retried,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "batches": self.batches,
+        }
+
+
+assessment_worker = AssessmentWorker.from_env()
+
+
+async def _main(once: bool):
+    worker = AssessmentWorker.from_env(create_client())
+    try:
+        if once:
+            async with AsyncSessionLocal() as db:
+                await crud.enqueue_completed_interviews(db)
+            while await worker.run_once() == worker.batch_size:
+                pass
+            logger.info(f"Assessment run finished: {worker.stats()}")
+        else:
+            await worker.run()
+    finally:
+        await worker.client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--once", action="store_true", help="drain the jobs that are due now, then exit")
+    args = parser.parse_args()
+    asyncio.run(_main(args.once))
+
+
+if __name__ == "__main__":
+    main()
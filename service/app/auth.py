@@ -1,5 +1,7 @@
 # app/auth.py
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -11,7 +13,8 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import schemas, crud
-from .db.connection import AsyncSessionLocal
+from .db.connection import get_db
+from .user_cache import user_cache
 
 load_dotenv()
 
@@ -20,6 +23,8 @@ if not SECRET_KEY:
     raise RuntimeError("JWT_SECRET_KEY is not set in environment")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+# Opt-in: read-only endpoints authorize from the token's role claim, no DB hit
+AUTH_TRUST_TOKEN_CLAIMS = os.getenv("AUTH_TRUST_TOKEN_CLAIMS", "0") == "1"
 
 # Keep passlib context around so you can flip to bcrypt later without refactor
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -27,6 +32,13 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+# bcrypt takes ~100ms+ of CPU per call by design. Run it on a small dedicated
+# thread pool (bcrypt releases the GIL) so logins never block the event loop
+# that also drives live interviews; the pool size caps concurrent hashing.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
+
 # HACKATHON/DEV: plaintext comparison to match your existing DB
 def verify_password(plain_password: str, stored_password: str) -> bool:
     return pwd_context.verify(plain_password, stored_password)
@@ -35,6 +47,15 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, stored_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, verify_password, plain_password, stored_password)
+
+async def get_password_hash_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = (datetime.utcnow() + expires_delta) if expires_delta else (
@@ -44,15 +65,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        yield session
-
-
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-):
+def _decode_token(token: str) -> dict:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",  # do not leak details
@@ -66,9 +79,54 @@ async def get_current_user(
             raise credentials_exception
     except JWTError:
         raise credentials_exception
+    return payload
+
 
-    # Look up the user (by email is fine; you could also add get_user_by_id)
-    user = await crud.get_user_by_email(db, email)
-    if not user:
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",  # do not leak details
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    payload = _decode_token(token)
+    user_id = payload["user_id"]
+
+    # Recently seen users are served from memory (no DB round trip)
+    user = user_cache.get(user_id)
+    if user is None:
+        db_user = await crud.get_user_by_id(db, user_id)
+        if not db_user:
+            raise credentials_exception
+        user = schemas.UserOut.from_orm(db_user)
+        user_cache.set(user_id, user)
+
+    # Tokens issued for a previous email address are no longer valid
+    if user.email != payload["email"]:
         raise credentials_exception
     return user
+
+
+async def get_current_user_claims(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+):
+    """Resolve the user for read-only endpoints.
+
+    With AUTH_TRUST_TOKEN_CLAIMS=1 the signed ``role`` claim is trusted as-is
+    and no lookup happens at all; role changes then take effect when the user's
+    token is reissued. Otherwise this is the same as ``get_current_user``.
+    """
+    if not AUTH_TRUST_TOKEN_CLAIMS:
+        return await get_current_user(token, db)
+
+    payload = _decode_token(token)
+    if payload.get("role") is None:
+        return await get_current_user(token, db)
+    return schemas.UserOut(
+        id=payload["user_id"],
+        email=payload["email"],
+        role=payload["role"],
+    )
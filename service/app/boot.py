@@ -0,0 +1,86 @@
+# app/boot.py
+"""Service role and boot timing.
+
+``SERVICE_ROLE`` picks what a process serves:
+
+  all   REST API and live interviews (default)
+  api   REST API only; ``/api/connect`` is refused and the voice stack
+        (pipecat, the Deepgram/Cartesia/Anthropic SDKs, Silero) is never imported
+
+Processes that run interviews import the voice stack once, eagerly, during
+startup (``load_voice_stack``) so the first candidate does not pay for it.
+With ``BOT_WORKERS`` set that happens in the workers, not the API process.
+
+Boot is split into named phases, each timed from the end of the previous one
+(the first from when this module was imported). Phases are logged once boot is
+done and exported as ``service_boot_phase_seconds{phase}``.
+"""
+import os
+import time
+from typing import Dict
+
+from loguru import logger
+
+from app import metrics
+
+_started = time.perf_counter()
+_last_mark = _started
+_phases: Dict[str, float] = {}
+_voice_loaded = False
+
+SERVICE_ROLE = os.getenv("SERVICE_ROLE", "all").strip().lower()
+if SERVICE_ROLE not in ("all", "api"):
+    raise RuntimeError(f"SERVICE_ROLE must be 'all' or 'api', got {SERVICE_ROLE!r}")
+
+
+def serves_interviews() -> bool:
+    return SERVICE_ROLE == "all"
+
+
+def mark(phase: str) -> float:
+    """Record the time since the previous mark as ``phase``; returns it in seconds."""
+    global _last_mark
+    now = time.perf_counter()
+    seconds = now - _last_mark
+    _last_mark = now
+    _phases[phase] = seconds
+    metrics.SERVICE_BOOT_PHASE_SECONDS.labels(phase=phase).set(seconds)
+    return seconds
+
+
+def voice_loaded() -> bool:
+    return _voice_loaded
+
+
+def load_voice_stack():
+    """Import the interview pipeline and load the VAD model, once per process.
+
+    Blocking; call it from a thread when an event loop is running. Mark the
+    preceding phase first so its time isn't counted as voice imports.
+    """
+    global _voice_loaded
+    if _voice_loaded:
+        return
+    import pipecat.runner.types  # noqa: F401
+    import pipecat.transports.network.webrtc_connection  # noqa: F401
+    import app.bot  # noqa: F401
+    from app import vad
+
+    mark("voice_imports")
+    vad.load_vad_model()
+    mark("vad_model")
+    _voice_loaded = True
+
+
+def report() -> dict:
+    return {
+        "role": SERVICE_ROLE,
+        "voice_loaded": _voice_loaded,
+        "phases": dict(_phases),
+        "total_seconds": _last_mark - _started,
+    }
+
+
+def log_report(name: str = "Service"):
+    phases = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in _phases.items())
+    logger.info(f"{name} booted in {_last_mark - _started:.2f}s (role={SERVICE_ROLE}): {phases}")
@@ -16,12 +16,21 @@ Required AI services:
 The bot connects with the client using a P2P WebRTC connection.
 """
 
+import datetime
 import os
+import time
+import uuid
 from typing import Optional, Dict, Any, List
 
 from dotenv import load_dotenv
 from loguru import logger
-from app.interview_prompts import get_interview_prompt
+from app.interview_prompts import get_interview_prompt, build_session_prompt
+from app.prompt_cache import (
+    ANTHROPIC_PROMPT_CACHING,
+    cacheable_system_blocks,
+    parse_jd_id,
+    prompt_cache,
+)
 from app.db.connection import get_db
 from app import crud
 
@@ -29,14 +38,9 @@ from app import crud
 # Load environment variables
 load_dotenv(override=True)
 
-print("🚀 Starting Pipecat interview bot...")
-print("⏳ Loading AI models (30-40 seconds first run, <2 seconds after)\n")
-
-logger.info("Loading Silero VAD model...")
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-
-logger.info("✅ Silero VAD model loaded")
-logger.info("Loading pipeline components...")
+# The Silero model itself is loaded once per process (see app.vad) and
+# prewarmed at startup by app.boot.load_voice_stack, not per session
+from app import vad
 
 # Add this function near the top of your file after the imports
 def check_api_keys():
@@ -63,13 +67,15 @@ from pipecat.pipeline.task import PipelineParams, PipelineTask
 from pipecat.services.anthropic.llm import AnthropicLLMService, AnthropicLLMContext
 from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIObserver, RTVIProcessor
 from pipecat.runner.types import RunnerArguments
-from pipecat.services.cartesia.tts import CartesiaTTSService
 from pipecat.services.deepgram.stt import DeepgramSTTService
 from pipecat.transports.base_transport import BaseTransport, TransportParams
 from pipecat.transports.network.small_webrtc import SmallWebRTCTransport
-
-logger.info("✅ Pipeline components loaded")
-logger.info("✅ All components loaded successfully!")
+from pipecat.processors.transcript_processor import TranscriptProcessor
+from app.context_summarizer import CONTEXT_SUMMARIZATION, RollingContextSummarizer
+from app.interruptions import InterruptibleAnthropicLLMService
+from app.observers import InterruptionObserver, PipelineLatencyObserver, PromptCacheUsageObserver
+from app.transcript_writer import format_transcript, transcript_writer
+from app.tts_cache import create_tts_service
 
 
 async def create_interview_prompt(self) -> str:
@@ -223,119 +229,42 @@ async def save_transcript_to_db(job_id: str, transcript: str):
 class InterviewFlow:
     """Implements the interview flow and interaction logic using Pipecat."""
     
-    def __init__(self, transport: BaseTransport, runner_args: RunnerArguments, job_id: Optional[str] = None):
+    def __init__(
+        self,
+        transport: BaseTransport,
+        runner_args: RunnerArguments,
+        job_id: Optional[str] = None,
+        candidate_id: Optional[int] = None,
+    ):
         """Initialize the interview flow."""
         self.transport = transport
         self.runner_args = runner_args
         self.job_id = job_id
+        self.candidate_id = candidate_id
+        self.interview_id = None
+        self.session_id = uuid.uuid4().hex
         self.messages = []
+        # Full spoken transcript as (role, content); the LLM context may be trimmed
+        self.turns = []
         self.task = None
+        self.prompt_usage = None
+        self.latency = None
+        self.summarizer = None
+        self.interruptions = None
         logger.info(f"Initialized InterviewFlow for job_id: {job_id}")
     
     async def create_interview_prompt(self) -> str:
-        """Create a tailored interview prompt based on job details."""
-        # Start with the base interviewer prompt
-        base_prompt = get_interview_prompt("software_engineer")
-        
-        # Define strict interviewer rules
-        interviewer_rules = """
-# INTERVIEWER RULES - STRICTLY FOLLOW THESE:
-
-1. You are EXCLUSIVELY an interviewer conducting a technical assessment
-2. Your ONLY goal is to evaluate the candidate's skills and fit for the position
-3. NEVER answer general knowledge questions
-4. NEVER provide assistance or help with coding problems
-5. NEVER engage in casual conversation unrelated to the interview
-6. If the candidate tries to use you as a general assistant, politely redirect:
-   "Let's focus on assessing your skills for this position. Tell me about your experience with [relevant skill]."
-7. Follow a structured interview approach (introduction, skills assessment, behavioral questions, closing)
-8. Ask probing follow-up questions to thoroughly evaluate their answers
-9. End the interview with a professional closing, thanking them for their time
-
-Remember: You are conducting a professional assessment, not providing a service.
-"""
-        
-        # If no job_id, return base prompt with rules
-        if not self.job_id:
-            return f"{base_prompt}\n\n{interviewer_rules}"
-        
-        # Fetch job details
-        job_details = await self._fetch_job_details()
-        if not job_details:
-            return f"{base_prompt}\n\n{interviewer_rules}"
-        
-        # Parse skills
-        required_skills = self._parse_skills(job_details.get("required_skills", ""))
-        preferred_skills = self._parse_skills(job_details.get("preferred_skills", ""))
-        
-        # Create structured interview format
-        job_prompt = f"""
- Interviewing for: {job_details.get('title')}
-
- Position Details
-- Title: {job_details.get('title')}
-- Location: {job_details.get('location')}
-- Required Experience: {job_details.get('min_experience')} years
-
- Interview Structure
-1. Introduction (2 minutes)
-   - Introduce yourself as the interviewer for {job_details.get('title')} position
-   - Briefly explain the role and team
-
-2. Technical Skills Assessment (10-15 minutes)
-   - Required skills to evaluate:
-     {chr(10).join([f'   - {skill}: Ask specific technical questions about their experience' for skill in required_skills])}
-   
-   - If they mention having these preferred skills, assess them:
-     {chr(10).join([f'   - {skill}: Ask for examples of their work' for skill in preferred_skills])}
-
-3. Job Responsibility Assessment (5-10 minutes)
-   - Ask how they would handle these responsibilities:
-     "{job_details.get('responsibilities')}"
-
-4. Behavioral Questions (5 minutes)
-   - Ask about teamwork, communication, and problem-solving
-   - Evaluate their fit for the company culture
-
-5. Closing (2-3 minutes)
-   - Ask if they have questions about the role
-   - Thank them for their time
-   - Explain next steps in the interview process
-
-Remember to ask follow-up questions based on their answers to assess depth of knowledge.
-"""
-        
-        # Combine prompts
-        return f"{base_prompt}\n\n{job_prompt}\n\n{interviewer_rules}"
-    
-    async def _fetch_job_details(self) -> Optional[Dict[str, Any]]:
-        """Fetch job details from the database."""
-        try:
-            jd_id = int(self.job_id)
-            async for db in get_db():
-                job = await crud.get_jd_by_id(db, jd_id)
-                if job:
-                    return {
-                        "id": job.id,
-                        "title": job.title,
-                        "location": job.location,
-                        "opening": job.opening,
-                        "required_skills": job.required_skills,
-                        "preferred_skills": job.preferred_skills,
-                        "min_experience": job.min_experience,
-                        "responsibilities": job.responsibilities
-                    }
-                return None
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error fetching job details: {str(e)}")
-            return None
-    
-    def _parse_skills(self, skills_text: str) -> List[str]:
-        """Parse skills from comma-separated text."""
-        if not skills_text:
-            return []
-        skills = skills_text.split(",")
-        return [skill.strip() for skill in skills if skill.strip()]
+        """Create a tailored interview prompt based on job details.
+
+        Prompts are compiled once per (role, JD, JD revision) and cached, so
+        repeat interviews for the same JD skip the DB fetch and assembly.
+        """
+        compiled = await prompt_cache.get("software_engineer", parse_jd_id(self.job_id))
+        logger.info(
+            f"Interview prompt for JD {compiled.jd_id} (revision {compiled.revision}): "
+            f"~{compiled.token_count} tokens"
+        )
+        return compiled.text
     
     def _setup_ai_services(self):
         """Initialize AI services with API keys."""
@@ -343,30 +272,53 @@ Remember to ask follow-up questions based on their answers to assess depth of kn
         stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
         
         # Text-to-Speech service
-        tts = CartesiaTTSService(
-            api_key=os.getenv("CARTESIA_API_KEY"),
-            voice_id="bf0a246a-8642-498a-9950-80c35e9276b5",  # Professional voice
-        )
+        # Fixed interviewer lines are played from the pre-synthesized cache
+        tts = create_tts_service(api_key=os.getenv("CARTESIA_API_KEY"))
         
         # Large Language Model service
-        llm = AnthropicLLMService(
+        llm_params = {"temperature": 0.5}  # Lower temperature for consistent interviewing
+        if ANTHROPIC_PROMPT_CACHING and "enable_prompt_caching" in AnthropicLLMService.InputParams.model_fields:
+            # Also mark the latest conversation turns as cache breakpoints.
+            # Older pipecat only offers enable_prompt_caching_beta, which calls
+            # client.beta.prompt_caching; current anthropic SDKs no longer have
+            # it. The cache_control system blocks work through messages.create.
+            llm_params["enable_prompt_caching"] = True
+        # Closes the response stream when the candidate barges in
+        llm = InterruptibleAnthropicLLMService(
             api_key=os.getenv("ANTHROPIC_API_KEY"),
             model="claude-3-7-sonnet-20250219",
-            params=AnthropicLLMService.InputParams(
-                temperature=0.5  # Lower temperature for consistent interviewing
-            )
+            params=AnthropicLLMService.InputParams(**llm_params)
         )
         
         return stt, tts, llm
     
+    @staticmethod
+    def _create_context_aggregator(llm, context):
+        """Context aggregators for ``llm`` that keep the context's system prompt.
+
+        pipecat's create_context_aggregator rebuilds the context from its
+        messages (from_openai_context) and drops ``system``, so without this the
+        interview prompt never reaches the LLM.
+        """
+        context_aggregator = llm.create_context_aggregator(context)
+        context_aggregator.user().context.system = context.system
+        return context_aggregator
+    
     async def setup_pipeline(self):
         """Set up the Pipecat pipeline for the interview."""
         try:
             # Initialize AI services
             stt, tts, llm = self._setup_ai_services()
             
-            # Create tailored interview prompt
+            # Create tailored interview prompt. The compiled prompt is the stable
+            # prefix shared by every session for this JD; session details go in
+            # a short suffix after the provider cache breakpoint.
             system_prompt = await self.create_interview_prompt()
+            session_prompt = build_session_prompt(datetime.date.today().isoformat())
+            if ANTHROPIC_PROMPT_CACHING:
+                system = cacheable_system_blocks(system_prompt, session_prompt)
+            else:
+                system = f"{system_prompt}\n\n{session_prompt}"
             logger.info(f"System prompt length: {len(system_prompt)} characters")
             
             # Debug: Print the first 200 characters of the system prompt to verify it's correct
@@ -383,43 +335,75 @@ Remember to ask follow-up questions based on their answers to assess depth of kn
                 self.messages = [primer_message]
             
             # Initialize conversation context
-            context = AnthropicLLMContext(messages=self.messages, system=system_prompt)
+            context = AnthropicLLMContext(messages=self.messages, system=system)
             
             # Check if the system prompt is set correctly
-            if context.system != system_prompt:
+            if context.system != system:
                 logger.error(f"System prompt not set correctly. Expected: {system_prompt[:100]}...")
-                logger.error(f"But got: {context.system[:100] if context.system else 'None'}...")
+                logger.error(f"But got: {str(context.system)[:100] if context.system else 'None'}...")
             else:
                 logger.info("System prompt set correctly in context")
             
             # Create context aggregator
-            context_aggregator = llm.create_context_aggregator(context)
+            context_aggregator = self._create_context_aggregator(llm, context)
             
             # Set up RTVI processor
             rtvi = RTVIProcessor(config=RTVIConfig(config=[]))
             
+            # Capture each spoken turn as it happens
+            transcript = TranscriptProcessor()
+            
+            @transcript.event_handler("on_transcript_update")
+            async def on_transcript_update(processor, frame):
+                for message in frame.messages:
+                    self._record_turn(message.role, message.content)
+            
+            # Keep the LLM context bounded over a long interview
+            self.summarizer = None
+            if CONTEXT_SUMMARIZATION:
+                self.summarizer = RollingContextSummarizer(llm._client, system, session_id=self.session_id)
+            
             # Create the pipeline
             pipeline = Pipeline(
                 [
                     self.transport.input(),      # Audio input from candidate
                     rtvi,                        # Real-time voice intelligence
                     stt,                         # Convert speech to text
+                    transcript.user(),           # Record candidate turns
                     context_aggregator.user(),   # Process user input
+                    *([self.summarizer] if self.summarizer else []),  # Fold old turns into a summary
                     llm,                         # Generate interviewer response
                     tts,                         # Convert text to speech
                     self.transport.output(),     # Audio output to candidate
+                    transcript.assistant(),      # Record what the interviewer actually said
                     context_aggregator.assistant() # Process assistant response
                 ]
             )
             
+            # Record cached vs. uncached prompt tokens per LLM turn
+            self.prompt_usage = PromptCacheUsageObserver(llm, session_id=self.session_id)
+            # Per-stage TTFB and end-to-end turn latency, exported on /metrics
+            self.latency = PipelineLatencyObserver(
+                self.transport.input(), self.transport.output(), stt, llm, tts, session_id=self.session_id
+            )
+            # Generated vs. actually spoken tokens and audio, to size barge-in waste
+            self.interruptions = InterruptionObserver(
+                self.transport.input(), self.transport.output(), llm, tts, session_id=self.session_id
+            )
+            
             # Create pipeline task
             self.task = PipelineTask(
                 pipeline,
                 params=PipelineParams(
+                    # A candidate speaking cancels the in-flight LLM stream,
+                    # pending TTS and unplayed audio. The assistant aggregator
+                    # sits after the output transport, so only the words that
+                    # were actually played are committed to the context.
+                    allow_interruptions=True,
                     enable_metrics=True,
                     enable_usage_metrics=True,
                 ),
-                observers=[RTVIObserver(rtvi)],
+                observers=[RTVIObserver(rtvi), self.prompt_usage, self.latency, self.interruptions],
             )
             
             return context_aggregator
@@ -429,31 +413,50 @@ Remember to ask follow-up questions based on their answers to assess depth of kn
             logger.error(traceback.format_exc())
             raise
     
+    def _record_turn(self, role: str, content: str):
+        """Keep a turn in memory and queue it for write-behind persistence."""
+        role = "interviewer" if role == "assistant" else "candidate"
+        self.turns.append((role, content))
+        transcript_writer.enqueue({
+            "session_id": self.session_id,
+            "interview_id": self.interview_id,
+            "jd_id": parse_jd_id(self.job_id),
+            "seq": len(self.turns),
+            "role": role,
+            "content": content,
+            "spoken_at": datetime.datetime.now(datetime.timezone.utc),
+        })
+    
     def _format_transcript(self) -> str:
-        """Format the interview messages into a readable transcript."""
-        transcript_parts = []
-        
-        for msg in self.messages:
-            role = "INTERVIEWER" if msg["role"] == "assistant" else "CANDIDATE"
-            content = msg["content"]
-            transcript_parts.append(f"[{role}]: {content}")
-        
-        return "\n\n".join(transcript_parts)
+        """Format the interview turns into a readable transcript."""
+        return format_transcript(self.turns)
     
-    async def _save_transcript(self):
-        """Save the interview transcript to the database."""
-        if not self.job_id or len(self.messages) <= 2:
+    async def _start_interview(self):
+        """Link this session to the candidate's interview and mark it ongoing."""
+        if self.candidate_id is None:
             return
-            
         try:
-            transcript = self._format_transcript()
-            logger.info(f"Interview completed. Transcript length: {len(transcript)} characters")
-            
             async for db in get_db():
-                # Implementation would depend on your database schema
-                # This is a placeholder for where you would save the transcript
-                logger.info(f"Saving transcript for job_id: {self.job_id}")
-                # await crud.save_interview_transcript(db, self.job_id, transcript)
+                interview = await crud.start_interview(db, self.candidate_id)
+                if interview:
+                    self.interview_id = interview.id
+                break
+        except Exception as e:
+            logger.error(f"Failed to start interview for candidate {self.candidate_id}: {str(e)}")
+    
+    async def _save_transcript(self):
+        """Finish persisting turns and derive the interview transcript from them."""
+        logger.info(f"Interview completed. Transcript length: {len(self._format_transcript())} characters")
+        try:
+            # Turns were written as they happened; wait for this session's tail to land
+            written = await transcript_writer.flush(self.session_id)
+            if self.interview_id is None:
+                logger.info(f"Turns for session {self.session_id} saved without a linked interview")
+                return
+            async for db in get_db():
+                # If the writer is backed up, build the transcript from the turns in memory
+                await crud.complete_interview_from_turns(db, self.interview_id, None if written else self.turns)
+                logger.info(f"Saved transcript for interview {self.interview_id}")
                 break
         except Exception as e:
             logger.error(f"Failed to save transcript: {str(e)}")
@@ -463,7 +466,10 @@ Remember to ask follow-up questions based on their answers to assess depth of kn
         logger.info(f"Starting interview flow for job_id: {self.job_id}")
         
         # Set up pipeline and get context
+        setup_start = time.perf_counter()
+        await self._start_interview()
         context_aggregator = await self.setup_pipeline()
+        logger.info(f"Interview session setup took {(time.perf_counter() - setup_start) * 1000:.0f} ms")
         
         # Handle client connection
         @self.transport.event_handler("on_client_connected")
@@ -482,6 +488,14 @@ Remember to ask follow-up questions based on their answers to assess depth of kn
         @self.transport.event_handler("on_client_disconnected")
         async def on_client_disconnected(transport, client):
             logger.info("Client disconnected - interview ended")
+            if self.prompt_usage:
+                logger.info(f"Prompt cache usage: {self.prompt_usage.summary()}")
+            if self.latency:
+                logger.info(f"Pipeline latency: {self.latency.summary()}")
+            if self.summarizer:
+                logger.info(f"Context summaries: {self.summarizer.summaries}")
+            if self.interruptions:
+                logger.info(f"Interruptions: {self.interruptions.summary()}")
             await self._save_transcript()
             await self.task.cancel()
         
@@ -490,10 +504,9 @@ Remember to ask follow-up questions based on their answers to assess depth of kn
         await runner.run(self.task)
 
 
-async def bot(runner_args: RunnerArguments, job_id: Optional[str] = None):
+async def bot(runner_args: RunnerArguments, job_id: Optional[str] = None, candidate_id: Optional[int] = None):
     """Main entry point for the interview bot."""
     logger.info(f"Initializing interview bot with job_id: {job_id}")
-    print("🚀 Starting Pipecat interview bot...")
 
     # Check API keys first
     if not check_api_keys():
@@ -506,13 +519,13 @@ async def bot(runner_args: RunnerArguments, job_id: Optional[str] = None):
             params=TransportParams(
                 audio_in_enabled=True,
                 audio_out_enabled=True,
-                vad_analyzer=SileroVADAnalyzer(),
+                vad_analyzer=vad.create_vad_analyzer(),
             ),
             webrtc_connection=runner_args.webrtc_connection,
         )
         
         # Create and run the interview flow
-        interview = InterviewFlow(transport, runner_args, job_id)
+        interview = InterviewFlow(transport, runner_args, job_id, candidate_id)
         await interview.run()
     except Exception as e:
         logger.error(f"Error initializing interview bot: {str(e)}")
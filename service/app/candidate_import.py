@@ -0,0 +1,104 @@
+# app/candidate_import.py
+"""Streaming parser for bulk candidate uploads (CSV or NDJSON).
+
+The upload is read in fixed-size blocks and split into lines as it arrives,
+so memory use depends on the chunk size, not on the file size. Each line is
+validated on its own; bad rows are reported by line number and never stop the
+rest of the import.
+
+CSV files need a header row with at least ``email`` and ``jd_id`` columns
+(``full_name`` and ``applied_at`` are optional). Quoted fields may not span
+lines. NDJSON files carry one JSON object per line with the same keys.
+"""
+import codecs
+import csv
+import json
+import os
+from typing import AsyncIterator, List, Optional, Tuple, Union
+
+from fastapi import UploadFile
+from pydantic import ValidationError
+
+from app.schemas import CandidateImportRow
+
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+IMPORT_READ_BLOCK_BYTES = 64 * 1024
+
+ParsedRow = Tuple[int, Union[CandidateImportRow, str]]
+
+
+def detect_format(upload: UploadFile, requested: Optional[str] = None) -> str:
+    if requested:
+        return requested.lower()
+    name = (upload.filename or "").lower()
+    content_type = (upload.content_type or "").lower()
+    if name.endswith((".ndjson", ".jsonl")) or "ndjson" in content_type or "jsonl" in content_type:
+        return "ndjson"
+    return "csv"
+
+
+async def iter_lines(upload: UploadFile) -> AsyncIterator[Tuple[int, str]]:
+    """Yield (line_number, line) pairs while reading the upload in blocks."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    line_number = 0
+    while True:
+        block = await upload.read(IMPORT_READ_BLOCK_BYTES)
+        if not block:
+            break
+        buffer += decoder.decode(block)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield line_number + 1, buffer.rstrip("\r")
+
+
+def _validate(raw: dict) -> Union[CandidateImportRow, str]:
+    cleaned = {key.strip(): value for key, value in raw.items() if key and value not in ("", None)}
+    try:
+        return CandidateImportRow(**cleaned)
+    except ValidationError as e:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+        )
+
+
+async def iter_rows(upload: UploadFile, fmt: str) -> AsyncIterator[ParsedRow]:
+    """Yield (line_number, validated row or error message) for every data line."""
+    header: Optional[List[str]] = None
+    async for line_number, line in iter_lines(upload):
+        if not line.strip():
+            continue
+        if fmt == "ndjson":
+            try:
+                raw = json.loads(line)
+            except ValueError as e:
+                yield line_number, f"invalid JSON: {e}"
+                continue
+            if not isinstance(raw, dict):
+                yield line_number, "expected a JSON object"
+                continue
+            yield line_number, _validate(raw)
+        else:
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [name.strip().lower() for name in values]
+                continue
+            if len(values) != len(header):
+                yield line_number, f"expected {len(header)} columns, got {len(values)}"
+                continue
+            yield line_number, _validate(dict(zip(header, values)))
+
+
+async def iter_chunks(rows: AsyncIterator[ParsedRow], size: int = IMPORT_CHUNK_SIZE) -> AsyncIterator[List[ParsedRow]]:
+    chunk: List[ParsedRow] = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
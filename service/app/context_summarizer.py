@@ -0,0 +1,206 @@
+# app/context_summarizer.py
+"""Bounded LLM context for long interviews.
+
+Without trimming, every turn resends the whole conversation, so late questions
+in a 30-minute interview are the slowest and most expensive. The
+``RollingContextSummarizer`` sits between the user context aggregator and the
+LLM and keeps the context to:
+
+  system prompt (cached prefix + session suffix) + running summary
+  + the setup messages sent before the interviewer's first reply
+  + the last ``keep_turns`` turns verbatim
+
+When enough older turns pile up, a summary call runs as a background task,
+so no turn waits for it. Until it lands, those turns stay in the context as they
+are. If the summary is slow and the context exceeds ``keep_turns +
+2 * batch_turns`` anyway, the oldest turns are dropped straight away and folded
+into the next summary.
+
+Only the LLM context is trimmed; the spoken transcript that
+``InterviewFlow._save_transcript`` persists is recorded separately.
+"""
+import asyncio
+import copy
+import os
+import time
+from typing import Any, Dict, List, Optional, Set, Union
+
+from loguru import logger
+from pipecat.frames.frames import Frame
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContextFrame
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from app import metrics
+
+CONTEXT_SUMMARIZATION = os.getenv("CONTEXT_SUMMARIZATION", "1") == "1"
+CONTEXT_KEEP_TURNS = int(os.getenv("CONTEXT_KEEP_TURNS", "6"))
+CONTEXT_SUMMARY_BATCH_TURNS = int(os.getenv("CONTEXT_SUMMARY_BATCH_TURNS", "4"))
+CONTEXT_SUMMARY_MODEL = os.getenv("CONTEXT_SUMMARY_MODEL", "claude-3-5-haiku-20241022")
+CONTEXT_SUMMARY_MAX_TOKENS = int(os.getenv("CONTEXT_SUMMARY_MAX_TOKENS", "400"))
+
+SUMMARY_INSTRUCTIONS = (
+    "You keep the interviewer's running notes for a job interview. Merge the "
+    "earlier notes with the new part of the conversation into one set of concise "
+    "notes: questions already asked, what the candidate said in answer (skills, "
+    "years, projects, numbers), strengths, concerns, and follow-ups still open. "
+    "Only record what was actually said. Reply with the notes only, under 250 words."
+)
+
+
+def _message_text(message: dict) -> str:
+    content = message.get("content")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(block.get("text", "") for block in content if block.get("type") == "text")
+    return ""
+
+
+def _render(messages: List[dict]) -> str:
+    lines = []
+    for message in messages:
+        role = "INTERVIEWER" if message["role"] == "assistant" else "CANDIDATE"
+        lines.append(f"{role}: {_message_text(message)}")
+    return "\n".join(lines)
+
+
+class RollingContextSummarizer(FrameProcessor):
+    """Keeps the last turns verbatim and older ones as a running summary.
+
+    ``client`` is the LLM service's Anthropic client; summary calls share its
+    connection pool. ``system`` is the context's system prompt without the
+    summary (a string, or blocks when provider prompt caching is on).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        system: Union[str, List[Dict[str, Any]]],
+        *,
+        keep_turns: int = CONTEXT_KEEP_TURNS,
+        batch_turns: int = CONTEXT_SUMMARY_BATCH_TURNS,
+        model: str = CONTEXT_SUMMARY_MODEL,
+        max_tokens: int = CONTEXT_SUMMARY_MAX_TOKENS,
+        session_id: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._client = client
+        self._system = system
+        # A turn is a candidate message and the interviewer's reply
+        self._keep_messages = 2 * keep_turns
+        self._batch_messages = 2 * batch_turns
+        self._max_messages = self._keep_messages + 2 * self._batch_messages
+        self._model = model
+        self._max_tokens = max_tokens
+        self._session_id = session_id
+
+        self.summary = ""
+        self.summaries = 0
+        self._pinned: Optional[int] = None
+        # Messages already removed from the context but not yet summarised
+        self._backlog: List[dict] = []
+        self._task: Optional[asyncio.Task] = None
+        # (summary, ids of context messages it covers) from a finished task
+        self._result: Optional[tuple] = None
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, OpenAILLMContextFrame) and direction == FrameDirection.DOWNSTREAM:
+            self._compact(frame.context)
+        await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        await super().cleanup()
+        if self._task:
+            await self.cancel_task(self._task)
+            self._task = None
+
+    def _compact(self, context):
+        messages = context.messages
+        if self._pinned is None:
+            first_reply = next((i for i, m in enumerate(messages) if m["role"] == "assistant"), None)
+            if first_reply is None:
+                return
+            # Setup instructions before the first reply stay in every request
+            self._pinned = first_reply
+
+        if self._result is not None:
+            self.summary, covered = self._result
+            self._result = None
+            self._remove(messages, covered)
+            context.system = self._system_with_summary()
+
+        if len(messages) - self._pinned > self._max_messages:
+            # Summary is behind: drop the oldest turns now, summarise them later
+            cut = self._cut_index(messages, self._max_messages)
+            self._backlog.extend(messages[self._pinned:cut])
+            del messages[self._pinned:cut]
+            metrics.INTERVIEW_CONTEXT_DROPPED_MESSAGES.inc(cut - self._pinned)
+
+        if self._task is None:
+            cut = self._cut_index(messages, self._keep_messages)
+            if self._backlog or cut - self._pinned >= self._batch_messages:
+                batch = messages[self._pinned:cut]
+                self._task = self.create_task(self._summarize(self._backlog, batch))
+                self._backlog = []
+
+        metrics.INTERVIEW_CONTEXT_MESSAGES.observe(len(messages))
+
+    def _cut_index(self, messages: List[dict], keep: int) -> int:
+        """Start of the kept tail: at most ``keep`` messages, beginning on a candidate turn."""
+        cut = max(self._pinned, len(messages) - keep)
+        while cut < len(messages) and messages[cut]["role"] != "user":
+            cut += 1
+        return cut
+
+    @staticmethod
+    def _remove(messages: List[dict], covered: Set[int]):
+        messages[:] = [m for m in messages if id(m) not in covered]
+
+    def _system_with_summary(self):
+        if not self.summary:
+            return self._system
+        notes = f"Notes on the interview so far (earlier turns are not shown):\n{self.summary}"
+        if isinstance(self._system, list):
+            # After the cached prefix, so the provider cache still hits
+            return copy.copy(self._system) + [{"type": "text", "text": notes}]
+        return f"{self._system}\n\n{notes}"
+
+    async def _summarize(self, backlog: List[dict], batch: List[dict]):
+        start = time.perf_counter()
+        transcript = _render(backlog + batch)
+        request = f"Earlier notes:\n{self.summary or '(none)'}\n\nNew part of the conversation:\n{transcript}"
+        try:
+            stream = await self._client.messages.create(
+                model=self._model,
+                max_tokens=self._max_tokens,
+                system=SUMMARY_INSTRUCTIONS,
+                messages=[{"role": "user", "content": request}],
+                stream=True,
+            )
+            parts = []
+            async for event in stream:
+                if event.type == "content_block_delta" and hasattr(event.delta, "text"):
+                    parts.append(event.delta.text)
+            summary = "".join(parts).strip()
+            if not summary:
+                raise ValueError("empty summary")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Batch turns are still in the context; only dropped ones need retrying
+            logger.warning(f"[{self._session_id}] Context summary failed: {e}")
+            metrics.INTERVIEW_CONTEXT_SUMMARIES.labels(result="error").inc()
+            self._backlog = backlog + self._backlog
+        else:
+            self._result = (summary, {id(m) for m in batch})
+            self.summaries += 1
+            metrics.INTERVIEW_CONTEXT_SUMMARIES.labels(result="ok").inc()
+            logger.debug(
+                f"[{self._session_id}] Summarised {len(backlog) + len(batch)} messages "
+                f"in {time.perf_counter() - start:.2f}s"
+            )
+        finally:
+            metrics.INTERVIEW_CONTEXT_SUMMARY_SECONDS.observe(time.perf_counter() - start)
+            self._task = None
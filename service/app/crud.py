@@ -19,9 +19,24 @@
 #     await db.refresh(user)
 #     return user
 
-from sqlalchemy import select
+from sqlalchemy import select, update, values, column, and_, or_, case, func, text, literal, tuple_, type_coerce, literal_column, Integer, DateTime, String
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from .models import User, JobDescription, Candidate, Interview, InterviewStatus
+from typing import Dict, List, Optional, Tuple
+import datetime
+import re
+from loguru import logger
+from .models import (
+    User, JobDescription, Candidate, Interview, InterviewStatus, InterviewTurn, InterviewStats,
+    AssessmentJob, AssessmentJobStatus, InterviewAssessment, STATUS_COUNTERS,
+    install_interview_stats, recount_interview_stats,
+    JD_SEARCH_CONFIG, JD_SEARCH_VECTOR, USER_SEARCH_CONFIG, USER_SEARCH_VECTOR,
+    Skill, JDSkill, CandidateSkill, install_skill_index, reindex_jd_skills, sync_candidate_skills,
+)
+from .skills import KIND_WEIGHTS, PREFERRED, REQUIRED, split_skills
+from .schemas import CandidateImportRow
+from .transcript_writer import format_transcript
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import selectinload  # Add this import at the top of the file
 
@@ -30,11 +45,14 @@ async def get_user_by_email(db: AsyncSession, email: str):
     res = await db.execute(q)
     return res.scalars().first()
 
+async def get_user_by_id(db: AsyncSession, user_id: int):
+    return await db.get(User, user_id)
+
 async def create_user(db: AsyncSession, user_create):
     # Import locally to avoid circular import at module load time
-    from .auth import get_password_hash
+    from .auth import get_password_hash_async
 
-    hashed = get_password_hash(user_create.password)
+    hashed = await get_password_hash_async(user_create.password)
     user = User(
         email=user_create.email,
         password=hashed,
@@ -52,23 +70,107 @@ async def get_jd_by_id(db: AsyncSession, jd_id: int):
     return result.scalars().first()
 
 async def get_jd_count(db: AsyncSession) -> int:
-    result = await db.execute(select(JobDescription))
-    return len(result.scalars().all())
+    return await db.scalar(select(func.count()).select_from(JobDescription))
 
-async def get_jds(db: AsyncSession):
-    result = await db.execute(select(JobDescription))
+async def get_jds(db: AsyncSession, limit: Optional[int] = None, after_id: Optional[int] = None):
+    q = select(JobDescription).order_by(JobDescription.id)
+    if after_id is not None:
+        q = q.where(JobDescription.id > after_id)
+    if limit is not None:
+        q = q.limit(limit)
+    result = await db.execute(q)
     return result.scalars().all()
 
 # --- Candidate CRUD ---
-async def get_candidates(db: AsyncSession):
-    result = await db.execute(select(Candidate).options(joinedload(Candidate.user), joinedload(Candidate.interview)))
+def filter_candidates(
+    q,
+    jd_id: Optional[int] = None,
+    status: Optional[InterviewStatus] = None,
+    applied_from: Optional[datetime.datetime] = None,
+    applied_to: Optional[datetime.datetime] = None,
+    interview_joined: bool = False,
+):
+    """Apply the candidate listing filters to a query selecting from Candidate.
+
+    Pass ``interview_joined=True`` when the query already outer-joins Interview.
+    """
+    if jd_id is not None:
+        q = q.where(Candidate.jd_id == jd_id)
+    if applied_from is not None:
+        q = q.where(Candidate.applied_at >= applied_from)
+    if applied_to is not None:
+        q = q.where(Candidate.applied_at < applied_to)
+    if status is not None:
+        if not interview_joined:
+            q = q.outerjoin(Interview, Interview.candidate_id == Candidate.id)
+        if status == InterviewStatus.pending:
+            # Candidates without an interview row are reported as pending
+            q = q.where(or_(Interview.status == status, Interview.id.is_(None)))
+        else:
+            q = q.where(Interview.status == status)
+    return q
+
+async def get_candidates(
+    db: AsyncSession,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    jd_id: Optional[int] = None,
+    status: Optional[InterviewStatus] = None,
+    applied_from: Optional[datetime.datetime] = None,
+    applied_to: Optional[datetime.datetime] = None,
+):
+    q = select(Candidate).options(joinedload(Candidate.user), joinedload(Candidate.interview))
+    q = filter_candidates(q, jd_id, status, applied_from, applied_to).order_by(Candidate.id)
+    if after_id is not None:
+        q = q.where(Candidate.id > after_id)
+    if limit is not None:
+        q = q.limit(limit)
+    result = await db.execute(q)
     return result.scalars().all()
 
-async def get_candidates_by_jd(db: AsyncSession, jd_id: int):
-    result = await db.execute(
-        select(Candidate).where(Candidate.jd_id == jd_id).options(joinedload(Candidate.user), joinedload(Candidate.interview))
+async def get_candidates_by_jd(db: AsyncSession, jd_id: int, **filters):
+    return await get_candidates(db, jd_id=jd_id, **filters)
+
+def candidate_rows_query():
+    """Select the CandidateOut columns, joined to the user and interview."""
+    return (
+        select(
+            Candidate.id,
+            Candidate.jd_id,
+            Candidate.applied_at,
+            User.id.label("user_id"),
+            User.email.label("email"),
+            User.full_name,
+            type_coerce(User.role, String).label("role"),
+            func.coalesce(type_coerce(Interview.status, String), InterviewStatus.pending.value).label("interview_status"),
+        )
+        .join(User, User.id == Candidate.user_id)
+        .outerjoin(Interview, Interview.candidate_id == Candidate.id)
     )
-    return result.scalars().all()
+
+async def get_candidate_rows(
+    db: AsyncSession,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    jd_id: Optional[int] = None,
+    status: Optional[InterviewStatus] = None,
+    applied_from: Optional[datetime.datetime] = None,
+    applied_to: Optional[datetime.datetime] = None,
+):
+    """Same listing as ``get_candidates``, as plain rows of the CandidateOut columns.
+
+    No ORM entities are loaded (so no password hashes, identity map or
+    relationship objects) and the interview status is resolved in SQL.
+    """
+    q = filter_candidates(
+        candidate_rows_query(), jd_id, status, applied_from, applied_to, interview_joined=True
+    ).order_by(Candidate.id)
+    if after_id is not None:
+        q = q.where(Candidate.id > after_id)
+    if limit is not None:
+        q = q.limit(limit)
+    result = await db.execute(q)
+    return result.all()
 
 async def get_candidate_by_id(db: AsyncSession, candidate_id: int):
     result = await db.execute(
@@ -76,6 +178,196 @@ async def get_candidate_by_id(db: AsyncSession, candidate_id: int):
     )
     return result.scalars().first()
 
+async def import_candidate_chunk(db: AsyncSession, rows: List[Tuple[int, CandidateImportRow]], password_hash: str):
+    """Insert one chunk of validated import rows in a single transaction.
+
+    Uses a fixed number of statements per chunk whatever its size: unknown
+    users are created with one multi-row upsert, candidates with one
+    multi-row insert, and their pending interviews with one INSERT ... SELECT
+    (bypassing the per-row ``after_insert`` listener); the stats triggers
+    count each statement once. Emails of existing non-candidate users are
+    rejected, not enrolled. Rows that cannot be imported are returned as
+    ``(line, email, message)`` errors; a database failure rolls back the chunk
+    and reports every row in it.
+    """
+    errors = []
+    jd_ids = {row.jd_id for _, row in rows}
+    known_jds = set((await db.execute(select(JobDescription.id).where(JobDescription.id.in_(jd_ids)))).scalars())
+
+    accepted = {}
+    for line, row in rows:
+        key = (row.email, row.jd_id)
+        if row.jd_id not in known_jds:
+            errors.append((line, row.email, f"Job description {row.jd_id} not found"))
+        elif key in accepted:
+            errors.append((line, row.email, f"Duplicate of line {accepted[key][0]}"))
+        else:
+            accepted[key] = (line, row)
+    if not accepted:
+        return {"imported": 0, "users_created": 0, "errors": errors}
+
+    try:
+        new_users = {}
+        for line, row in accepted.values():
+            new_users.setdefault(row.email, {
+                "user_email": row.email,
+                "full_name": row.full_name,
+                "password": password_hash,
+                "role": "candidate",
+            })
+        created = await db.execute(
+            pg_insert(User.__table__)
+            .values(list(new_users.values()))
+            .on_conflict_do_nothing(index_elements=[User.__table__.c.user_email])
+            .returning(User.__table__.c.user_id)
+        )
+        users_created = len(created.all())
+        users = (await db.execute(
+            select(User.email, User.id, type_coerce(User.role, String)).where(User.email.in_(new_users))
+        )).all()
+        user_ids = {email: user_id for email, user_id, _ in users}
+        # Existing staff accounts must never be enrolled as candidates
+        staff = {email: role for email, _, role in users if role != "candidate"}
+
+        already_applied = set((await db.execute(
+            select(Candidate.user_id, Candidate.jd_id)
+            .where(tuple_(Candidate.user_id, Candidate.jd_id).in_(
+                [(user_ids[email], jd_id) for email, jd_id in accepted]
+            ))
+        )).all())
+
+        now = datetime.datetime.utcnow()
+        values = []
+        for (email, jd_id), (line, row) in accepted.items():
+            if email in staff:
+                errors.append((line, email, f"Email belongs to an existing {staff[email]} account"))
+                continue
+            if (user_ids[email], jd_id) in already_applied:
+                errors.append((line, email, f"Already applied to job description {jd_id}"))
+                continue
+            applied_at = row.applied_at or now
+            if applied_at.tzinfo is not None:
+                # candidates.applied_at is a naive UTC timestamp
+                applied_at = applied_at.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            values.append({"user_id": user_ids[email], "jd_id": jd_id, "applied_at": applied_at})
+
+        imported = 0
+        if values:
+            inserted = await db.execute(
+                Candidate.__table__.insert().values(values).returning(Candidate.__table__.c.id)
+            )
+            candidate_ids = list(inserted.scalars())
+            imported = len(candidate_ids)
+            await db.execute(
+                Interview.__table__.insert().from_select(
+                    ["candidate_id", "jd_id", "status"],
+                    select(Candidate.id, Candidate.jd_id, literal(InterviewStatus.pending.value))
+                    .where(Candidate.id.in_(candidate_ids)),
+                )
+            )
+        await db.commit()
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Candidate import chunk failed: {e}")
+        message = "Database error while importing this chunk"
+        return {
+            "imported": 0,
+            "users_created": 0,
+            "errors": errors + [(line, row.email, message) for line, row in accepted.values()],
+        }
+    return {"imported": imported, "users_created": users_created, "errors": errors}
+
+# --- Full-text search ---
+def prefix_tsquery(text_query: str, max_terms: int = 8) -> Optional[str]:
+    """Turn free text into a to_tsquery string matching every word as a prefix.
+
+    Only word characters are kept, so user input can never produce invalid
+    tsquery syntax. Returns None when nothing searchable is left.
+    """
+    words = re.findall(r"\w+", text_query.lower())[:max_terms]
+    return " & ".join(f"{word}:*" for word in words) or None
+
+# Ranking is the expensive part of a search, so each search first takes a
+# window of at most ``window`` matching ids, lowest first, and ranks only those.
+# The window is deterministic, so the pages of one search stay consistent.
+# ``matched`` (rows in the window) equals ``window`` when more rows matched; the
+# ranking is then approximate: best within the window, not overall.
+def _search_query(config: str, terms: str):
+    return func.to_tsquery(literal_column(f"'{config}'::regconfig"), terms)
+
+def _after_rank(q, ranked, id_column, after: Optional[Tuple[float, int]]):
+    """Keyset condition for ORDER BY rank DESC, id."""
+    if after is None:
+        return q
+    rank, last_id = after
+    return q.where(or_(ranked.c.rank < rank, and_(ranked.c.rank == rank, id_column > last_id)))
+
+async def search_jds(db: AsyncSession, terms: str, limit: int, window: int, after: Optional[Tuple[float, int]] = None):
+    """JDs matching ``terms`` (a ``prefix_tsquery``) by title and skills, best first."""
+    query = _search_query(JD_SEARCH_CONFIG, terms)
+    window_query = (
+        select(JobDescription.id.label("key"))
+        .where(JD_SEARCH_VECTOR.op("@@")(query))
+        .order_by(JobDescription.id)
+        .limit(window)
+    )
+    matches = window_query.subquery("matches")
+    ranked = (
+        select(
+            matches.c.key,
+            func.ts_rank(JD_SEARCH_VECTOR, query).label("rank"),
+            func.count().over().label("matched"),
+        )
+        .select_from(matches)
+        .join(JobDescription, JobDescription.id == matches.c.key)
+        .subquery("ranked")
+    )
+    q = (
+        select(*JobDescription.__table__.c, ranked.c.rank, ranked.c.matched)
+        .join(ranked, ranked.c.key == JobDescription.id)
+    )
+    q = _after_rank(q, ranked, JobDescription.id, after).order_by(ranked.c.rank.desc(), JobDescription.id).limit(limit)
+    result = await db.execute(q)
+    return result.all()
+
+async def search_candidates(
+    db: AsyncSession,
+    terms: str,
+    limit: int,
+    window: int,
+    after: Optional[Tuple[float, int]] = None,
+    jd_id: Optional[int] = None,
+):
+    """Candidates whose user name or email matches ``terms``, as CandidateOut rows plus rank.
+
+    The window only holds candidate users of ``jd_id`` (when given), so staff
+    accounts and other JDs' candidates never crowd out the ones asked for.
+    """
+    query = _search_query(USER_SEARCH_CONFIG, terms)
+    window_query = filter_candidates(
+        select(Candidate.id.label("key"))
+        .join(User, User.id == Candidate.user_id)
+        .where(USER_SEARCH_VECTOR.op("@@")(query))
+        .where(User.role == "candidate"),
+        jd_id,
+    ).order_by(Candidate.id).limit(window)
+    matches = window_query.subquery("matches")
+    ranked = (
+        select(
+            matches.c.key,
+            func.ts_rank(USER_SEARCH_VECTOR, query).label("rank"),
+            func.count().over().label("matched"),
+        )
+        .select_from(matches)
+        .join(Candidate, Candidate.id == matches.c.key)
+        .join(User, User.id == Candidate.user_id)
+        .subquery("ranked")
+    )
+    q = candidate_rows_query().add_columns(ranked.c.rank, ranked.c.matched).join(ranked, ranked.c.key == Candidate.id)
+    q = _after_rank(q, ranked, Candidate.id, after).order_by(ranked.c.rank.desc(), Candidate.id).limit(limit)
+    result = await db.execute(q)
+    return result.all()
+
 # --- Interview CRUD ---
 async def schedule_interview(db: AsyncSession, candidate_id: int, start_time, end_time, interview_qa=None):
     # Get existing interview
@@ -98,4 +390,522 @@ async def schedule_interview(db: AsyncSession, candidate_id: int, start_time, en
         db.add(interview)
     await db.commit()
     await db.refresh(interview)
-    return interview
\ No newline at end of file
+    return interview
+
+RESCHEDULABLE_STATUSES = (InterviewStatus.pending, InterviewStatus.scheduled)
+
+async def schedule_interviews_bulk(db: AsyncSession, entries):
+    """Schedule many candidates in one transaction with set-based statements.
+
+    Takes the same number of round trips for any batch size: one locking
+    SELECT of the candidates, one locking SELECT of their interviews, one
+    UPDATE ... FROM (VALUES ...) for existing interviews and one multi-row
+    INSERT for candidates without one. Interviews that are already ongoing or
+    completed are left alone. Returns one result dict per entry, in request
+    order.
+    """
+    results = {}
+    wanted = {}
+    for entry in entries:
+        if entry.candidate_id in wanted or entry.candidate_id in results:
+            results[entry.candidate_id] = {"status": "invalid", "message": "Duplicate candidate_id in request"}
+            wanted.pop(entry.candidate_id, None)
+        elif entry.end_time <= entry.start_time:
+            results[entry.candidate_id] = {"status": "invalid", "message": "end_time must be after start_time"}
+        else:
+            wanted[entry.candidate_id] = entry
+
+    if wanted:
+        # Locking the candidates (in id order) serializes concurrent requests
+        # for the same candidate: interviews.candidate_id is not unique, and
+        # locking interviews alone would let two of them insert one each.
+        # NO KEY UPDATE leaves foreign key checks against the candidate alone.
+        jd_by_candidate = dict((await db.execute(
+            select(Candidate.id, Candidate.jd_id)
+            .where(Candidate.id.in_(wanted))
+            .order_by(Candidate.id)
+            .with_for_update(key_share=True)
+        )).all())
+        interviews = {
+            row.candidate_id: row for row in (await db.execute(
+                select(Interview.id, Interview.candidate_id, Interview.status)
+                .where(Interview.candidate_id.in_(jd_by_candidate))
+                .with_for_update()
+            )).all()
+        }
+
+        to_update, to_insert = [], []
+        for candidate_id, entry in wanted.items():
+            if candidate_id not in jd_by_candidate:
+                results[candidate_id] = {"status": "not_found", "message": f"Candidate with id {candidate_id} not found"}
+                continue
+            jd_id = jd_by_candidate[candidate_id]
+            interview = interviews.get(candidate_id)
+            if interview is None:
+                to_insert.append({
+                    "candidate_id": candidate_id,
+                    "jd_id": jd_id,
+                    "status": InterviewStatus.scheduled.value,
+                    "start_time": entry.start_time,
+                    "end_time": entry.end_time,
+                })
+            elif interview.status not in RESCHEDULABLE_STATUSES:
+                results[candidate_id] = {
+                    "status": "skipped",
+                    "interview_id": interview.id,
+                    "message": f"Interview is already {interview.status.value}",
+                }
+            else:
+                to_update.append((interview.id, entry.start_time, entry.end_time))
+                results[candidate_id] = {"status": "scheduled", "interview_id": interview.id}
+
+        if to_update:
+            schedule = values(
+                column("id", Integer),
+                column("start_time", DateTime(timezone=True)),
+                column("end_time", DateTime(timezone=True)),
+                name="schedule",
+            ).data(to_update)
+            await db.execute(
+                update(Interview.__table__)
+                .where(Interview.__table__.c.id == schedule.c.id)
+                .values(
+                    status=InterviewStatus.scheduled.value,
+                    start_time=schedule.c.start_time,
+                    end_time=schedule.c.end_time,
+                    updated_at=func.now(),
+                )
+            )
+        if to_insert:
+            inserted = await db.execute(
+                Interview.__table__.insert().values(to_insert)
+                .returning(Interview.__table__.c.id, Interview.__table__.c.candidate_id)
+            )
+            for interview_id, candidate_id in inserted.all():
+                results[candidate_id] = {"status": "scheduled", "interview_id": interview_id}
+    await db.commit()
+
+    ordered, seen = [], set()
+    for entry in entries:
+        if entry.candidate_id not in seen:
+            seen.add(entry.candidate_id)
+            ordered.append({"candidate_id": entry.candidate_id, **results[entry.candidate_id]})
+    return ordered
+
+async def get_candidate_interview_access(db: AsyncSession, candidate_id: int):
+    """(user_id, status) of a candidate's latest interview; None if the candidate does not exist."""
+    result = await db.execute(
+        select(Candidate.user_id, Interview.status)
+        .outerjoin(Interview, Interview.candidate_id == Candidate.id)
+        .where(Candidate.id == candidate_id)
+        .order_by(Interview.id.desc().nulls_last())
+        .limit(1)
+    )
+    return result.first()
+
+async def start_interview(db: AsyncSession, candidate_id: int):
+    """Mark a candidate's interview as ongoing when their session starts.
+
+    Completed interviews are never reopened, so a new session cannot
+    overwrite their transcript.
+    """
+    result = await db.execute(
+        select(Interview)
+        .where(Interview.candidate_id == candidate_id)
+        .where(Interview.status != InterviewStatus.completed)
+        .order_by(Interview.id.desc())
+    )
+    interview = result.scalars().first()
+    if not interview:
+        return None
+    interview.status = InterviewStatus.ongoing
+    if interview.start_time is None:
+        interview.start_time = datetime.datetime.now(datetime.timezone.utc)
+    await db.commit()
+    await db.refresh(interview)
+    return interview
+
+async def complete_interview_from_turns(db: AsyncSession, interview_id: int, turns: Optional[List[Tuple[str, str]]] = None):
+    """Derive interview_qa from the persisted turns and mark the interview completed.
+
+    ``turns`` overrides the persisted turns, for sessions whose last turns
+    could not be written in time.
+    """
+    if turns is None:
+        result = await db.execute(
+            select(InterviewTurn.role, InterviewTurn.content)
+            .where(InterviewTurn.interview_id == interview_id)
+            .order_by(InterviewTurn.spoken_at, InterviewTurn.seq)
+        )
+        turns = result.all()
+    interview = await db.get(Interview, interview_id)
+    if not interview:
+        return None
+    interview.interview_qa = format_transcript(turns)
+    interview.status = InterviewStatus.completed
+    interview.end_time = datetime.datetime.now(datetime.timezone.utc)
+    # Scored later by the assessment worker, never in the live-interview process
+    await db.execute(
+        pg_insert(AssessmentJob.__table__)
+        .values(interview_id=interview_id)
+        .on_conflict_do_nothing(index_elements=[AssessmentJob.__table__.c.interview_id])
+    )
+    await db.commit()
+    await db.refresh(interview)
+    return interview
+
+# --- Assessment jobs ---
+async def enqueue_completed_interviews(db: AsyncSession) -> int:
+    """Queue every completed interview that has no assessment job yet (one INSERT ... SELECT)."""
+    jobs = AssessmentJob.__table__
+    result = await db.execute(
+        pg_insert(jobs)
+        .from_select(
+            ["interview_id"],
+            select(Interview.id)
+            .where(Interview.status == InterviewStatus.completed)
+            .where(~select(jobs.c.id).where(jobs.c.interview_id == Interview.id).exists()),
+        )
+        .on_conflict_do_nothing(index_elements=[jobs.c.interview_id])
+        .returning(jobs.c.id)
+    )
+    queued = len(result.all())
+    await db.commit()
+    return queued
+
+async def claim_assessment_jobs(db: AsyncSession, limit: int, lease_seconds: float):
+    """Mark up to ``limit`` due jobs as running and return them with what scoring needs.
+
+    Claiming skips rows locked by other workers, and also takes back running
+    jobs whose lease expired. Returns rows of (job_id, interview_id, attempts,
+    candidate_id, jd_id, interview_qa, required_skills, preferred_skills), the
+    skills as lists from the skill index.
+    """
+    jobs = AssessmentJob.__table__
+    now = func.now()
+    due = (
+        select(jobs.c.id)
+        .where(or_(
+            (jobs.c.status == AssessmentJobStatus.queued.value) & (jobs.c.run_after <= now),
+            (jobs.c.status == AssessmentJobStatus.running.value)
+            & (jobs.c.locked_at < now - datetime.timedelta(seconds=lease_seconds)),
+        ))
+        .order_by(jobs.c.run_after, jobs.c.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    claimed = (await db.execute(
+        update(jobs)
+        .where(jobs.c.id.in_(due.scalar_subquery()))
+        .values(status=AssessmentJobStatus.running.value, locked_at=now, attempts=jobs.c.attempts + 1, updated_at=now)
+        .returning(jobs.c.id, jobs.c.interview_id, jobs.c.attempts)
+    )).all()
+    if not claimed:
+        await db.commit()
+        return []
+    details = {
+        row.interview_id: row for row in (await db.execute(
+            select(
+                Interview.id.label("interview_id"),
+                Interview.candidate_id,
+                Interview.jd_id,
+                Interview.interview_qa,
+                JobDescription.required_skills,
+                JobDescription.preferred_skills,
+            )
+            .outerjoin(JobDescription, JobDescription.id == Interview.jd_id)
+            .where(Interview.id.in_([job.interview_id for job in claimed]))
+        )).all()
+    }
+    skill_lists = await get_jd_skill_lists(db, {detail.jd_id for detail in details.values() if detail.jd_id})
+    await db.commit()
+    rows = []
+    for job in claimed:
+        detail = details.get(job.interview_id)
+        jd_skills = {}
+        if detail:
+            # JDs not indexed yet fall back to splitting the text
+            jd_skills = skill_lists.get(detail.jd_id) or {
+                REQUIRED: split_skills(detail.required_skills),
+                PREFERRED: split_skills(detail.preferred_skills),
+            }
+        rows.append({
+            "job_id": job.id,
+            "interview_id": job.interview_id,
+            "attempts": job.attempts,
+            "candidate_id": detail.candidate_id if detail else None,
+            "jd_id": detail.jd_id if detail else None,
+            "interview_qa": detail.interview_qa if detail else None,
+            "required_skills": jd_skills.get(REQUIRED, []),
+            "preferred_skills": jd_skills.get(PREFERRED, []),
+        })
+    return rows
+
+async def save_assessment_results(
+    db: AsyncSession,
+    scored: List[dict],
+    retry: List[Tuple[int, datetime.datetime, str]],
+    failed: List[Tuple[int, str]],
+    skipped: List[int],
+):
+    """Write back one batch of assessments in a single transaction.
+
+    ``scored`` rows are upserted into interview_assessments with one multi-row
+    statement, their candidates' skill scores replaced in candidate_skills,
+    and their jobs marked done; ``retry`` jobs are requeued with a new
+    ``run_after``; ``failed`` and ``skipped`` jobs are closed. Each group is a
+    fixed number of statements, whatever the batch size.
+    """
+    jobs = AssessmentJob.__table__
+    now = func.now()
+    if scored:
+        assessments = InterviewAssessment.__table__
+        stmt = pg_insert(assessments).values([
+            {name: row[name] for name in ("interview_id", "jd_id", "overall_score", "skill_scores", "summary", "model")}
+            for row in scored
+        ])
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[assessments.c.interview_id],
+            set_={
+                **{name: stmt.excluded[name] for name in ("jd_id", "overall_score", "skill_scores", "summary", "model")},
+                "scored_at": now,
+            },
+        ))
+        candidate_scores = {row["candidate_id"]: row["skill_scores"] for row in scored if row.get("candidate_id")}
+        if candidate_scores:
+            await db.run_sync(lambda session: sync_candidate_skills(session.connection(), candidate_scores))
+    for job_ids, job_status in (
+        ([row["job_id"] for row in scored], AssessmentJobStatus.done),
+        (skipped, AssessmentJobStatus.skipped),
+    ):
+        if job_ids:
+            await db.execute(
+                update(jobs).where(jobs.c.id.in_(job_ids))
+                .values(status=job_status.value, locked_at=None, last_error=None, updated_at=now)
+            )
+    if retry:
+        requeue = values(
+            column("id", Integer), column("run_after", DateTime(timezone=True)), column("last_error", String),
+            name="requeue",
+        ).data(retry)
+        await db.execute(
+            update(jobs).where(jobs.c.id == requeue.c.id)
+            .values(
+                status=AssessmentJobStatus.queued.value,
+                run_after=requeue.c.run_after,
+                last_error=requeue.c.last_error,
+                locked_at=None,
+                updated_at=now,
+            )
+        )
+    if failed:
+        failures = values(column("id", Integer), column("last_error", String), name="failures").data(failed)
+        await db.execute(
+            update(jobs).where(jobs.c.id == failures.c.id)
+            .values(
+                status=AssessmentJobStatus.failed.value,
+                last_error=failures.c.last_error,
+                locked_at=None,
+                updated_at=now,
+            )
+        )
+    await db.commit()
+
+async def get_candidate_assessment(db: AsyncSession, candidate_id: int):
+    """The candidate's latest interview, its assessment job and scores (if any) as one row."""
+    result = await db.execute(
+        select(
+            Interview.id.label("interview_id"),
+            Interview.jd_id,
+            type_coerce(AssessmentJob.status, String).label("status"),
+            AssessmentJob.attempts,
+            AssessmentJob.last_error,
+            InterviewAssessment.overall_score,
+            InterviewAssessment.skill_scores,
+            InterviewAssessment.summary,
+            InterviewAssessment.model,
+            InterviewAssessment.scored_at,
+        )
+        .outerjoin(AssessmentJob, AssessmentJob.interview_id == Interview.id)
+        .outerjoin(InterviewAssessment, InterviewAssessment.interview_id == Interview.id)
+        .where(Interview.candidate_id == candidate_id)
+        .order_by(Interview.end_time.desc().nulls_last(), Interview.id.desc())
+        .limit(1)
+    )
+    return result.first()
+
+# --- Skill index ---
+async def get_jd_skill_lists(db: AsyncSession, jd_ids) -> Dict[int, Dict[str, List[str]]]:
+    """Pre-parsed skills per JD: {jd_id: {"required": [...], "preferred": [...]}} in JD order."""
+    if not jd_ids:
+        return {}
+    result = await db.execute(
+        select(JDSkill.jd_id, JDSkill.kind, Skill.display_name)
+        .join(Skill, Skill.id == JDSkill.skill_id)
+        .where(JDSkill.jd_id.in_(list(jd_ids)))
+        .order_by(JDSkill.jd_id, JDSkill.kind, JDSkill.position)
+    )
+    lists = {}
+    for jd_id, kind, name in result.all():
+        lists.setdefault(jd_id, {REQUIRED: [], PREFERRED: []})[kind].append(name)
+    return lists
+
+def _skill_weight():
+    return case((JDSkill.kind == REQUIRED, KIND_WEIGHTS[REQUIRED]), else_=KIND_WEIGHTS[PREFERRED])
+
+async def match_jds(db: AsyncSession, skill_names: List[str], limit: int, after: Optional[Tuple[float, int]] = None):
+    """JDs that list any of ``skill_names`` (normalized), best match first.
+
+    Score is the sum of matched skill weights (required 2, preferred 1),
+    computed from the (skill_id, jd_id) index without reading JD text.
+    """
+    score = func.sum(_skill_weight())
+    matched = (
+        select(
+            JDSkill.jd_id,
+            score.label("score"),
+            func.count().filter(JDSkill.kind == REQUIRED).label("required_matched"),
+            func.array_agg(aggregate_order_by(Skill.display_name, JDSkill.position)).label("matched_skills"),
+        )
+        .join(Skill, Skill.id == JDSkill.skill_id)
+        .where(Skill.name.in_(skill_names))
+        .group_by(JDSkill.jd_id)
+    )
+    if after is not None:
+        matched = matched.having(or_(score < after[0], and_(score == after[0], JDSkill.jd_id > after[1])))
+    matched = matched.order_by(score.desc(), JDSkill.jd_id).limit(limit).subquery("matched")
+    # Only evaluated for the page of matched JDs, through the jd_skills primary key
+    required_total = (
+        select(func.count())
+        .where(JDSkill.jd_id == JobDescription.id, JDSkill.kind == REQUIRED)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(
+            *JobDescription.__table__.c,
+            matched.c.score,
+            matched.c.required_matched,
+            required_total.label("required_total"),
+            matched.c.matched_skills,
+        )
+        .join(matched, matched.c.jd_id == JobDescription.id)
+        .order_by(matched.c.score.desc(), JobDescription.id)
+    )
+    return result.all()
+
+async def match_candidates(
+    db: AsyncSession,
+    skill_names: List[str],
+    limit: int,
+    after: Optional[Tuple[float, int]] = None,
+    jd_id: Optional[int] = None,
+    min_score: int = 0,
+):
+    """Assessed candidates scored on any of ``skill_names``, by summed assessment score."""
+    score = func.sum(CandidateSkill.score)
+    matched = (
+        select(
+            CandidateSkill.candidate_id,
+            score.label("score"),
+            func.array_agg(aggregate_order_by(Skill.display_name, CandidateSkill.score.desc())).label("matched_skills"),
+        )
+        .join(Skill, Skill.id == CandidateSkill.skill_id)
+        .where(Skill.name.in_(skill_names))
+        .where(CandidateSkill.score >= min_score)
+        .group_by(CandidateSkill.candidate_id)
+    )
+    if jd_id is not None:
+        matched = matched.join(Candidate, Candidate.id == CandidateSkill.candidate_id).where(Candidate.jd_id == jd_id)
+    if after is not None:
+        matched = matched.having(or_(score < after[0], and_(score == after[0], CandidateSkill.candidate_id > after[1])))
+    matched = matched.order_by(score.desc(), CandidateSkill.candidate_id).limit(limit).subquery("matched")
+    result = await db.execute(
+        candidate_rows_query()
+        .add_columns(matched.c.score, matched.c.matched_skills)
+        .join(matched, matched.c.candidate_id == Candidate.id)
+        .order_by(matched.c.score.desc(), Candidate.id)
+    )
+    return result.all()
+
+async def rebuild_skill_index(db: AsyncSession, batch_size: int = 1000) -> dict:
+    """Re-derive jd_skills from every JD and candidate_skills from every assessment, in batches."""
+    counts = {"jds": 0, "candidates": 0}
+    after_id = 0
+    while True:
+        ids = (await db.scalars(
+            select(JobDescription.id).where(JobDescription.id > after_id).order_by(JobDescription.id).limit(batch_size)
+        )).all()
+        if not ids:
+            break
+        await db.run_sync(lambda session: reindex_jd_skills(session.connection(), after_id, ids[-1]))
+        await db.commit()
+        counts["jds"] += len(ids)
+        after_id = ids[-1]
+    counts["candidates"] = await _rebuild_candidate_skills(db, batch_size)
+    return counts
+
+async def _rebuild_candidate_skills(db: AsyncSession, batch_size: int) -> int:
+    candidates = 0
+    after_id = 0
+    while True:
+        rows = (await db.execute(
+            select(InterviewAssessment.interview_id, Interview.candidate_id, InterviewAssessment.skill_scores)
+            .join(Interview, Interview.id == InterviewAssessment.interview_id)
+            .where(InterviewAssessment.interview_id > after_id)
+            .where(Interview.candidate_id.is_not(None))
+            .order_by(InterviewAssessment.interview_id)
+            .limit(batch_size)
+        )).all()
+        if not rows:
+            break
+        scores = {row.candidate_id: row.skill_scores for row in rows}
+        await db.run_sync(lambda session: sync_candidate_skills(session.connection(), scores))
+        await db.commit()
+        candidates += len(scores)
+        after_id = rows[-1].interview_id
+    return candidates
+
+async def ensure_skill_index(db: AsyncSession):
+    """Install the trigger that keeps jd_skills current; index existing data the first time."""
+    installed = await db.run_sync(lambda session: install_skill_index(session.connection()))
+    await db.commit()
+    if installed:
+        # JDs were indexed with the trigger; assessments predating the index are backfilled here
+        candidates = await _rebuild_candidate_skills(db, 1000)
+        logger.info(f"Installed the skill index trigger and indexed {candidates} assessed candidates")
+
+# --- Dashboard stats ---
+
+async def get_dashboard_stats(db: AsyncSession, jd_id: Optional[int] = None):
+    """Read the maintained counters; cost depends on the number of JDs, not candidates."""
+    q = select(InterviewStats).order_by(InterviewStats.jd_id)
+    if jd_id is not None:
+        q = q.where(InterviewStats.jd_id == jd_id)
+    rows = (await db.execute(q)).scalars().all()
+
+    by_status = {name: sum(getattr(row, name) for row in rows) for name in STATUS_COUNTERS}
+    return {
+        "total_jds": len(rows),
+        "total_candidates": sum(row.candidates for row in rows),
+        "by_status": by_status,
+        "by_jd": [
+            {
+                "jd_id": row.jd_id,
+                "candidates": row.candidates,
+                **{name: getattr(row, name) for name in STATUS_COUNTERS},
+            }
+            for row in rows
+        ],
+    }
+
+async def rebuild_interview_stats(db: AsyncSession):
+    """Recompute every counter from the source tables with COUNT ... GROUP BY."""
+    await db.run_sync(lambda session: recount_interview_stats(session.connection()))
+    await db.commit()
+
+async def ensure_interview_stats(db: AsyncSession):
+    """Install the triggers that maintain the counters; count existing data the first time."""
+    installed = await db.run_sync(lambda session: install_interview_stats(session.connection()))
+    await db.commit()
+    if installed:
+        logger.info("Installed the interview stats triggers and recounted every JD")
@@ -1,19 +1,82 @@
 # app/db/connection.py
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import os
+import time
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 
+from app import metrics
+
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set in environment")
 
+# Pool settings (one engine per process, shared by every session); defaults
+# are SQLAlchemy's own
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "0") == "1"
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))  # seconds, -1 = never
+# asyncpg prepared statements cached per connection (0 disables, e.g. behind pgbouncer)
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records checkout waits and timeouts in app.metrics."""
+
+    def _do_get(self):
+        # Same test QueuePool._do_get uses: with no idle connection and the
+        # overflow used up, the checkout has to wait for a connection back
+        blocks = (
+            self.checkedin() == 0 and self._max_overflow > -1 and self._overflow >= self._max_overflow
+        )
+        if blocks:
+            metrics.DB_POOL_WAITING.inc()
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            metrics.DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            if blocks:
+                metrics.DB_POOL_WAITING.dec()
+            metrics.DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start)
+
+
+def _connect_args() -> dict:
+    if make_url(DATABASE_URL).get_driver_name() == "asyncpg":
+        return {"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+    return {}
+
+
 # Create async engine
-engine = create_async_engine(DATABASE_URL, future=True, echo=False)
+engine = create_async_engine(
+    DATABASE_URL,
+    future=True,
+    echo=False,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    pool_recycle=DB_POOL_RECYCLE,
+    connect_args=_connect_args(),
+)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Read at scrape time so they follow the pool across engine.dispose()
+metrics.DB_POOL_SIZE.set_function(lambda: engine.pool.size())
+metrics.DB_POOL_CHECKED_OUT.set_function(lambda: engine.pool.checkedout())
+metrics.DB_POOL_CHECKED_IN.set_function(lambda: engine.pool.checkedin())
+metrics.DB_POOL_OVERFLOW.set_function(lambda: max(0, engine.pool.overflow()))
+
 # Dependency to get DB session
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
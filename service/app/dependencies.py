@@ -12,11 +12,23 @@ async def get_current_user(
     return await auth.get_current_user(token, db)
 
 
-def require_roles(*allowed_roles: str):
-    """Factory function for role-based access"""
+async def get_current_user_claims(
+    token: str = Depends(auth.oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+):
+    return await auth.get_current_user_claims(token, db)
+
+
+def require_roles(*allowed_roles: str, trust_claims: bool = False):
+    """Factory function for role-based access
+
+    Read-only endpoints can pass trust_claims=True to authorize from the
+    token's role claim when AUTH_TRUST_TOKEN_CLAIMS is enabled.
+    """
+    user_dependency = get_current_user_claims if trust_claims else get_current_user
 
     async def role_checker(
-        current_user: schemas.UserOut = Depends(get_current_user),
+        current_user: schemas.UserOut = Depends(user_dependency),
     ):
         if current_user.role not in allowed_roles:
             raise HTTPException(
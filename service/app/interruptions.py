@@ -0,0 +1,96 @@
+# app/interruptions.py
+"""Barge-in handling for the interviewer's LLM stream.
+
+When the candidate talks over the interviewer, pipecat broadcasts a
+``StartInterruptionFrame``. That cancels the LLM service's in-flight task,
+Cartesia's ``_handle_interruption`` cancels its pending synthesis context, and
+the output transport discards audio it has not played yet. What pipecat leaves
+open is the Anthropic response stream. Cancelling the task only stops reading
+it. The HTTP response stays open until it is garbage collected, and the
+provider keeps generating (and billing) the rest of the reply.
+``InterruptibleAnthropicLLMService`` closes the stream as soon as the task is
+cancelled.
+"""
+import asyncio
+import contextvars
+from typing import Any, List, Optional
+
+from loguru import logger
+from pipecat.services.anthropic.llm import AnthropicLLMService
+
+from app import metrics
+
+# Streams opened by the LLM turn running in the current task
+_turn_streams: contextvars.ContextVar[Optional[List[Any]]] = contextvars.ContextVar(
+    "llm_turn_streams", default=None
+)
+
+
+class _StreamRecordingClient:
+    """Proxy for the Anthropic client that notes every ``create`` result.
+
+    Streams are only recorded inside an LLM turn (see ``_turn_streams``), so
+    other callers sharing the client, like the context summarizer, are left alone.
+    """
+
+    _PATH = ("messages", "beta", "prompt_caching")
+
+    def __init__(self, target: Any):
+        self._target = target
+
+    def __getattr__(self, name: str):
+        value = getattr(self._target, name)
+        if name in self._PATH:
+            return _StreamRecordingClient(value)
+        if name == "create":
+            return self._recording_create(value)
+        return value
+
+    @staticmethod
+    def _recording_create(create):
+        async def recording_create(*args, **kwargs):
+            stream = await create(*args, **kwargs)
+            streams = _turn_streams.get()
+            if streams is not None:
+                streams.append(stream)
+            return stream
+
+        return recording_create
+
+
+class InterruptibleAnthropicLLMService(AnthropicLLMService):
+    """Anthropic LLM service that closes its response stream on interruption."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.streams_aborted = 0
+
+    @property
+    def _client(self):
+        return self._recording_client
+
+    @_client.setter
+    def _client(self, client):
+        # Also wraps clients swapped in after construction (e.g. load-test stubs)
+        self._recording_client = _StreamRecordingClient(client)
+
+    async def _process_context(self, context):
+        streams: List[Any] = []
+        token = _turn_streams.set(streams)
+        try:
+            await super()._process_context(context)
+        except asyncio.CancelledError:
+            for stream in streams:
+                await self._close_stream(stream)
+            raise
+        finally:
+            _turn_streams.reset(token)
+
+    async def _close_stream(self, stream):
+        try:
+            await stream.close()
+        except Exception as e:
+            logger.debug(f"{self}: error closing interrupted stream: {e}")
+            return
+        self.streams_aborted += 1
+        metrics.INTERVIEW_LLM_STREAMS_ABORTED.inc()
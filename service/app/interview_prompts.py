@@ -8,7 +8,27 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-INTERVIEWER_SYSTEM_PROMPT = """# AI Interviewer System Prompt
+# Lines the interviewer says word for word. The TTS audio cache
+# (app.tts_cache) pre-synthesizes their sentences, so keep them in sync with the
+# prompts by referencing these constants rather than repeating the text.
+OPENING_LINE = (
+    "Hi there, great to meet you! I'm your interviewer today. How are you doing? "
+    "I hope you're comfortable. Before we dive in, could you tell me a bit about "
+    "yourself and what drew you to apply for this role with us?"
+)
+CLOSING_LINE = (
+    "We're coming to the end of our time together. Do you have any questions for me "
+    "about the role, the team, or the company? Is there anything else you'd like me "
+    "to know about your background that we haven't covered?"
+)
+REDIRECT_LINE = (
+    "Let's focus on assessing your skills for this position. "
+    "Tell me about your experience with [relevant skill]."
+)
+FIXED_LINES = [OPENING_LINE, CLOSING_LINE, REDIRECT_LINE]
+
+
+INTERVIEWER_SYSTEM_PROMPT = f"""# AI Interviewer System Prompt
 
 ## Role & Identity
 You are a professional senior technical interviewer conducting a real-time interview. You are representing the hiring team and evaluating this candidate for a specific position. Behave exactly like a human interviewer would - with personality, natural conversation flow, and genuine interest in the candidate's responses.
@@ -24,7 +44,7 @@ You are a professional senior technical interviewer conducting a real-time inter
 ## Interview Structure & Flow
 
 ### Opening (2-3 minutes)
-Start with: "Hi there, great to meet you! I'm your interviewer today. How are you doing? I hope you're comfortable. Before we dive in, could you tell me a bit about yourself and what drew you to apply for this role with us?"
+Start with: "{OPENING_LINE}"
 
 ### Technical Questions (Based on Job Description)
 - Start with easier questions to build confidence
@@ -45,7 +65,7 @@ Start with: "Hi there, great to meet you! I'm your interviewer today. How are yo
   - "What would you do differently now?"
 
 ### Closing
-End with: "We're coming to the end of our time together. Do you have any questions for me about the role, the team, or the company? Is there anything else you'd like me to know about your background that we haven't covered?"
+End with: "{CLOSING_LINE}"
 
 ## Natural Human Behaviors to Include
 - Use conversational fillers: "Mmm-hmm, I see", "That makes sense", "Interesting..."
@@ -123,4 +143,94 @@ def get_interview_prompt(role="software_engineer"):
     
     full_prompt = f"{INTERVIEWER_SYSTEM_PROMPT}\n\n{role_specific}"
     logger.info(f"Prompt length: {len(full_prompt)} characters")
-    return full_prompt
\ No newline at end of file
+    return full_prompt
+
+
+INTERVIEWER_RULES = f"""
+# INTERVIEWER RULES - STRICTLY FOLLOW THESE:
+
+1. You are EXCLUSIVELY an interviewer conducting a technical assessment
+2. Your ONLY goal is to evaluate the candidate's skills and fit for the position
+3. NEVER answer general knowledge questions
+4. NEVER provide assistance or help with coding problems
+5. NEVER engage in casual conversation unrelated to the interview
+6. If the candidate tries to use you as a general assistant, politely redirect:
+   "{REDIRECT_LINE}"
+7. Follow a structured interview approach (introduction, skills assessment, behavioral questions, closing)
+8. Ask probing follow-up questions to thoroughly evaluate their answers
+9. End the interview with a professional closing, thanking them for their time
+
+Remember: You are conducting a professional assessment, not providing a service.
+"""
+
+
+def parse_skills(skills_text):
+    """Parse skills from comma-separated text"""
+    if not skills_text:
+        return []
+    skills = skills_text.split(",")
+    return [skill.strip() for skill in skills if skill.strip()]
+
+
+def build_job_prompt(job_details, required_skills, preferred_skills):
+    """Build the structured interview section for a specific job description"""
+    return f"""
+ Interviewing for: {job_details.get('title')}
+
+ Position Details
+- Title: {job_details.get('title')}
+- Location: {job_details.get('location')}
+- Required Experience: {job_details.get('min_experience')} years
+
+ Interview Structure
+1. Introduction (2 minutes)
+   - Introduce yourself as the interviewer for {job_details.get('title')} position
+   - Briefly explain the role and team
+
+2. Technical Skills Assessment (10-15 minutes)
+   - Required skills to evaluate:
+     {chr(10).join([f'   - {skill}: Ask specific technical questions about their experience' for skill in required_skills])}
+   
+   - If they mention having these preferred skills, assess them:
+     {chr(10).join([f'   - {skill}: Ask for examples of their work' for skill in preferred_skills])}
+
+3. Job Responsibility Assessment (5-10 minutes)
+   - Ask how they would handle these responsibilities:
+     "{job_details.get('responsibilities')}"
+
+4. Behavioral Questions (5 minutes)
+   - Ask about teamwork, communication, and problem-solving
+   - Evaluate their fit for the company culture
+
+5. Closing (2-3 minutes)
+   - Ask if they have questions about the role
+   - Thank them for their time
+   - Explain next steps in the interview process
+
+Remember to ask follow-up questions based on their answers to assess depth of knowledge.
+"""
+
+
+def compile_interview_prompt(role="software_engineer", job_details=None):
+    """Assemble the full system prompt for a role and (optional) job description"""
+    base_prompt = get_interview_prompt(role)
+    if not job_details:
+        return f"{base_prompt}\n\n{INTERVIEWER_RULES}"
+
+    # Skill lists come pre-parsed from the skill index; parse the text only as a fallback
+    required_skills = job_details.get("required_skill_list")
+    if required_skills is None:
+        required_skills = parse_skills(job_details.get("required_skills", ""))
+    preferred_skills = job_details.get("preferred_skill_list")
+    if preferred_skills is None:
+        preferred_skills = parse_skills(job_details.get("preferred_skills", ""))
+    job_prompt = build_job_prompt(job_details, required_skills, preferred_skills)
+    return f"{base_prompt}\n\n{job_prompt}\n\n{INTERVIEWER_RULES}"
+
+
+def build_session_prompt(interview_date, candidate_name=None):
+    """Short per-session details, kept out of the cacheable prompt prefix"""
+    lines = ["# THIS INTERVIEW SESSION", f"- Date: {interview_date}"]
+    if candidate_name:
+        lines.append(f"- Candidate name: {candidate_name}")
+    return "\n".join(lines)
@@ -0,0 +1,173 @@
+# app/metrics.py
+"""Prometheus metrics for the service, scraped from ``GET /metrics``.
+
+Metrics are module-level objects on the default registry; modules that record
+them import them from here.
+
+Bot worker processes (``BOT_WORKERS``) record into files under a shared
+``PROMETHEUS_MULTIPROC_DIR`` that ``render_latest`` merges with the API
+process's own registry: counters and histograms are summed across processes,
+gauges get a ``pid`` label. Callback gauges (the DB pool ones) are read live,
+so they only cover the API process.
+"""
+import os
+import tempfile
+from typing import Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.multiprocess import MultiProcessCollector, mark_process_dead
+
+# --- Database connection pool ---
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured number of persistent pool connections", multiprocess_mode="liveall"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out of the pool", multiprocess_mode="liveall"
+)
+DB_POOL_CHECKED_IN = Gauge(
+    "db_pool_checked_in", "Idle connections currently in the pool", multiprocess_mode="liveall"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Overflow connections currently open beyond the pool size", multiprocess_mode="liveall"
+)
+DB_POOL_WAITING = Gauge(
+    "db_pool_waiting",
+    "Checkouts currently blocked waiting for a connection to be returned",
+    multiprocess_mode="liveall",
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting to check out a connection",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that gave up after the pool timeout"
+)
+
+# --- Interview pipeline latency ---
+LATENCY_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 3, 5, 10)
+INTERVIEW_STAGE_TTFB_SECONDS = Histogram(
+    "interview_stage_ttfb_seconds",
+    "Time to first result per pipeline stage (stt transcript, llm token, tts audio)",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+INTERVIEW_TURN_LATENCY_SECONDS = Histogram(
+    "interview_turn_latency_seconds",
+    "Candidate stopped speaking (VAD) to interviewer audio starting",
+    buckets=LATENCY_BUCKETS,
+)
+INTERVIEW_CONTEXT_MESSAGES = Histogram(
+    "interview_context_messages",
+    "Messages in the LLM context sent on each interviewer turn",
+    buckets=(2, 4, 8, 12, 16, 24, 32, 48, 64, 128),
+)
+INTERVIEW_CONTEXT_SUMMARIES = Counter(
+    "interview_context_summaries_total", "Background summaries of older interview turns", ["result"]
+)
+INTERVIEW_CONTEXT_SUMMARY_SECONDS = Histogram(
+    "interview_context_summary_seconds", "Duration of a background context summary call", buckets=LATENCY_BUCKETS
+)
+INTERVIEW_CONTEXT_DROPPED_MESSAGES = Counter(
+    "interview_context_dropped_messages_total",
+    "Messages dropped from the LLM context before their summary was ready",
+)
+INTERVIEW_INTERRUPTIONS = Counter(
+    "interview_interruptions_total", "Times a candidate started speaking over the interviewer"
+)
+INTERVIEW_LLM_STREAMS_ABORTED = Counter(
+    "interview_llm_streams_aborted_total", "LLM response streams closed early because of a barge-in"
+)
+INTERVIEW_LLM_TOKENS = Counter(
+    "interview_llm_tokens_total",
+    "Estimated interviewer tokens generated by the LLM vs. delivered (actually spoken)",
+    ["stage"],
+)
+INTERVIEW_TTS_AUDIO_SECONDS = Counter(
+    "interview_tts_audio_seconds_total",
+    "Interviewer audio synthesized by TTS vs. delivered (actually played)",
+    ["stage"],
+)
+TTS_CACHE_LOOKUPS = Counter(
+    "tts_cache_lookups_total", "Pre-synthesized audio cache lookups for interviewer sentences", ["result"]
+)
+TTS_CACHE_SAVED_SECONDS = Counter(
+    "tts_cache_saved_seconds_total", "Estimated TTS time to first audio saved by cache hits"
+)
+
+# --- Offline assessment ---
+ASSESSMENT_JOBS = Counter(
+    "assessment_jobs_total", "Interview assessment jobs processed, by outcome", ["result"]
+)
+ASSESSMENT_SECONDS = Histogram(
+    "assessment_seconds",
+    "Duration of one transcript scoring call",
+    buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120),
+)
+
+# --- Startup ---
+SERVICE_BOOT_PHASE_SECONDS = Gauge(
+    "service_boot_phase_seconds",
+    "Time spent in each boot phase of this process",
+    ["phase"],
+    multiprocess_mode="liveall",
+)
+
+# prometheus_client picks file-backed values for the whole process when this
+# is set at import time; then this process's own metrics are in the directory too
+_MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+_worker_dir: Optional[str] = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+def share_with_workers() -> str:
+    """Make processes started after this call record their metrics where
+    ``render_latest`` reads them. Returns the shared directory."""
+    global _worker_dir
+    if _worker_dir is None:
+        _worker_dir = tempfile.mkdtemp(prefix="interview-metrics-")
+    # Spawned children inherit the environment and switch to file-backed values
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = _worker_dir
+    return _worker_dir
+
+
+def mark_worker_dead(pid: int):
+    """Drop the live gauges of a worker process that has exited."""
+    if _worker_dir is not None:
+        mark_process_dead(pid, _worker_dir)
+
+
+class _WithWorkersCollector:
+    """This process's registry plus the metrics recorded by worker processes."""
+
+    def __init__(self, path: str):
+        self._workers = MultiProcessCollector(None, path)
+
+    def collect(self):
+        families = {}
+        for family in list(REGISTRY.collect()) + list(self._workers.collect()):
+            merged, samples = families.setdefault(family.name, (family, {}))
+            if merged.type != family.type:
+                continue
+            for sample in family.samples:
+                key = (sample.name, tuple(sorted(sample.labels.items())))
+                previous = samples.get(key)
+                if previous is None:
+                    samples[key] = sample
+                elif not sample.name.endswith("_created"):
+                    # Same series from another process: counts add up
+                    samples[key] = previous._replace(value=previous.value + sample.value)
+        for family, samples in families.values():
+            family.samples = list(samples.values())
+            yield family
+
+
+def render_latest():
+    """Return the exposition body and its content type."""
+    if _worker_dir is None:
+        return generate_latest(), CONTENT_TYPE_LATEST
+    registry = CollectorRegistry()
+    if _MULTIPROCESS:
+        MultiProcessCollector(registry, _worker_dir)
+    else:
+        registry.register(_WithWorkersCollector(_worker_dir))
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -2,14 +2,16 @@ import enum
 from sqlalchemy import Column, Integer, String, DateTime, Text
 from sqlalchemy.dialects.postgresql import ENUM as PGEnum
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import ENUM as PGEnum
 from sqlalchemy.orm import declarative_base, relationship
 import datetime
-from typing import List
+from typing import Dict, List, Optional
 from .schemas import JDOut
+from . import skills
 from pydantic import BaseModel
-from sqlalchemy import event
+from sqlalchemy import event, func, literal_column, select, text
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 
 
 
@@ -19,6 +21,36 @@ Base = declarative_base()
 # IMPORTANT: create_type=False so SQLAlchemy won't try to (re)create it.
 UserRoleEnum = PGEnum('candidate', 'recruiter', 'admin', name='user_role', create_type=False)
 
+# --- Full-text search ---
+# Queries must build the exact expressions the GIN indexes were created on (with
+# constants inlined, not bound) so Postgres answers them from the index instead
+# of computing tsvectors row by row.
+JD_SEARCH_CONFIG = "english"
+# Names and emails are not stemmed; email punctuation splits it into words
+USER_SEARCH_CONFIG = "simple"
+
+def _sql_string(value: str):
+    return literal_column("'" + value.replace("'", "''") + "'")
+
+def _tsvector(config: str, value, weight: str):
+    return func.setweight(
+        func.to_tsvector(literal_column(f"'{config}'::regconfig"), func.coalesce(value, _sql_string(""))),
+        _sql_string(weight),
+    )
+
+def jd_search_vector(title, required_skills, preferred_skills, responsibilities):
+    return (
+        _tsvector(JD_SEARCH_CONFIG, title, "A")
+        .op("||")(_tsvector(JD_SEARCH_CONFIG, required_skills, "B"))
+        .op("||")(_tsvector(JD_SEARCH_CONFIG, preferred_skills, "C"))
+        .op("||")(_tsvector(JD_SEARCH_CONFIG, responsibilities, "D"))
+    )
+
+def user_search_vector(full_name, email):
+    words = func.regexp_replace(email, _sql_string("[^[:alnum:]]+"), _sql_string(" "), _sql_string("g"))
+    return _tsvector(USER_SEARCH_CONFIG, full_name, "A").op("||")(_tsvector(USER_SEARCH_CONFIG, words, "B"))
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -35,6 +67,10 @@ class User(Base):
     created_at = Column("created_at", DateTime(timezone=True), default=datetime.datetime.utcnow, nullable=True)
     updated_at = Column("updated_at", DateTime(timezone=True), default=datetime.datetime.utcnow, nullable=True)
 
+    __table_args__ = (
+        Index("ix_users_search", user_search_vector(full_name, email), postgresql_using="gin"),
+    )
+
 class JobDescription(Base):
     __tablename__ = "job_descriptions"
 
@@ -47,18 +83,32 @@ class JobDescription(Base):
     min_experience = Column(Integer, nullable=False)
     responsibilities = Column(Text, nullable=False)
 
+    __table_args__ = (
+        Index(
+            "ix_job_descriptions_search",
+            jd_search_vector(title, required_skills, preferred_skills, responsibilities),
+            postgresql_using="gin",
+        ),
+    )
+
 
 
 class JDListResponse(BaseModel):
     success: bool
     status_code: int
     data: List[JDOut]
+    next_cursor: Optional[str] = None
 
     class Config:
         orm_mode = True
 
 class Candidate(Base):
     __tablename__ = "candidates"
+    __table_args__ = (
+        # Keyset pagination of a JD's candidates and applied-at range filters
+        Index("ix_candidates_jd_id_id", "jd_id", "id"),
+        Index("ix_candidates_applied_at", "applied_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
@@ -80,6 +130,10 @@ class InterviewStatus(str, enum.Enum):
 
 class Interview(Base):
     __tablename__ = "interviews"
+    __table_args__ = (
+        Index("ix_interviews_candidate_id", "candidate_id"),
+        Index("ix_interviews_status_candidate_id", "status", "candidate_id"),
+    )
     id = Column(Integer, primary_key=True)
     candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"))
     jd_id = Column(Integer, ForeignKey("job_descriptions.id", ondelete="CASCADE"))
@@ -97,6 +151,127 @@ class Interview(Base):
 
     candidate = relationship("Candidate", back_populates="interview")
 
+class InterviewTurn(Base):
+    """One spoken turn of a live interview, appended as it happens."""
+    __tablename__ = "interview_turns"
+    __table_args__ = (
+        Index("ix_interview_turns_interview_seq", "interview_id", "seq"),
+        Index("ix_interview_turns_session_seq", "session_id", "seq"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    session_id = Column(String(64), nullable=False)
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=True)
+    jd_id = Column(Integer, ForeignKey("job_descriptions.id", ondelete="SET NULL"), nullable=True)
+    seq = Column(Integer, nullable=False)
+    role = Column(String(16), nullable=False)  # "candidate" or "interviewer"
+    content = Column(Text, nullable=False)
+    spoken_at = Column(DateTime(timezone=True), default=datetime.datetime.utcnow)
+
+class AssessmentJobStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    done = "done"
+    failed = "failed"
+    skipped = "skipped"  # nothing to score (no transcript)
+
+
+class AssessmentJob(Base):
+    """Queue entry asking for a completed interview to be scored.
+
+    Rows are claimed in batches by ``app.assessment_worker`` with
+    ``FOR UPDATE SKIP LOCKED``, so several workers can drain the queue. A
+    ``running`` row whose ``locked_at`` is older than the lease belongs to a
+    worker that died and is claimed again.
+    """
+    __tablename__ = "assessment_jobs"
+    __table_args__ = (
+        Index("ix_assessment_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False, unique=True)
+    status = Column(
+        Enum(AssessmentJobStatus, name="assessment_job_status", native_enum=False, create_constraint=False),
+        nullable=False,
+        default=AssessmentJobStatus.queued,
+        server_default=AssessmentJobStatus.queued.value,
+    )
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    run_after = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class InterviewAssessment(Base):
+    """Scores for one completed interview against its JD's skills."""
+    __tablename__ = "interview_assessments"
+
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), primary_key=True, autoincrement=False)
+    jd_id = Column(Integer, ForeignKey("job_descriptions.id", ondelete="SET NULL"), nullable=True)
+    overall_score = Column(Integer, nullable=False)  # 0-100
+    skill_scores = Column(JSONB, nullable=False)  # {skill: 0-100}
+    summary = Column(Text, nullable=True)
+    model = Column(String(64), nullable=False)
+    scored_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class Skill(Base):
+    """One normalized skill; ``name`` is the lookup key (see ``app.skills``)."""
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(255), nullable=False, unique=True)
+    display_name = Column(String(255), nullable=False)
+
+
+class JDSkill(Base):
+    """Skill of a JD, kept in sync with its skills text by a database trigger (see below)."""
+    __tablename__ = "jd_skills"
+    __table_args__ = (
+        # Inverted index: which JDs list a skill
+        Index("ix_jd_skills_skill_jd", "skill_id", "jd_id"),
+    )
+
+    jd_id = Column(Integer, ForeignKey("job_descriptions.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True)
+    kind = Column(String(16), nullable=False)  # "required" or "preferred"
+    position = Column(Integer, nullable=False)  # order in the JD text
+
+
+class CandidateSkill(Base):
+    """Skill a candidate was assessed on, with the interview assessment score."""
+    __tablename__ = "candidate_skills"
+    __table_args__ = (
+        Index("ix_candidate_skills_skill_candidate", "skill_id", "candidate_id"),
+    )
+
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True)
+    score = Column(Integer, nullable=False)  # 0-100
+
+
+class InterviewStats(Base):
+    """Running candidate and interview-status counts per JD.
+
+    Kept up to date by database triggers (``install_interview_stats``), so
+    every write path counts, including Core inserts and other tools writing
+    to the tables. Dashboards read one small row per JD instead of counting
+    candidates; ``recount_interview_stats`` recomputes everything with
+    COUNT ... GROUP BY.
+    """
+    __tablename__ = "interview_stats"
+
+    jd_id = Column(Integer, primary_key=True, autoincrement=False)
+    candidates = Column(Integer, nullable=False, default=0, server_default="0")
+    pending = Column(Integer, nullable=False, default=0, server_default="0")
+    scheduled = Column(Integer, nullable=False, default=0, server_default="0")
+    ongoing = Column(Integer, nullable=False, default=0, server_default="0")
+    completed = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
 @event.listens_for(Candidate, "after_insert")
 def create_interview_after_candidate(mapper, connection, target):
     """
@@ -109,4 +284,287 @@ def create_interview_after_candidate(mapper, connection, target):
             jd_id=target.jd_id,
             status=InterviewStatus.pending.value  # use .value for enum
         )
-    )
\ No newline at end of file
+    )
+
+# Counter triggers are statement-level with transition tables, so a bulk
+# insert or update costs one aggregate per statement, not one per row. Each
+# JD's net change is applied in jd_id order (consistent lock order across
+# concurrent writers), and JDs whose counts did not change are not touched,
+# so most interview updates take no lock on interview_stats at all. Counts
+# are only ever updated: a JD's row is created with the JD and removed with it.
+STATUS_COUNTERS = [status.value for status in InterviewStatus]
+STATS_TRIGGER_PREFIX = "interview_stats_"
+
+def _stats_counter_function(name: str, counters: Dict[str, str]) -> str:
+    """Trigger function adding each JD's net change in ``counters`` (name -> row condition)."""
+    sums = ", ".join(f"coalesce(sum(sign) FILTER (WHERE {condition}), 0) AS {counter}" for counter, condition in counters.items())
+
+    def apply(signs: Dict[str, int]) -> str:
+        # Only reads the transition tables the firing event defines
+        changes = " UNION ALL ".join(f"SELECT *, {sign} AS sign FROM {rows}" for rows, sign in signs.items())
+        return f"""
+            FOR d IN
+                SELECT jd_id, {sums} FROM ({changes}) AS changes
+                WHERE jd_id IS NOT NULL GROUP BY jd_id
+                HAVING {" OR ".join(f"coalesce(sum(sign) FILTER (WHERE {condition}), 0) <> 0" for condition in counters.values())}
+                ORDER BY jd_id
+            LOOP
+                UPDATE interview_stats
+                SET {", ".join(f"{counter} = {counter} + d.{counter}" for counter in counters)}, updated_at = now()
+                WHERE jd_id = d.jd_id;
+            END LOOP;"""
+
+    return f"""
+    CREATE OR REPLACE FUNCTION {name}() RETURNS trigger LANGUAGE plpgsql AS $$
+    DECLARE
+        d record;
+    BEGIN
+        IF TG_OP = 'INSERT' THEN{apply({"new_rows": 1})}
+        ELSIF TG_OP = 'DELETE' THEN{apply({"old_rows": -1})}
+        ELSE{apply({"new_rows": 1, "old_rows": -1})}
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """
+
+INTERVIEW_STATS_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION interview_stats_jd_rows() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO interview_stats (jd_id) SELECT id FROM new_rows ORDER BY id ON CONFLICT (jd_id) DO NOTHING;
+        ELSE
+            DELETE FROM interview_stats WHERE jd_id IN (SELECT id FROM old_rows);
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    _stats_counter_function("interview_stats_count_candidates", {"candidates": "true"}),
+    _stats_counter_function(
+        "interview_stats_count_interviews", {name: f"status = '{name}'" for name in STATUS_COUNTERS}
+    ),
+)
+
+# (table, events, function): one trigger per event, as each event exposes different transition tables
+INTERVIEW_STATS_TRIGGERS = (
+    ("job_descriptions", ("INSERT", "DELETE"), "interview_stats_jd_rows"),
+    ("candidates", ("INSERT", "UPDATE", "DELETE"), "interview_stats_count_candidates"),
+    ("interviews", ("INSERT", "UPDATE", "DELETE"), "interview_stats_count_interviews"),
+)
+_TRANSITION_TABLES = {
+    "INSERT": "NEW TABLE AS new_rows",
+    "UPDATE": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "DELETE": "OLD TABLE AS old_rows",
+}
+
+def recount_interview_stats(connection):
+    """Replace every counter row with fresh COUNT ... GROUP BY results."""
+    # Hold off the triggers' updates until the fresh counts are committed
+    connection.execute(text("LOCK TABLE interview_stats IN EXCLUSIVE MODE"))
+    connection.execute(InterviewStats.__table__.delete())
+    counts = (
+        select(
+            JobDescription.id,
+            func.count(func.distinct(Candidate.id)),
+            *[func.count(Interview.id).filter(Interview.status == InterviewStatus(name)) for name in STATUS_COUNTERS],
+        )
+        .select_from(JobDescription)
+        .outerjoin(Candidate, Candidate.jd_id == JobDescription.id)
+        .outerjoin(Interview, Interview.candidate_id == Candidate.id)
+        .group_by(JobDescription.id)
+    )
+    connection.execute(
+        InterviewStats.__table__.insert().from_select(["jd_id", "candidates", *STATUS_COUNTERS], counts)
+    )
+
+def install_interview_stats(connection) -> bool:
+    """Install (or update) the counter functions and their triggers.
+
+    The first install also recounts every JD, in the same transaction as the
+    triggers, and returns True. Later calls only replace the functions.
+    """
+    # Serialize replicas starting at the same time
+    connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('interview_stats'))"))
+    for statement in INTERVIEW_STATS_DDL:
+        connection.execute(text(statement))
+    triggers = {
+        f"{STATS_TRIGGER_PREFIX}{table}_{event_name.lower()}": (table, event_name, function)
+        for table, events, function in INTERVIEW_STATS_TRIGGERS
+        for event_name in events
+    }
+    existing = set(connection.execute(
+        text("SELECT tgname FROM pg_trigger WHERE tgname = ANY(:names) AND NOT tgisinternal"),
+        {"names": list(triggers)},
+    ).scalars())
+    created = False
+    for name, (table, event_name, function) in triggers.items():
+        if name not in existing:
+            connection.execute(text(
+                f"CREATE TRIGGER {name} AFTER {event_name} ON {table} "
+                f"REFERENCING {_TRANSITION_TABLES[event_name]} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+            ))
+            created = True
+    if created:
+        recount_interview_stats(connection)
+    return created
+
+
+def upsert_skill_ids(connection, names: Dict[str, str]) -> Dict[str, int]:
+    """Ensure a ``skills`` row for each normalized name; returns name -> id."""
+    if not names:
+        return {}
+    table = Skill.__table__
+    # Sorted so concurrent writers take row locks in the same order
+    connection.execute(
+        pg_insert(table)
+        .values([{"name": name, "display_name": names[name]} for name in sorted(names)])
+        .on_conflict_do_nothing(index_elements=[table.c.name])
+    )
+    return dict(connection.execute(select(table.c.name, table.c.id).where(table.c.name.in_(names))).all())
+
+def sync_candidate_skills(connection, scores: Dict[int, Dict[str, int]]):
+    """Replace each candidate's skills with the scores of their latest assessment."""
+    names = {}
+    for skill_scores in scores.values():
+        for skill in skill_scores:
+            key = skills.normalize_skill(skill)
+            if key:
+                names.setdefault(key, skills.display_skill(skill))
+    ids = upsert_skill_ids(connection, names)
+    table = CandidateSkill.__table__
+    connection.execute(table.delete().where(table.c.candidate_id.in_(list(scores))))
+    rows = {}
+    for candidate_id, skill_scores in scores.items():
+        for skill, score in skill_scores.items():
+            key = skills.normalize_skill(skill)
+            row = rows.get((candidate_id, ids[key])) if key else None
+            if key and (row is None or score > row["score"]):
+                # Spellings that normalize to the same skill keep the best score
+                rows[(candidate_id, ids[key])] = {"candidate_id": candidate_id, "skill_id": ids[key], "score": score}
+    if rows:
+        connection.execute(table.insert().values(list(rows.values())))
+
+# JD skills are indexed by the database itself, so JDs written by other
+# systems or by Core inserts are covered too. jd_skill_entries() mirrors
+# app.skills: split on commas, collapse whitespace, key by lower case, first
+# spelling wins, and a skill listed as both required and preferred is required.
+SKILL_INDEX_TRIGGER = "job_descriptions_skill_index"
+SKILL_INDEX_DDL = (
+    r"""
+    CREATE OR REPLACE FUNCTION jd_skill_entries(required_text text, preferred_text text)
+    RETURNS TABLE (name text, display_name text, kind text, "position" integer)
+    LANGUAGE sql IMMUTABLE AS $$
+        WITH raw AS (
+            SELECT k.kind, k.rank, s.ord,
+                   regexp_replace(regexp_replace(s.skill, '\s+', ' ', 'g'), '^ | $', '', 'g') AS display
+            FROM (VALUES ('required', 0, required_text), ('preferred', 1, preferred_text)) AS k(kind, rank, skills_text)
+            CROSS JOIN LATERAL unnest(string_to_array(coalesce(k.skills_text, ''), ',')) WITH ORDINALITY AS s(skill, ord)
+        ), firsts AS (
+            SELECT DISTINCT ON (kind, lower(display)) kind, rank, ord, display
+            FROM raw
+            WHERE display <> ''
+            ORDER BY kind, lower(display), ord
+        ), numbered AS (
+            SELECT kind, rank, display, (row_number() OVER (PARTITION BY kind ORDER BY ord) - 1)::integer AS pos
+            FROM firsts
+        )
+        SELECT DISTINCT ON (lower(display)) lower(display), display, kind, pos
+        FROM numbered
+        ORDER BY lower(display), rank
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION index_jd_skills() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE'
+           AND NEW.required_skills IS NOT DISTINCT FROM OLD.required_skills
+           AND NEW.preferred_skills IS NOT DISTINCT FROM OLD.preferred_skills THEN
+            RETURN NULL;
+        END IF;
+        INSERT INTO skills (name, display_name)
+            SELECT e.name, e.display_name FROM jd_skill_entries(NEW.required_skills, NEW.preferred_skills) AS e
+            ORDER BY e.name
+            ON CONFLICT (name) DO NOTHING;
+        DELETE FROM jd_skills WHERE jd_id = NEW.id;
+        INSERT INTO jd_skills (jd_id, skill_id, kind, position)
+            SELECT NEW.id, skills.id, e.kind, e.position
+            FROM jd_skill_entries(NEW.required_skills, NEW.preferred_skills) AS e
+            JOIN skills ON skills.name = e.name;
+        RETURN NULL;
+    END
+    $$
+    """,
+)
+
+def reindex_jd_skills(connection, after_id: Optional[int] = None, last_id: Optional[int] = None):
+    """Re-derive ``jd_skills`` for JDs with ids in (after_id, last_id], or all JDs.
+
+    Three set-based statements whatever the number of JDs.
+    """
+    bounds = []
+    params = {}
+    if after_id is not None:
+        bounds.append("jd.id > :after_id")
+        params["after_id"] = after_id
+    if last_id is not None:
+        bounds.append("jd.id <= :last_id")
+        params["last_id"] = last_id
+    where = f"WHERE {' AND '.join(bounds)}" if bounds else ""
+    entries = (
+        "FROM job_descriptions AS jd "
+        "CROSS JOIN LATERAL jd_skill_entries(jd.required_skills, jd.preferred_skills) AS e "
+    )
+    connection.execute(text(
+        f"INSERT INTO skills (name, display_name) SELECT DISTINCT ON (e.name) e.name, e.display_name "
+        f"{entries}{where} ORDER BY e.name ON CONFLICT (name) DO NOTHING"
+    ), params)
+    connection.execute(text(
+        f"DELETE FROM jd_skills WHERE jd_id IN (SELECT jd.id FROM job_descriptions AS jd {where})"
+    ), params)
+    connection.execute(text(
+        f"INSERT INTO jd_skills (jd_id, skill_id, kind, position) SELECT jd.id, skills.id, e.kind, e.position "
+        f"{entries}JOIN skills ON skills.name = e.name {where}"
+    ), params)
+
+def install_skill_index(connection) -> bool:
+    """Install (or update) the skill index functions and the job_descriptions trigger.
+
+    The first install also indexes every existing JD, in the same transaction
+    as the trigger, and returns True. Later calls only replace the functions.
+    """
+    # Serialize replicas starting at the same time
+    connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('jd_skill_index'))"))
+    for statement in SKILL_INDEX_DDL:
+        connection.execute(text(statement))
+    exists = connection.execute(
+        text("SELECT 1 FROM pg_trigger WHERE tgname = :name AND NOT tgisinternal"), {"name": SKILL_INDEX_TRIGGER}
+    ).first()
+    if exists:
+        return False
+    connection.execute(text(
+        f"CREATE TRIGGER {SKILL_INDEX_TRIGGER} "
+        "AFTER INSERT OR UPDATE OF required_skills, preferred_skills ON job_descriptions "
+        "FOR EACH ROW EXECUTE FUNCTION index_jd_skills()"
+    ))
+    reindex_jd_skills(connection)
+    return True
+
+
+JD_SEARCH_VECTOR = jd_search_vector(
+    JobDescription.title, JobDescription.required_skills, JobDescription.preferred_skills, JobDescription.responsibilities
+)
+USER_SEARCH_VECTOR = user_search_vector(User.full_name, User.email)
+
+
+def create_missing_indexes(connection):
+    """Create declared indexes on tables that predate them.
+
+    ``create_all`` skips tables that already exist, including their new
+    indexes, so add those separately (no-op when they are already there).
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
@@ -0,0 +1,246 @@
+# app/observers.py
+"""Pipeline observers that record per-session interview metrics.
+
+Observers see every frame hop in the pipeline, so each one filters on the
+processor that produced the frame to count things exactly once.
+"""
+import re
+import time
+from typing import Dict, List, Optional
+
+from loguru import logger
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+    MetricsFrame,
+    TTSAudioRawFrame,
+    TTSTextFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.metrics.metrics import LLMUsageMetricsData, TTFBMetricsData
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from app import metrics
+
+
+class PromptCacheUsageObserver(BaseObserver):
+    """Records cached vs. uncached prompt tokens for every LLM turn.
+
+    Anthropic reports ``cache_read_input_tokens`` for the part of the prompt
+    served from its prompt cache; everything else (plain input tokens and
+    tokens written to the cache) is billed and processed as uncached.
+    """
+
+    def __init__(self, llm: FrameProcessor, session_id: Optional[str] = None):
+        super().__init__()
+        self._llm = llm
+        self._session_id = session_id
+        self.turns: List[dict] = []
+
+    async def on_push_frame(self, data: FramePushed):
+        if data.source is not self._llm or not isinstance(data.frame, MetricsFrame):
+            return
+
+        for metrics in data.frame.data:
+            if not isinstance(metrics, LLMUsageMetricsData):
+                continue
+            usage = metrics.value
+            cached = usage.cache_read_input_tokens or 0
+            uncached = (usage.prompt_tokens or 0) + (usage.cache_creation_input_tokens or 0)
+            turn = {
+                "cached_input_tokens": cached,
+                "uncached_input_tokens": uncached,
+                "cache_write_tokens": usage.cache_creation_input_tokens or 0,
+                "output_tokens": usage.completion_tokens or 0,
+            }
+            self.turns.append(turn)
+            logger.debug(f"[{self._session_id}] LLM turn {len(self.turns)} tokens: {turn}")
+
+    def summary(self) -> dict:
+        cached = sum(turn["cached_input_tokens"] for turn in self.turns)
+        uncached = sum(turn["uncached_input_tokens"] for turn in self.turns)
+        total = cached + uncached
+        return {
+            "turns": len(self.turns),
+            "cached_input_tokens": cached,
+            "uncached_input_tokens": uncached,
+            "output_tokens": sum(turn["output_tokens"] for turn in self.turns),
+            "cache_hit_ratio": (cached / total) if total else 0.0,
+        }
+
+
+def _summarize(values: List[float]) -> dict:
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1),
+    }
+
+
+class PipelineLatencyObserver(BaseObserver):
+    """Records per-stage TTFB and end-to-end turn latency for one session.
+
+    Stage latencies come from the TTFB metrics the STT, LLM and TTS services
+    emit when ``enable_metrics`` is on. Turn latency runs from the input
+    transport's ``UserStoppedSpeakingFrame`` to the output transport's next
+    ``BotStartedSpeakingFrame``; it starts after the VAD stop delay, so add
+    ``stop_secs`` for the full voice-to-voice time. Values go to the
+    process-wide histograms in ``app.metrics`` and are kept per session for
+    ``summary()``.
+    """
+
+    def __init__(
+        self,
+        transport_input: FrameProcessor,
+        transport_output: FrameProcessor,
+        stt: FrameProcessor,
+        llm: FrameProcessor,
+        tts: FrameProcessor,
+        session_id: Optional[str] = None,
+    ):
+        super().__init__()
+        self._input = transport_input
+        self._output = transport_output
+        self._stages = {stt: "stt", llm: "llm", tts: "tts"}
+        self._session_id = session_id
+        self._user_stopped_at: Optional[float] = None
+        self.stage_ttfb: Dict[str, List[float]] = {stage: [] for stage in self._stages.values()}
+        self.turn_latency: List[float] = []
+
+    async def on_push_frame(self, data: FramePushed):
+        frame = data.frame
+        if isinstance(frame, MetricsFrame):
+            stage = self._stages.get(data.source)
+            if stage is None:
+                return
+            for item in frame.data:
+                if isinstance(item, TTFBMetricsData) and item.value > 0:
+                    self.stage_ttfb[stage].append(item.value)
+                    metrics.INTERVIEW_STAGE_TTFB_SECONDS.labels(stage=stage).observe(item.value)
+            return
+
+        if data.direction != FrameDirection.DOWNSTREAM:
+            return
+        if data.source is self._input:
+            if isinstance(frame, UserStartedSpeakingFrame):
+                self._user_stopped_at = None
+            elif isinstance(frame, UserStoppedSpeakingFrame):
+                self._user_stopped_at = time.monotonic()
+        elif data.source is self._output and isinstance(frame, BotStartedSpeakingFrame):
+            if self._user_stopped_at is not None:
+                latency = time.monotonic() - self._user_stopped_at
+                self._user_stopped_at = None
+                self.turn_latency.append(latency)
+                metrics.INTERVIEW_TURN_LATENCY_SECONDS.observe(latency)
+                logger.debug(f"[{self._session_id}] Turn latency: {latency * 1000:.0f} ms")
+
+    def summary(self) -> dict:
+        return {
+            "turn_latency": _summarize(self.turn_latency),
+            **{f"{stage}_ttfb": _summarize(values) for stage, values in self.stage_ttfb.items()},
+        }
+
+
+def _estimate_tokens(text: str) -> float:
+    # Same words-to-tokens ratio pipecat uses when a stream is cut short
+    return len(re.findall(r"\w+", text)) * 1.3
+
+
+def _audio_seconds(frame: TTSAudioRawFrame) -> float:
+    return len(frame.audio) / (2 * frame.num_channels * frame.sample_rate)
+
+
+class InterruptionObserver(BaseObserver):
+    """Counts interviewer output that was produced vs. actually delivered.
+
+    Generated tokens are the LLM's text; synthesized audio is what TTS
+    returned. Delivered tokens and audio are what the output transport pushes
+    on as it plays them, so anything cut off by a barge-in shows up as the
+    difference. Token counts are word-based estimates, the same for both sides.
+    An interruption is the candidate starting to speak while a reply is being
+    generated or played.
+    """
+
+    def __init__(
+        self,
+        transport_input: FrameProcessor,
+        transport_output: FrameProcessor,
+        llm: FrameProcessor,
+        tts: FrameProcessor,
+        session_id: Optional[str] = None,
+    ):
+        super().__init__()
+        self._input = transport_input
+        self._output = transport_output
+        self._llm = llm
+        self._tts = tts
+        self._session_id = session_id
+        self._response_text: List[str] = []
+        self._responding = False
+        self._bot_speaking = False
+        self.interruptions = 0
+        self.tokens_generated = 0.0
+        self.tokens_delivered = 0.0
+        self.audio_synthesized = 0.0
+        self.audio_delivered = 0.0
+
+    async def on_push_frame(self, data: FramePushed):
+        if data.direction != FrameDirection.DOWNSTREAM:
+            return
+        frame, source = data.frame, data.source
+        if source is self._llm:
+            if isinstance(frame, LLMTextFrame):
+                self._response_text.append(frame.text)
+            elif isinstance(frame, LLMFullResponseStartFrame):
+                self._responding = True
+            elif isinstance(frame, LLMFullResponseEndFrame):
+                # Counted per response: stream deltas split words
+                self._responding = False
+                tokens = _estimate_tokens("".join(self._response_text))
+                self._response_text = []
+                self.tokens_generated += tokens
+                metrics.INTERVIEW_LLM_TOKENS.labels(stage="generated").inc(tokens)
+        elif source is self._tts:
+            if isinstance(frame, TTSAudioRawFrame):
+                seconds = _audio_seconds(frame)
+                self.audio_synthesized += seconds
+                metrics.INTERVIEW_TTS_AUDIO_SECONDS.labels(stage="synthesized").inc(seconds)
+        elif source is self._output:
+            if isinstance(frame, TTSAudioRawFrame):
+                seconds = _audio_seconds(frame)
+                self.audio_delivered += seconds
+                metrics.INTERVIEW_TTS_AUDIO_SECONDS.labels(stage="delivered").inc(seconds)
+            elif isinstance(frame, TTSTextFrame):
+                tokens = _estimate_tokens(frame.text)
+                self.tokens_delivered += tokens
+                metrics.INTERVIEW_LLM_TOKENS.labels(stage="delivered").inc(tokens)
+            elif isinstance(frame, BotStartedSpeakingFrame):
+                self._bot_speaking = True
+            elif isinstance(frame, BotStoppedSpeakingFrame):
+                self._bot_speaking = False
+        elif source is self._input and isinstance(frame, UserStartedSpeakingFrame):
+            if not (self._responding or self._bot_speaking):
+                return
+            self.interruptions += 1
+            metrics.INTERVIEW_INTERRUPTIONS.inc()
+            logger.debug(f"[{self._session_id}] Candidate interrupted the interviewer")
+
+    def summary(self) -> dict:
+        return {
+            "interruptions": self.interruptions,
+            "tokens_generated": round(self.tokens_generated),
+            "tokens_delivered": round(self.tokens_delivered),
+            "tokens_wasted": round(max(0.0, self.tokens_generated - self.tokens_delivered)),
+            "audio_seconds_synthesized": round(self.audio_synthesized, 1),
+            "audio_seconds_delivered": round(self.audio_delivered, 1),
+            "audio_seconds_wasted": round(max(0.0, self.audio_synthesized - self.audio_delivered), 1),
+        }
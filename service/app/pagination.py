@@ -0,0 +1,79 @@
+# app/pagination.py
+"""Keyset (cursor) pagination helpers.
+
+List endpoints return at most ``limit`` rows ordered by a unique key and an
+opaque ``next_cursor`` holding the key of the last row. The next page is
+fetched with ``WHERE key > last_key``, which an index answers directly, so
+page N costs the same as page 1 no matter how large the table grows.
+"""
+import base64
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "50"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "200"))
+
+
+def encode_cursor(key: Dict[str, Any]) -> str:
+    raw = json.dumps(key, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "success": False,
+            "status_code": status.HTTP_400_BAD_REQUEST,
+            "message": "Invalid pagination cursor"
+        }
+    )
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        raise _invalid_cursor()
+    if not isinstance(key, dict):
+        raise _invalid_cursor()
+    return key
+
+
+def cursor_id(cursor: Optional[str]) -> Optional[int]:
+    """Decode a cursor over a single integer ``id`` key."""
+    key = decode_cursor(cursor)
+    if key is None:
+        return None
+    try:
+        return int(key["id"])
+    except (KeyError, TypeError, ValueError):
+        raise _invalid_cursor()
+
+
+def cursor_rank_id(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    """Decode a cursor over a ``(rank, id)`` key (relevance-ordered results)."""
+    key = decode_cursor(cursor)
+    if key is None:
+        return None
+    try:
+        return float(key["rank"]), int(key["id"])
+    except (KeyError, TypeError, ValueError):
+        raise _invalid_cursor()
+
+
+def paginate(
+    rows: Sequence[Any],
+    limit: int,
+    key: Callable[[Any], Dict[str, Any]] = lambda row: {"id": row.id},
+) -> Tuple[List[Any], Optional[str]]:
+    """Split a ``limit + 1`` row fetch into the page and the next cursor."""
+    page = list(rows[:limit])
+    next_cursor = encode_cursor(key(page[-1])) if len(rows) > limit and page else None
+    return page, next_cursor
@@ -0,0 +1,229 @@
+# app/prompt_cache.py
+"""Compiled interview system prompts.
+
+Assembling the system prompt means a DB round trip for the job description
+plus a few KB of string formatting, and the result is identical for every
+candidate interviewing for the same JD. Prompts are compiled once per
+(role, JD id, JD revision) and kept in a bounded LRU.
+
+The JD revision is a fingerprint of the JD columns that feed the prompt. A
+JD's revision is re-read from the database once the cached one is older than
+``PROMPT_REVISION_TTL_SECONDS``, so an edited JD is picked up only after that
+TTL; sessions started before then still get the previous prompt.
+"""
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app import crud
+from app.db.connection import get_db
+from app.interview_prompts import compile_interview_prompt
+from app.models import JobDescription
+from app.skills import PREFERRED, REQUIRED
+
+PROMPT_CACHE_SIZE = int(os.getenv("PROMPT_CACHE_SIZE", "256"))
+PROMPT_REVISION_TTL_SECONDS = float(os.getenv("PROMPT_REVISION_TTL_SECONDS", "300"))
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "4000"))
+ANTHROPIC_PROMPT_CACHING = os.getenv("ANTHROPIC_PROMPT_CACHING", "1") == "1"
+
+_JD_PROMPT_FIELDS = (
+    "title",
+    "location",
+    "opening",
+    "required_skills",
+    "preferred_skills",
+    "min_experience",
+    "responsibilities",
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English prose)."""
+    return (len(text) + 3) // 4
+
+
+def jd_revision(job_details: Dict[str, Any]) -> str:
+    """Fingerprint of the JD fields that end up in the prompt."""
+    digest = hashlib.sha1()
+    for field in _JD_PROMPT_FIELDS:
+        digest.update(str(job_details.get(field)).encode())
+        digest.update(b"\x1f")
+    return digest.hexdigest()[:12]
+
+
+def cacheable_system_blocks(prefix: str, suffix: str) -> List[Dict[str, Any]]:
+    """Anthropic system blocks with a cache breakpoint after the stable prefix.
+
+    Everything up to and including the marked block is cached by the provider
+    and reused across turns and sessions for the same JD; the per-session
+    suffix after it is always sent uncached.
+    """
+    return [
+        {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": suffix},
+    ]
+
+
+def job_details_from_jd(job: JobDescription, skill_lists: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+    details = {
+        "id": job.id,
+        "title": job.title,
+        "location": job.location,
+        "opening": job.opening,
+        "required_skills": job.required_skills,
+        "preferred_skills": job.preferred_skills,
+        "min_experience": job.min_experience,
+        "responsibilities": job.responsibilities,
+    }
+    if skill_lists is not None:
+        # Pre-parsed from the skill index, so the prompt never re-splits the text
+        details["required_skill_list"] = skill_lists.get(REQUIRED, [])
+        details["preferred_skill_list"] = skill_lists.get(PREFERRED, [])
+    return details
+
+
+class CompiledPrompt:
+    """A fully assembled system prompt and its size."""
+
+    __slots__ = ("text", "role", "jd_id", "revision", "token_count", "over_budget")
+
+    def __init__(self, text: str, role: str, jd_id: Optional[int], revision: Optional[str]):
+        self.text = text
+        self.role = role
+        self.jd_id = jd_id
+        self.revision = revision
+        self.token_count = estimate_tokens(text)
+        self.over_budget = self.token_count > PROMPT_TOKEN_BUDGET
+
+    def to_dict(self) -> dict:
+        return {
+            "role": self.role,
+            "jd_id": self.jd_id,
+            "revision": self.revision,
+            "characters": len(self.text),
+            "token_count": self.token_count,
+            "token_budget": PROMPT_TOKEN_BUDGET,
+            "over_budget": self.over_budget,
+        }
+
+
+class PromptCache:
+    """Bounded LRU of compiled prompts keyed by (role, jd_id, revision)."""
+
+    def __init__(self, max_entries: int, revision_ttl: float):
+        self.max_entries = max_entries
+        self.revision_ttl = revision_ttl
+        self._entries: "OrderedDict[Tuple[str, Optional[int], Optional[str]], CompiledPrompt]" = OrderedDict()
+        self._revisions: "OrderedDict[int, Tuple[str, float]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, role: str, jd_id: Optional[int]) -> CompiledPrompt:
+        if jd_id is None:
+            return self._get_or_compile(role, None, None, None)
+
+        cached = self._revisions.get(jd_id)
+        if cached and time.monotonic() - cached[1] < self.revision_ttl:
+            entry = self._entries.get((role, jd_id, cached[0]))
+            if entry:
+                self._entries.move_to_end((role, jd_id, cached[0]))
+                self.hits += 1
+                return entry
+
+        # Collapse concurrent misses for the same JD into one DB fetch
+        inflight = self._inflight.get((role, jd_id))
+        if inflight:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[(role, jd_id)] = future
+        try:
+            job_details = await fetch_job_details(jd_id)
+            if job_details is None:
+                entry = self._get_or_compile(role, None, None, None)
+            else:
+                revision = jd_revision(job_details)
+                self._revisions[jd_id] = (revision, time.monotonic())
+                self._revisions.move_to_end(jd_id)
+                while len(self._revisions) > self.max_entries:
+                    self._revisions.popitem(last=False)
+                entry = self._get_or_compile(role, jd_id, revision, job_details)
+            future.set_result(entry)
+            return entry
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so waiter-less failures don't log "never retrieved"
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._inflight[(role, jd_id)]
+
+    def _get_or_compile(
+        self,
+        role: str,
+        jd_id: Optional[int],
+        revision: Optional[str],
+        job_details: Optional[Dict[str, Any]],
+    ) -> CompiledPrompt:
+        key = (role, jd_id, revision)
+        entry = self._entries.get(key)
+        if entry:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = CompiledPrompt(compile_interview_prompt(role, job_details), role, jd_id, revision)
+        if entry.over_budget:
+            logger.warning(
+                f"Interview prompt for JD {jd_id} is ~{entry.token_count} tokens, "
+                f"over the {PROMPT_TOKEN_BUDGET} token budget"
+            )
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+        self._revisions.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+async def fetch_job_details(jd_id: int) -> Optional[Dict[str, Any]]:
+    """Fetch the JD columns and indexed skill lists used by the prompt."""
+    async for db in get_db():
+        job = await crud.get_jd_by_id(db, jd_id)
+        if not job:
+            return None
+        skill_lists = await crud.get_jd_skill_lists(db, [jd_id])
+        return job_details_from_jd(job, skill_lists.get(jd_id))
+
+
+def parse_jd_id(job_id) -> Optional[int]:
+    """The bot receives job ids as strings from the client; bad ids mean no JD."""
+    if job_id is None:
+        return None
+    try:
+        return int(job_id)
+    except (ValueError, TypeError) as e:
+        logger.error(f"Error fetching job details: {str(e)}")
+        return None
+
+
+prompt_cache = PromptCache(PROMPT_CACHE_SIZE, PROMPT_REVISION_TTL_SECONDS)
@@ -1,6 +1,6 @@
 # app/schemas.py
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
 # handle pydantic v2 ConfigDict if available, otherwise fallback to v1 Config
@@ -100,6 +100,104 @@ class CandidateListResponse(BaseModel):
     success: bool
     status_code: int
     data: List[CandidateOut]
+    next_cursor: Optional[str] = None
+
+class JDSearchHit(JDOut):
+    rank: float
+
+class JDSearchResponse(BaseModel):
+    success: bool
+    status_code: int
+    data: List[JDSearchHit]
+    next_cursor: Optional[str] = None
+    truncated: bool = False  # more rows matched than were ranked; refine the query
+    # Ranking covered only the lowest-id SEARCH_RANK_WINDOW matches, so better matches may exist
+    approximate: bool = False
+
+class CandidateSearchHit(CandidateOut):
+    rank: float
+
+class CandidateSearchResponse(BaseModel):
+    success: bool
+    status_code: int
+    data: List[CandidateSearchHit]
+    next_cursor: Optional[str] = None
+    truncated: bool = False
+    approximate: bool = False
+
+class SkillJDMatch(JDOut):
+    score: int  # required matches count 2, preferred 1
+    required_matched: int
+    required_total: int
+    matched_skills: List[str]
+
+class SkillJDMatchResponse(BaseModel):
+    success: bool
+    status_code: int
+    data: List[SkillJDMatch]
+    next_cursor: Optional[str] = None
+
+class SkillCandidateMatch(CandidateOut):
+    score: int  # sum of the candidate's assessment scores on the matched skills
+    matched_skills: List[str]
+
+class SkillCandidateMatchResponse(BaseModel):
+    success: bool
+    status_code: int
+    data: List[SkillCandidateMatch]
+    next_cursor: Optional[str] = None
+
+class SkillIndexRebuild(BaseModel):
+    jds: int
+    candidates: int
+
+class SkillIndexRebuildResponse(BaseModel):
+    success: bool
+    status_code: int
+    data: SkillIndexRebuild
+
+class CandidateImportRow(BaseModel):
+    email: EmailStr
+    jd_id: int
+    full_name: Optional[str] = None
+    applied_at: Optional[datetime] = None
+
+class CandidateImportError(BaseModel):
+    line: int
+    email: Optional[str] = None
+    message: str
+
+class CandidateImportResult(BaseModel):
+    imported: int
+    users_created: int
+    failed: int
+    chunks: int
+    errors: List[CandidateImportError]
+    errors_truncated: bool = False
+
+class CandidateImportResponse(BaseModel):
+    success: bool
+    status_code: int
+    data: CandidateImportResult
+
+class JDStatusCounts(BaseModel):
+    jd_id: int
+    candidates: int
+    pending: int
+    scheduled: int
+    ongoing: int
+    completed: int
+
+class DashboardStats(BaseModel):
+    total_jds: int
+    total_candidates: int
+    by_status: Dict[str, int]
+    by_jd: List[JDStatusCounts]
+
+class DashboardStatsResponse(BaseModel):
+    success: bool
+    status_code: int
+    data: DashboardStats
 
 class InterviewBase(BaseModel):
     candidate_id: int
@@ -122,4 +220,68 @@ class ScheduleInterviewRequest(BaseModel):
     interview_qa: Optional[str]
 
 class ScheduleStatusRequest(BaseModel):
-    candidate_id: int
\ No newline at end of file
+    candidate_id: int
+
+class BulkScheduleEntry(BaseModel):
+    candidate_id: int
+    start_time: datetime
+    end_time: datetime
+
+class BulkScheduleRequest(BaseModel):
+    entries: List[BulkScheduleEntry]
+
+class BulkScheduleResult(BaseModel):
+    candidate_id: int
+    status: str  # "scheduled", "not_found", "skipped" or "invalid"
+    interview_id: Optional[int] = None
+    message: Optional[str] = None
+
+class BulkScheduleResponse(BaseModel):
+    success: bool
+    status_code: int
+    scheduled: int
+    data: List[BulkScheduleResult]
+
+class AssessmentOut(BaseModel):
+    interview_id: int
+    jd_id: Optional[int] = None
+    status: Optional[str] = None  # assessment job status; None until the interview completes
+    attempts: int = 0
+    last_error: Optional[str] = None
+    overall_score: Optional[int] = None
+    skill_scores: Optional[Dict[str, int]] = None
+    summary: Optional[str] = None
+    model: Optional[str] = None
+    scored_at: Optional[datetime] = None
+
+class AssessmentResponse(BaseModel):
+    success: bool
+    status_code: int
+    data: AssessmentOut
+
+class VADStats(BaseModel):
+    loaded: bool
+    load_seconds: Optional[float] = None
+    sessions: int
+    setup_ms_avg: float
+    setup_ms_max: float
+    batched: bool = False
+    batch_frames: int = 0
+    batch_avg_size: float = 0.0
+
+class WorkerStats(BaseModel):
+    index: int
+    pid: Optional[int] = None
+    alive: bool
+    sessions: int
+    restarts: int
+
+class SessionStats(BaseModel):
+    active: int
+    queued: int
+    rejected: int
+    completed: int
+    max_active: int
+    max_queued: int
+    vad: Optional[VADStats] = None
+    workers: Optional[List[WorkerStats]] = None
@@ -0,0 +1,53 @@
+# app/serialization.py
+"""JSON responses built straight from query rows.
+
+Hot list endpoints select plain columns and serialize them here, so they skip
+ORM hydration and Pydantic validation. ``orjson`` is used when it is
+installed; the stdlib ``json`` fallback produces the same output, only slower.
+"""
+import datetime
+import json
+from typing import Any
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+
+def _default(value: Any):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(Response):
+    """JSON response whose content is already plain dicts/lists (no validation)."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def candidate_row_to_dict(row) -> dict:
+    """Shape a ``crud.get_candidate_rows`` row like ``schemas.CandidateOut``."""
+    return {
+        "id": row.id,
+        "jd_id": row.jd_id,
+        "applied_at": row.applied_at,
+        "user": {
+            "id": row.user_id,
+            "email": row.email,
+            "full_name": row.full_name,
+            "role": row.role,
+        },
+        "interview_status": row.interview_status,
+    }
@@ -0,0 +1,129 @@
+# app/session_manager.py
+"""Admission control for live interview sessions.
+
+Every accepted offer starts a full voice pipeline (VAD, STT, LLM, TTS) on this
+process, so the number of concurrent ``InterviewFlow`` sessions is capped.
+Offers above the cap wait in a short FIFO queue; when the queue is full, or an
+offer waits longer than the queue timeout, it is rejected and the client is
+told when to retry.
+"""
+import asyncio
+import os
+from collections import deque
+from typing import Awaitable, Optional, Set
+
+from loguru import logger
+
+
+class SessionManager:
+    """Caps concurrent interview sessions and keeps live counts."""
+
+    def __init__(
+        self,
+        max_active: int,
+        max_queued: int,
+        queue_timeout: float,
+        retry_after: int,
+    ):
+        self.max_active = max_active
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self._active = 0
+        self._waiters: deque = deque()
+        self._tasks: Set[asyncio.Task] = set()
+        self.rejected = 0
+        self.completed = 0
+
+    @classmethod
+    def from_env(cls) -> "SessionManager":
+        return cls(
+            max_active=int(os.getenv("MAX_CONCURRENT_SESSIONS", "8")),
+            max_queued=int(os.getenv("SESSION_QUEUE_SIZE", "16")),
+            queue_timeout=float(os.getenv("SESSION_QUEUE_TIMEOUT_SECONDS", "10")),
+            retry_after=int(os.getenv("SESSION_RETRY_AFTER_SECONDS", "15")),
+        )
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """Reserve a session slot. Returns False if the offer must be rejected."""
+        if self._active < self.max_active and not self._waiters:
+            self._active += 1
+            return True
+
+        if len(self._waiters) >= self.max_queued:
+            self.rejected += 1
+            logger.warning(
+                f"Rejecting session: {self._active} active, {len(self._waiters)} queued"
+            )
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=self.queue_timeout)
+            return True
+        except asyncio.TimeoutError:
+            # The slot may have been handed over just as the timeout fired
+            if waiter.done() and not waiter.cancelled():
+                return True
+            self.rejected += 1
+            logger.warning(f"Rejecting session: waited {self.queue_timeout}s in queue")
+            return False
+        except asyncio.CancelledError:
+            # Client went away while queued; give back a slot we may have been handed
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def release(self):
+        """Free a slot, handing it straight to the oldest queued offer if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Slot passes to the waiter, so the active count is unchanged
+                waiter.set_result(None)
+                return
+        self._active = max(self._active - 1, 0)
+
+    def spawn(self, coro: Awaitable, name: Optional[str] = None) -> asyncio.Task:
+        """Run a session coroutine that already holds a slot; frees it on exit."""
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_session_done)
+        return task
+
+    def finish(self):
+        """Record a session that held a slot as finished and free the slot."""
+        self.completed += 1
+        self.release()
+
+    def _on_session_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        self.finish()
+        if not task.cancelled() and task.exception():
+            logger.error(f"Interview session failed: {task.exception()}")
+
+    def stats(self) -> dict:
+        return {
+            "active": self._active,
+            "queued": len(self._waiters),
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "max_active": self.max_active,
+            "max_queued": self.max_queued,
+        }
+
+
+session_manager = SessionManager.from_env()
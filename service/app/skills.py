@@ -0,0 +1,46 @@
+# app/skills.py
+"""Skill names as stored in the skill index.
+
+JDs keep their skills as comma-separated text. Whenever that text is written,
+a database trigger normalizes each skill once into a ``skills`` row and links
+it to the JD in ``jd_skills`` (see ``install_skill_index`` in ``app.models``,
+whose ``jd_skill_entries`` SQL function follows the rules below). Lookups,
+matching and the interview prompt then use those rows instead of re-splitting
+the text.
+"""
+from typing import Dict, Iterable, List, Optional
+
+REQUIRED = "required"
+PREFERRED = "preferred"
+# Relative weight of a matched skill when ranking JDs for a skill set
+KIND_WEIGHTS = {REQUIRED: 2, PREFERRED: 1}
+
+
+def normalize_skill(skill: str) -> str:
+    """Index key of a skill: trimmed, inner whitespace collapsed, lower case."""
+    return " ".join(skill.split()).lower()
+
+
+def display_skill(skill: str) -> str:
+    return " ".join(skill.split())
+
+
+def split_skills(skills_text: Optional[str]) -> List[str]:
+    """Split comma-separated skills text, dropping blanks and repeats (first spelling wins)."""
+    seen = set()
+    skills = []
+    for skill in (skills_text or "").split(","):
+        key = normalize_skill(skill)
+        if key and key not in seen:
+            seen.add(key)
+            skills.append(display_skill(skill))
+    return skills
+
+
+def parse_skill_query(skills: Iterable[str]) -> Dict[str, str]:
+    """Normalized key -> display name for a skill list from a query string."""
+    parsed = {}
+    for value in skills:
+        for skill in split_skills(value):
+            parsed.setdefault(normalize_skill(skill), skill)
+    return parsed
@@ -0,0 +1,172 @@
+# app/transcript_writer.py
+"""Write-behind persistence of interview turns.
+
+The pipeline records each candidate/interviewer turn with a non-blocking
+``enqueue``. A single background task drains the bounded queue and writes
+turns from all live sessions in batched multi-row inserts, so a slow database
+never stalls audio and a crashed worker loses at most one flush interval of
+turns instead of the whole interview.
+"""
+import asyncio
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import insert
+
+from app.db.connection import AsyncSessionLocal
+from app.models import InterviewTurn
+
+ROLE_LABELS = {"interviewer": "INTERVIEWER", "candidate": "CANDIDATE"}
+
+
+def format_transcript(turns: Iterable[Tuple[str, str]]) -> str:
+    """Format (role, content) turns into a readable transcript."""
+    return "\n\n".join(f"[{ROLE_LABELS.get(role, role.upper())}]: {content}" for role, content in turns)
+
+
+class TranscriptWriter:
+    """Bounded queue of turns flushed to ``interview_turns`` in batches."""
+
+    def __init__(
+        self, max_queue: int, batch_size: int, flush_interval: float, flush_timeout: float = 10.0, max_retries: int = 3
+    ):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flush_timeout = flush_timeout
+        self.max_retries = max_retries
+        self._queue: Optional[asyncio.Queue] = None
+        # Turns queued but not yet written, per session, and an event set when a session has none
+        self._pending: Dict[str, int] = {}
+        self._drained: Dict[str, asyncio.Event] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    @classmethod
+    def from_env(cls) -> "TranscriptWriter":
+        return cls(
+            max_queue=int(os.getenv("TRANSCRIPT_QUEUE_SIZE", "10000")),
+            batch_size=int(os.getenv("TRANSCRIPT_BATCH_SIZE", "200")),
+            flush_interval=float(os.getenv("TRANSCRIPT_FLUSH_INTERVAL_SECONDS", "0.5")),
+            flush_timeout=float(os.getenv("TRANSCRIPT_FLUSH_TIMEOUT_SECONDS", "10")),
+        )
+
+    def _ensure_started(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="transcript-writer")
+
+    def enqueue(self, turn: dict) -> bool:
+        """Queue a turn for writing. Never blocks; drops the turn if the queue is full."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(turn)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Transcript queue full, dropped turn for session {turn.get('session_id')}")
+            return False
+        session_id = turn.get("session_id")
+        self._pending[session_id] = self._pending.get(session_id, 0) + 1
+        self._drained.setdefault(session_id, asyncio.Event()).clear()
+        return True
+
+    async def flush(self, session_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """Wait until the turns queued so far have been written (or given up on).
+
+        With ``session_id`` only that session's turns are waited for, so one
+        session ending does not wait behind every other live session. Returns
+        False if ``timeout`` (default ``flush_timeout``) ran out first.
+        """
+        if self._queue is None:
+            return True
+        timeout = self.flush_timeout if timeout is None else timeout
+        if session_id is None:
+            waiter = self._queue.join()
+        elif session_id in self._drained:
+            waiter = self._drained[session_id].wait()
+        else:
+            return True
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out after {timeout:.1f}s waiting for interview turns to be written")
+            return False
+
+    def _done(self, batch: List[dict]):
+        for turn in batch:
+            session_id = turn.get("session_id")
+            left = self._pending.get(session_id, 0) - 1
+            if left > 0:
+                self._pending[session_id] = left
+            else:
+                self._pending.pop(session_id, None)
+                event = self._drained.pop(session_id, None)
+                if event:
+                    event.set()
+            self._queue.task_done()
+
+    async def stop(self):
+        await self.flush()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _next_batch(self) -> List[dict]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write(batch)
+            finally:
+                self._done(batch)
+
+    async def _write(self, batch: List[dict]):
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(insert(InterviewTurn), batch)
+                    await db.commit()
+                self.written += len(batch)
+                self.batches += 1
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} interview turns (attempt {attempt}): {str(e)}")
+                await asyncio.sleep(min(2 ** attempt * 0.1, 2))
+        self.failed += len(batch)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+transcript_writer = TranscriptWriter.from_env()
@@ -0,0 +1,324 @@
+# app/tts_cache.py
+"""On-disk cache of synthesized interviewer audio for fixed phrases.
+
+The opening, closing and redirect lines in ``app.interview_prompts`` are said
+word for word in every interview. Their sentences are synthesized once at deploy
+time (``python -m app.tts_cache warm``) and stored as raw 16-bit mono PCM,
+content-addressed by (voice, model, sample rate, text). At runtime each file is
+memory-mapped, and its frames are handed to the output transport as views of the
+mapping, without reading the file into Python or calling Cartesia.
+
+``CachedCartesiaTTSService`` checks the cache for sentences that start a reply,
+before a Cartesia context is open for that reply. A hit is played through the
+service's own ordered audio contexts, and its word timestamps are spread evenly
+so that only words actually played reach the LLM context. Once the reply moves
+on to uncached text, it continues on Cartesia as usual.
+
+Usage (from the service directory, with CARTESIA_API_KEY set):
+    python -m app.tts_cache warm [--sample-rate 24000]
+    python -m app.tts_cache stats
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+import uuid
+from typing import AsyncGenerator, Dict, List, Optional
+
+from loguru import logger
+
+from app import metrics
+
+TTS_CACHE = os.getenv("TTS_CACHE", "1") == "1"
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "tts_cache")
+CARTESIA_VOICE_ID = os.getenv("CARTESIA_VOICE_ID", "bf0a246a-8642-498a-9950-80c35e9276b5")
+CARTESIA_MODEL = os.getenv("CARTESIA_MODEL", "sonic-2")
+DEFAULT_SAMPLE_RATE = 24000  # pipecat's default output rate
+
+# Silence pipecat's audio context task inserts after each context
+_CONTEXT_GAP_SECONDS = 0.5
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def cache_key(voice_id: str, model: str, sample_rate: int, text: str) -> str:
+    raw = "\0".join((voice_id, model, str(sample_rate), normalize(text)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """Content-addressed PCM files under ``directory``, memory-mapped on first use."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._maps: Dict[str, mmap.mmap] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def get(self, voice_id: str, model: str, sample_rate: int, text: str) -> Optional[memoryview]:
+        key = cache_key(voice_id, model, sample_rate, text)
+        with self._lock:
+            mapped = self._maps.get(key)
+            if mapped is None:
+                try:
+                    with open(self._path(key, ".pcm"), "rb") as f:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (FileNotFoundError, ValueError):
+                    # ValueError: empty file, which mmap refuses
+                    return None
+                self._maps[key] = mapped
+        return memoryview(mapped)
+
+    def put(self, voice_id: str, model: str, sample_rate: int, text: str, audio: bytes):
+        key = cache_key(voice_id, model, sample_rate, text)
+        os.makedirs(os.path.dirname(self._path(key, "")), exist_ok=True)
+        meta = {"voice_id": voice_id, "model": model, "sample_rate": sample_rate, "text": normalize(text)}
+        # Write then rename so a running service never maps a partial file
+        for suffix, data in ((".json", json.dumps(meta).encode()), (".pcm", audio)):
+            tmp = self._path(key, f"{suffix}.{uuid.uuid4().hex}.tmp")
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key, suffix))
+
+    def contains(self, voice_id: str, model: str, sample_rate: int, text: str) -> bool:
+        return os.path.exists(self._path(cache_key(voice_id, model, sample_rate, text), ".pcm"))
+
+    def record_lookup(self, hit: bool, saved_seconds: float = 0.0):
+        if hit:
+            self.hits += 1
+            self.saved_seconds += saved_seconds
+            metrics.TTS_CACHE_SAVED_SECONDS.inc(saved_seconds)
+        else:
+            self.misses += 1
+        metrics.TTS_CACHE_LOOKUPS.labels(result="hit" if hit else "miss").inc()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries_mapped": len(self._maps),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_seconds": round(self.saved_seconds, 3),
+        }
+
+
+audio_cache = AudioCache(TTS_CACHE_DIR)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text the way pipecat's TTS text aggregator does, so keys match."""
+    from pipecat.utils.string import match_endofsentence
+
+    sentences = []
+    rest = text
+    while rest.strip():
+        end = match_endofsentence(rest)
+        if not end:
+            sentences.append(rest)
+            break
+        sentences.append(rest[:end])
+        rest = rest[end:]
+    return [normalize(s) for s in sentences if s.strip()]
+
+
+def fixed_sentences() -> List[str]:
+    """Cacheable sentences of the interviewer's fixed lines (no placeholders)."""
+    from app.interview_prompts import FIXED_LINES
+
+    sentences = []
+    for line in FIXED_LINES:
+        for sentence in split_sentences(line):
+            if "[" not in sentence and sentence not in sentences:
+                sentences.append(sentence)
+    return sentences
+
+
+def _cached_cartesia_service():
+    # Defined lazily so this module (and the warm CLI) don't need the voice stack
+    from pipecat.frames.frames import Frame, StartInterruptionFrame, TTSAudioRawFrame, TTSStartedFrame
+    from pipecat.processors.frame_processor import FrameDirection
+    from pipecat.services.cartesia.tts import CartesiaTTSService
+
+    # Recent Cartesia time to first audio, shared by sessions: what a hit saves
+    ttfb_estimate = {"seconds": 0.0}
+
+    class CachedCartesiaTTSService(CartesiaTTSService):
+        """Cartesia TTS that plays cached audio for fixed sentences at the start of a reply."""
+
+        def __init__(self, *, cache: AudioCache = audio_cache, **kwargs):
+            super().__init__(**kwargs)
+            self._cache = cache
+            self._cached_context_id: Optional[str] = None
+            # Seconds of cached audio played in the current reply so far
+            self._cached_seconds = 0.0
+            # Shift applied to Cartesia word timestamps that follow cached audio
+            self._timestamp_offset = 0.0
+            self._ttfb_started: Optional[float] = None
+
+        async def start_ttfb_metrics(self):
+            self._ttfb_started = time.perf_counter()
+            await super().start_ttfb_metrics()
+
+        async def stop_ttfb_metrics(self):
+            if self._ttfb_started is not None:
+                sample = time.perf_counter() - self._ttfb_started
+                previous = ttfb_estimate["seconds"]
+                ttfb_estimate["seconds"] = sample if not previous else 0.8 * previous + 0.2 * sample
+                self._ttfb_started = None
+            await super().stop_ttfb_metrics()
+
+        def _can_use_cache(self) -> bool:
+            # Only before Cartesia has a context (and word timing) open for this reply
+            if self._cached_context_id is not None:
+                return True
+            return self._context_id is None and self._initial_word_timestamp == -1
+
+        async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+            if self._can_use_cache():
+                audio = self._cache.get(self._voice_id, self.model_name, self.sample_rate, text)
+                self._cache.record_lookup(audio is not None, ttfb_estimate["seconds"])
+                if audio is not None:
+                    logger.debug(f"{self}: Cached TTS [{text}]")
+                    if self._cached_context_id is None:
+                        yield TTSStartedFrame()
+                        self._cached_context_id = str(uuid.uuid4())
+                        await self.create_audio_context(self._cached_context_id)
+                        self.start_word_timestamps()
+                    await self._play_cached(text, audio)
+                    yield None
+                    return
+            await self._close_cached_context()
+            async for frame in super().run_tts(text):
+                yield frame
+
+        async def _play_cached(self, text: str, audio: memoryview):
+            seconds = len(audio) / (2 * self.sample_rate)
+            words = text.split()
+            step = seconds / len(words) if words else 0.0
+            await self.add_word_timestamps(
+                [(word, self._cached_seconds + i * step) for i, word in enumerate(words)]
+            )
+            await self.append_to_audio_context(
+                self._cached_context_id, TTSAudioRawFrame(audio=audio, sample_rate=self.sample_rate, num_channels=1)
+            )
+            self._cached_seconds += seconds
+
+        async def _close_cached_context(self):
+            """End cached playback; anything after it plays once this audio (and the gap) is done."""
+            if self._cached_context_id is None:
+                return
+            await self.remove_audio_context(self._cached_context_id)
+            self._cached_context_id = None
+            self._timestamp_offset = self._cached_seconds + _CONTEXT_GAP_SECONDS
+            self._cached_seconds = 0.0
+
+        async def add_word_timestamps(self, word_times):
+            if self._timestamp_offset and self._cached_context_id is None:
+                word_times = [
+                    (word, ts if word in ("TTSStoppedFrame", "Reset") and ts == 0 else ts + self._timestamp_offset)
+                    for word, ts in word_times
+                ]
+            await super().add_word_timestamps(word_times)
+            if any(word == "Reset" and ts == 0 for word, ts in word_times):
+                self._timestamp_offset = 0.0
+
+        async def flush_audio(self):
+            if self._cached_context_id is not None and self._context_id is None:
+                # The whole reply came from the cache: end it the way Cartesia's "done" would
+                await self._close_cached_context()
+                self._timestamp_offset = 0.0
+                await self.add_word_timestamps([("TTSStoppedFrame", 0), ("Reset", 0)])
+                return
+            await super().flush_audio()
+
+        async def _handle_interruption(self, frame: StartInterruptionFrame, direction: FrameDirection):
+            await super()._handle_interruption(frame, direction)
+            # The audio contexts were torn down with the interruption
+            self._cached_context_id = None
+            self._cached_seconds = 0.0
+            self._timestamp_offset = 0.0
+
+    return CachedCartesiaTTSService
+
+
+def create_tts_service(**kwargs):
+    """Cartesia TTS for the interviewer voice, cache-backed when ``TTS_CACHE`` is on."""
+    from pipecat.services.cartesia.tts import CartesiaTTSService
+
+    kwargs.setdefault("voice_id", CARTESIA_VOICE_ID)
+    kwargs.setdefault("model", CARTESIA_MODEL)
+    if TTS_CACHE:
+        return _cached_cartesia_service()(**kwargs)
+    return CartesiaTTSService(**kwargs)
+
+
+async def synthesize(client, api_key: str, text: str, sample_rate: int) -> bytes:
+    response = await client.post(
+        "https://api.cartesia.ai/tts/bytes",
+        headers={"Cartesia-Version": "2024-11-13", "X-API-Key": api_key},
+        json={
+            "model_id": CARTESIA_MODEL,
+            "transcript": text,
+            "voice": {"mode": "id", "id": CARTESIA_VOICE_ID},
+            "output_format": {"container": "raw", "encoding": "pcm_s16le", "sample_rate": sample_rate},
+            "language": "en",
+        },
+    )
+    response.raise_for_status()
+    return response.content
+
+
+async def warm(sample_rate: int, force: bool = False):
+    import httpx
+
+    api_key = os.getenv("CARTESIA_API_KEY")
+    if not api_key:
+        raise SystemExit("CARTESIA_API_KEY is not set")
+    sentences = fixed_sentences()
+    async with httpx.AsyncClient(timeout=30) as client:
+        for sentence in sentences:
+            if not force and audio_cache.contains(CARTESIA_VOICE_ID, CARTESIA_MODEL, sample_rate, sentence):
+                print(f"cached   {sentence}")
+                continue
+            start = time.perf_counter()
+            audio = await synthesize(client, api_key, sentence, sample_rate)
+            audio_cache.put(CARTESIA_VOICE_ID, CARTESIA_MODEL, sample_rate, sentence, audio)
+            print(f"warmed   {sentence}  ({len(audio) / (2 * sample_rate):.1f}s audio, {time.perf_counter() - start:.2f}s)")
+    print(f"{len(sentences)} sentences in {os.path.abspath(TTS_CACHE_DIR)}")
+
+
+def print_stats(sample_rate: int):
+    for sentence in fixed_sentences():
+        present = audio_cache.contains(CARTESIA_VOICE_ID, CARTESIA_MODEL, sample_rate, sentence)
+        print(f"{'cached ' if present else 'MISSING'}  {sentence}")
+
+
+def main():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("warm", "stats"))
+    parser.add_argument("--sample-rate", type=int, default=DEFAULT_SAMPLE_RATE)
+    parser.add_argument("--force", action="store_true", help="re-synthesize sentences already cached")
+    args = parser.parse_args()
+    if args.command == "warm":
+        asyncio.run(warm(args.sample_rate, args.force))
+    else:
+        print_stats(args.sample_rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# app/user_cache.py
+"""In-process cache of authenticated users.
+
+Every authenticated request resolves the token's user; caching the resulting
+``UserOut`` by user id for a short TTL saves a DB round trip per request.
+ORM updates and deletes of a user drop its entry immediately; changes made by
+other processes are visible once the TTL expires.
+"""
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from sqlalchemy import event
+
+from app.models import User
+
+
+class TTLCache:
+    """Bounded LRU whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+user_cache = TTLCache(
+    max_entries=int(os.getenv("USER_CACHE_SIZE", "4096")),
+    ttl=float(os.getenv("USER_CACHE_TTL_SECONDS", "60")),
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_user_after_change(mapper, connection, target):
+    user_cache.invalidate(target.id)
@@ -0,0 +1,265 @@
+# app/vad.py
+"""Process-wide Silero VAD model.
+
+Loading the Silero ONNX model is the slow part of starting an interview, so it
+is loaded once (at API startup) and every session borrows it. The ONNX
+inference session is shared and thread-safe; the recurrent state and audio
+context that Silero keeps between frames are copied per session so that
+concurrent interviews never see each other's state.
+
+With ``VAD_BATCHING=1`` sessions don't run inference themselves at all: their
+frames are handed to a single :class:`BatchedVADEngine` thread that runs one
+batched ONNX call for every session that has a frame waiting.
+"""
+import concurrent.futures
+import copy
+import os
+import queue
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+from loguru import logger
+from pipecat.audio.vad.silero import SileroOnnxModel, SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+
+VAD_BATCHING = os.getenv("VAD_BATCHING", "0") == "1"
+VAD_BATCH_MAX_SIZE = int(os.getenv("VAD_BATCH_MAX_SIZE", "64"))
+VAD_BATCH_WAIT_MS = float(os.getenv("VAD_BATCH_WAIT_MS", "1"))
+
+# Silero's recurrent state drifts over long streams; pipecat resets it this often
+_MODEL_RESET_STATES_TIME = 5.0
+
+_shared_model: Optional[SileroOnnxModel] = None
+_engine: Optional["BatchedVADEngine"] = None
+_load_lock = threading.Lock()
+
+_metrics = {
+    "model_load_seconds": None,
+    "sessions": 0,
+    "setup_seconds_total": 0.0,
+    "setup_seconds_max": 0.0,
+}
+
+
+class SharedSileroVADAnalyzer(SileroVADAnalyzer):
+    """Silero analyzer that reuses an already loaded model.
+
+    Only the per-stream state is fresh; the ONNX session is shared.
+    """
+
+    def __init__(
+        self,
+        model: SileroOnnxModel,
+        *,
+        sample_rate: Optional[int] = None,
+        params: Optional[VADParams] = None,
+    ):
+        # Skip SileroVADAnalyzer.__init__, which would load the model again
+        VADAnalyzer.__init__(self, sample_rate=sample_rate, params=params)
+        self._model = copy.copy(model)
+        self._model.reset_states()
+        self._last_reset_time = 0
+
+
+class _VADStream:
+    """Recurrent state of one session's audio stream."""
+
+    def __init__(self):
+        self.reset(0)
+
+    def reset(self, sample_rate: int):
+        context_size = 64 if sample_rate == 16000 else 32
+        self.sample_rate = sample_rate
+        self.state = np.zeros((2, 1, 128), dtype=np.float32)
+        self.context = np.zeros(context_size, dtype=np.float32)
+
+
+class _VADRequest:
+    __slots__ = ("stream", "audio", "sample_rate", "future")
+
+    def __init__(self, stream: _VADStream, audio: np.ndarray, sample_rate: int):
+        self.stream = stream
+        self.audio = audio
+        self.sample_rate = sample_rate
+        self.future = concurrent.futures.Future()
+
+
+class BatchedVADEngine:
+    """Runs Silero inference for all live sessions on one worker thread.
+
+    Each session submits a frame and blocks (in the transport's executor
+    thread, never on the event loop) until its confidence comes back. The
+    worker drains everything that is queued, stacks it into a single
+    ``(batch, samples)`` input with the matching stacked recurrent state, runs
+    one ONNX call and fans the results back out.
+    """
+
+    def __init__(self, model: SileroOnnxModel, max_batch: int, max_wait_ms: float):
+        self._session = model.session
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._queue: "queue.SimpleQueue[_VADRequest]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="vad-batch", daemon=True)
+        self.batches = 0
+        self.frames = 0
+        self._thread.start()
+
+    def infer(self, stream: _VADStream, audio: np.ndarray, sample_rate: int) -> float:
+        request = _VADRequest(stream, audio, sample_rate)
+        self._queue.put(request)
+        return request.future.result()
+
+    def _collect(self) -> List[_VADRequest]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._max_wait
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            by_rate = {}
+            for request in batch:
+                by_rate.setdefault(request.sample_rate, []).append(request)
+            for sample_rate, requests in by_rate.items():
+                try:
+                    self._infer(sample_rate, requests)
+                except Exception as e:
+                    logger.error(f"Batched VAD inference failed: {e}")
+                    for request in requests:
+                        if not request.future.done():
+                            request.future.set_exception(e)
+
+    def _infer(self, sample_rate: int, requests: List[_VADRequest]):
+        for request in requests:
+            if request.stream.sample_rate != sample_rate:
+                request.stream.reset(sample_rate)
+
+        x = np.stack([np.concatenate((r.stream.context, r.audio)) for r in requests])
+        state = np.concatenate([r.stream.state for r in requests], axis=1)
+        out, new_state = self._session.run(
+            None,
+            {"input": x, "state": state, "sr": np.array(sample_rate, dtype=np.int64)},
+        )
+
+        context_size = requests[0].stream.context.shape[0]
+        for i, request in enumerate(requests):
+            request.stream.state = new_state[:, i : i + 1, :]
+            request.stream.context = x[i, -context_size:]
+            request.future.set_result(float(out[i][0]))
+
+        self.batches += 1
+        self.frames += len(requests)
+
+
+class BatchedSileroVADAnalyzer(VADAnalyzer):
+    """Per-session analyzer that delegates inference to the batch engine."""
+
+    def __init__(
+        self,
+        engine: BatchedVADEngine,
+        *,
+        sample_rate: Optional[int] = None,
+        params: Optional[VADParams] = None,
+    ):
+        super().__init__(sample_rate=sample_rate, params=params)
+        self._engine = engine
+        self._stream = _VADStream()
+        self._last_reset_time = 0
+
+    def set_sample_rate(self, sample_rate: int):
+        if sample_rate not in (8000, 16000):
+            raise ValueError(f"Silero VAD sample rate needs to be 16000 or 8000 (sample rate: {sample_rate})")
+        super().set_sample_rate(sample_rate)
+
+    def num_frames_required(self) -> int:
+        return 512 if self.sample_rate == 16000 else 256
+
+    def voice_confidence(self, buffer) -> float:
+        try:
+            audio = np.frombuffer(buffer, np.int16).astype(np.float32) / 32768.0
+            confidence = self._engine.infer(self._stream, audio, self.sample_rate)
+
+            now = time.time()
+            if now - self._last_reset_time >= _MODEL_RESET_STATES_TIME:
+                self._stream.reset(self.sample_rate)
+                self._last_reset_time = now
+
+            return confidence
+        except Exception as e:
+            logger.error(f"Error analyzing audio with batched Silero VAD: {e}")
+            return 0
+
+
+def load_vad_model() -> float:
+    """Load the shared model if needed. Returns the load time in seconds."""
+    global _shared_model
+    with _load_lock:
+        if _shared_model is not None:
+            return _metrics["model_load_seconds"] or 0.0
+
+        logger.info("Loading Silero VAD model...")
+        start = time.perf_counter()
+        _shared_model = SileroVADAnalyzer()._model
+        elapsed = time.perf_counter() - start
+        _metrics["model_load_seconds"] = elapsed
+        logger.info(f"✅ Silero VAD model loaded in {elapsed:.2f}s")
+        return elapsed
+
+
+def get_batch_engine() -> BatchedVADEngine:
+    """Start (once) and return the cross-session batch engine."""
+    global _engine
+    if _shared_model is None:
+        load_vad_model()
+    with _load_lock:
+        if _engine is None:
+            _engine = BatchedVADEngine(_shared_model, VAD_BATCH_MAX_SIZE, VAD_BATCH_WAIT_MS)
+            logger.info("Started batched VAD engine")
+        return _engine
+
+
+def create_vad_analyzer(
+    params: Optional[VADParams] = None, batched: Optional[bool] = None
+) -> VADAnalyzer:
+    """Create a per-session analyzer backed by the shared model."""
+    if _shared_model is None:
+        logger.warning("Silero VAD model was not preloaded, loading it now")
+        load_vad_model()
+
+    batched = VAD_BATCHING if batched is None else batched
+    start = time.perf_counter()
+    if batched:
+        analyzer = BatchedSileroVADAnalyzer(get_batch_engine(), params=params)
+    else:
+        analyzer = SharedSileroVADAnalyzer(_shared_model, params=params)
+    elapsed = time.perf_counter() - start
+
+    _metrics["sessions"] += 1
+    _metrics["setup_seconds_total"] += elapsed
+    _metrics["setup_seconds_max"] = max(_metrics["setup_seconds_max"], elapsed)
+    return analyzer
+
+
+def stats() -> dict:
+    sessions = _metrics["sessions"]
+    return {
+        "loaded": _shared_model is not None,
+        "load_seconds": _metrics["model_load_seconds"],
+        "sessions": sessions,
+        "setup_ms_avg": (_metrics["setup_seconds_total"] / sessions * 1000) if sessions else 0.0,
+        "setup_ms_max": _metrics["setup_seconds_max"] * 1000,
+        "batched": VAD_BATCHING,
+        "batch_frames": _engine.frames if _engine else 0,
+        "batch_avg_size": (_engine.frames / _engine.batches) if _engine and _engine.batches else 0.0,
+    }
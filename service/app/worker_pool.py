@@ -0,0 +1,335 @@
+# app/worker_pool.py
+"""Interview bots in worker processes.
+
+With ``BOT_WORKERS`` set, the API process only admits offers (session_manager)
+and relays them; each ``bot()`` runs in one of a fixed pool of worker
+processes, so audio, VAD and LLM streaming never share an event loop (or a
+core) with the REST API. A worker owns the whole session: it answers the SDP
+offer itself, since the peer connection's media has to live in the process
+running the pipeline.
+
+New sessions go to the worker with the fewest live sessions. When a worker
+dies, its sessions are lost, their slots are freed and a replacement is
+started; the API and the other workers carry on.
+
+Messages on each worker's pipe are plain dicts:
+  API -> worker   {"op": "connect", "id", "offer", "type", "job_id", "candidate_id"}
+                  {"op": "cancel", "id"}, {"op": "stop"}
+  worker -> API   {"event": "answer", "id", "answer"}, {"event": "error", "id", "message"}
+                  {"event": "ended", "id"}
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+import uuid
+from typing import Callable, Dict, List, Optional, Set
+
+from loguru import logger
+
+from app import metrics
+from app.session_manager import session_manager
+
+RESTART_DELAY_SECONDS = 1.0
+
+
+def _workers_from_env() -> int:
+    value = os.getenv("BOT_WORKERS", "0").strip().lower()
+    if value == "auto":
+        return os.cpu_count() or 1
+    return int(value)
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker handling a session exited before answering its offer."""
+
+
+class _Worker:
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.sessions: Set[str] = set()
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.restarts = 0
+
+    @property
+    def load(self) -> int:
+        return len(self.sessions) + len(self.pending)
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+
+class WorkerPool:
+    """Runs interview sessions in ``size`` worker processes."""
+
+    def __init__(
+        self,
+        size: int,
+        connect_timeout: float,
+        on_session_end: Callable[[], None],
+    ):
+        self.size = size
+        self.connect_timeout = connect_timeout
+        self._on_session_end = on_session_end
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers: List[_Worker] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+
+    @classmethod
+    def from_env(cls, on_session_end: Callable[[], None]) -> "WorkerPool":
+        return cls(
+            size=_workers_from_env(),
+            connect_timeout=float(os.getenv("BOT_WORKER_CONNECT_TIMEOUT_SECONDS", "20")),
+            on_session_end=on_session_end,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        # Before any spawn: workers pick the shared metrics directory up from the environment
+        metrics.share_with_workers()
+        self._workers = [_Worker(i) for i in range(self.size)]
+        for worker in self._workers:
+            self._spawn(worker)
+        logger.info(f"Started {self.size} bot worker processes")
+
+    async def stop(self, timeout: float = 10.0):
+        """Ask workers to end their sessions and exit; kill any that don't."""
+        self._stopping = True
+        for worker in self._workers:
+            self._send(worker, {"op": "stop"})
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            await asyncio.to_thread(worker.process.join, timeout)
+            if worker.process.is_alive():
+                logger.warning(f"Bot worker {worker.index} did not exit, terminating")
+                worker.process.terminate()
+
+    async def start_session(
+        self,
+        offer: str,
+        sdp_type: str,
+        job_id: Optional[str],
+        candidate_id: Optional[int],
+    ) -> dict:
+        """Hand an offer to the least-loaded worker and return its SDP answer.
+
+        The caller's session slot is released through ``on_session_end`` when
+        the session later ends (or its worker dies); if this raises, no session
+        was started and the caller still owns the slot.
+        """
+        workers = [w for w in self._workers if w.alive]
+        if not workers:
+            raise WorkerCrashed("No bot worker is running")
+        worker = min(workers, key=lambda w: w.load)
+
+        session_id = uuid.uuid4().hex
+        future = self._loop.create_future()
+        worker.pending[session_id] = future
+        self._send(worker, {
+            "op": "connect",
+            "id": session_id,
+            "offer": offer,
+            "type": sdp_type,
+            "job_id": job_id,
+            "candidate_id": candidate_id,
+        })
+        try:
+            return await asyncio.wait_for(future, timeout=self.connect_timeout)
+        except BaseException:
+            # Timed out or the client went away: the answer is no longer wanted.
+            # If it already arrived, the caller still owns the slot, so the
+            # session's "ended" must not release it a second time.
+            worker.pending.pop(session_id, None)
+            worker.sessions.discard(session_id)
+            self._send(worker, {"op": "cancel", "id": session_id})
+            raise
+
+    def stats(self) -> List[dict]:
+        return [
+            {
+                "index": w.index,
+                "pid": w.process.pid if w.process else None,
+                "alive": w.alive,
+                "sessions": len(w.sessions),
+                "restarts": w.restarts,
+            }
+            for w in self._workers
+        ]
+
+    # --- internals (event loop thread unless noted) ---
+
+    def _spawn(self, worker: _Worker):
+        if self._stopping:
+            return
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main, args=(child_conn, worker.index), name=f"bot-worker-{worker.index}", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker.process = process
+        worker.conn = parent_conn
+        threading.Thread(
+            target=self._read, args=(worker, process, parent_conn), name=f"bot-worker-{worker.index}-reader", daemon=True
+        ).start()
+
+    def _send(self, worker: _Worker, message: dict):
+        try:
+            worker.conn.send(message)
+        except (OSError, ValueError, AttributeError):
+            # Pipe already gone; the reader thread reports the exit
+            pass
+
+    def _read(self, worker: _Worker, process, conn):
+        """Reader thread: forward one worker's messages to the event loop."""
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            self._loop.call_soon_threadsafe(self._on_message, worker, message)
+        # Reap the process here so its exit code is known without blocking the loop
+        process.join(timeout=5)
+        self._loop.call_soon_threadsafe(self._on_exit, worker, conn)
+
+    def _on_message(self, worker: _Worker, message: dict):
+        event, session_id = message.get("event"), message.get("id")
+        if event == "answer":
+            future = worker.pending.pop(session_id, None)
+            if future is None or future.done():
+                # Nobody is waiting for this answer any more (cancel already sent)
+                return
+            worker.sessions.add(session_id)
+            future.set_result(message["answer"])
+        elif event == "error":
+            future = worker.pending.pop(session_id, None)
+            if future is not None and not future.done():
+                future.set_exception(RuntimeError(message.get("message", "session failed to start")))
+        elif event == "ended":
+            if session_id in worker.sessions:
+                worker.sessions.discard(session_id)
+                self._on_session_end()
+
+    def _on_exit(self, worker: _Worker, conn):
+        if conn is not worker.conn:
+            return  # a previous incarnation's reader finishing late
+        conn.close()
+        if worker.process is not None:
+            metrics.mark_worker_dead(worker.process.pid)
+        if self._stopping:
+            return
+
+        exitcode = worker.process.exitcode if worker.process else None
+        logger.error(
+            f"Bot worker {worker.index} exited (code {exitcode}) with "
+            f"{len(worker.sessions)} live sessions; restarting it"
+        )
+        for future in worker.pending.values():
+            if not future.done():
+                future.set_exception(WorkerCrashed(f"Bot worker {worker.index} exited"))
+        worker.pending.clear()
+        lost = len(worker.sessions)
+        worker.sessions.clear()
+        for _ in range(lost):
+            self._on_session_end()
+
+        # Short pause so a worker that fails on startup doesn't spin
+        worker.restarts += 1
+        self._loop.call_later(RESTART_DELAY_SECONDS, self._spawn, worker)
+
+
+def _worker_main(conn, index: int):
+    """Entry point of a worker process."""
+    asyncio.run(_serve(conn, index))
+
+
+async def _serve(conn, index: int):
+    from app import boot
+
+    # Voice stack is only imported in workers, never in the API process
+    boot.mark("imports")
+    await asyncio.to_thread(boot.load_voice_stack)
+    boot.log_report(f"Bot worker {index} (pid {os.getpid()})")
+
+    from pipecat.runner.types import SmallWebRTCRunnerArguments
+    from pipecat.transports.network.webrtc_connection import SmallWebRTCConnection
+
+    from app.bot import bot
+    from app.transcript_writer import transcript_writer
+
+    loop = asyncio.get_running_loop()
+    inbox: asyncio.Queue = asyncio.Queue()
+
+    def read():
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                # API process is gone; wind down
+                message = {"op": "stop"}
+            loop.call_soon_threadsafe(inbox.put_nowait, message)
+            if message.get("op") == "stop":
+                return
+
+    threading.Thread(target=read, name="bot-worker-reader", daemon=True).start()
+
+    def send(message: dict):
+        try:
+            conn.send(message)
+        except (OSError, ValueError):
+            pass
+
+    sessions: Dict[str, asyncio.Task] = {}
+
+    async def run_session(message: dict):
+        session_id = message["id"]
+        try:
+            webrtc_connection = SmallWebRTCConnection()
+            await webrtc_connection.initialize(sdp=message["offer"], type=message["type"])
+            answer = webrtc_connection.get_answer()
+        except Exception as e:
+            logger.error(f"Error connecting: {e}")
+            send({"event": "error", "id": session_id, "message": str(e)})
+            return
+        send({"event": "answer", "id": session_id, "answer": answer})
+        try:
+            runner_args = SmallWebRTCRunnerArguments(webrtc_connection=webrtc_connection)
+            await bot(runner_args, message["job_id"], message["candidate_id"])
+        except Exception as e:
+            logger.error(f"Interview session failed: {e}")
+        finally:
+            send({"event": "ended", "id": session_id})
+
+    while True:
+        message = await inbox.get()
+        op = message.get("op")
+        if op == "connect":
+            task = asyncio.create_task(run_session(message))
+            sessions[message["id"]] = task
+            task.add_done_callback(lambda _, session_id=message["id"]: sessions.pop(session_id, None))
+        elif op == "cancel":
+            task = sessions.get(message["id"])
+            if task:
+                task.cancel()
+        elif op == "stop":
+            break
+
+    tasks = list(sessions.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await transcript_writer.stop()
+    logger.info(f"Bot worker {index} stopped")
+
+
+worker_pool = WorkerPool.from_env(on_session_end=session_manager.finish)
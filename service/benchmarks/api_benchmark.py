@@ -0,0 +1,315 @@
+# benchmarks/api_benchmark.py
+"""Latency, throughput and queries per request of the REST API.
+
+Seeds the database in DATABASE_URL with realistic volumes (``--seed``), then
+drives the auth, JD, candidate, dashboard and search endpoints concurrently through
+the FastAPI app in-process (httpx ASGI transport, no server or network). For
+every scenario it records p50/p95/p99 latency, requests per second and SQL
+statements per request, and writes everything to a JSON file.
+
+Seeded rows are tagged (titles and emails containing ``bench``) so
+``--reset`` can remove them; use a dedicated database anyway. Run the suite
+before and after a change to ``crud.py`` and pass the old file to
+``--compare`` to print p95 and query-count deltas.
+
+Usage (from the service directory):
+    python -m benchmarks.api_benchmark --seed --jds 1000 --candidates 100000
+    python -m benchmarks.api_benchmark --output after.json --compare before.json
+"""
+import argparse
+import asyncio
+import contextvars
+import datetime
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+
+import httpx  # noqa: E402
+from loguru import logger  # noqa: E402
+from sqlalchemy import delete, event, select  # noqa: E402
+
+from app.auth import get_password_hash  # noqa: E402
+from app.db import connection  # noqa: E402
+from app.models import (  # noqa: E402
+    Base, Candidate, Interview, InterviewStatus, JobDescription, User, create_missing_indexes,
+    install_interview_stats, install_skill_index,
+)
+
+ADMIN_EMAIL = "bench-admin@bench.example"
+ADMIN_PASSWORD = "benchmark"
+SEED_EMAIL_DOMAIN = "@bench.example"
+SEED_TITLE_PREFIX = "bench: "
+# Share of seeded interviews per status
+STATUS_MIX = [
+    (InterviewStatus.pending, 0.40),
+    (InterviewStatus.scheduled, 0.30),
+    (InterviewStatus.ongoing, 0.05),
+    (InterviewStatus.completed, 0.25),
+]
+
+# Seeded JD skills, also used as search terms
+SKILLS = [
+    "Python", "SQL", "FastAPI", "Postgres", "AWS", "Kubernetes", "Docker", "React",
+    "TypeScript", "Go", "Kafka", "Redis", "Terraform", "Java", "Spark", "GraphQL",
+]
+
+_query_count = contextvars.ContextVar("query_count", default=None)
+
+
+@event.listens_for(connection.engine.sync_engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def chunks(rows, size):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+# --- Seeding ---
+async def reset():
+    async with connection.engine.begin() as conn:
+        # The counter triggers take the deleted rows off the dashboard counts
+        await conn.run_sync(install_interview_stats)
+        await conn.execute(delete(JobDescription.__table__).where(JobDescription.title.startswith(SEED_TITLE_PREFIX)))
+        await conn.execute(delete(User.__table__).where(User.email.endswith(SEED_EMAIL_DOMAIN)))
+
+
+async def seed(jds: int, candidates: int):
+    """Bulk-load JDs, candidate users, candidates and interviews with Core inserts."""
+    rng = random.Random(42)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    password = get_password_hash(ADMIN_PASSWORD)
+    run = f"{int(time.time())}"
+
+    async with connection.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_missing_indexes)
+        # Seeded JDs are indexed for skill matching, and every seeded row is
+        # counted on the dashboard, by the triggers
+        await conn.run_sync(install_skill_index)
+        await conn.run_sync(install_interview_stats)
+
+        jd_rows = [
+            {
+                "title": f"{SEED_TITLE_PREFIX}Engineer {n}",
+                "location": rng.choice(["Pune", "Bengaluru", "Remote"]),
+                "opening": rng.randint(1, 10),
+                "required_skills": ", ".join(rng.sample(SKILLS, 3)),
+                "preferred_skills": ", ".join(rng.sample(SKILLS, 2)),
+                "min_experience": rng.randint(0, 8),
+                "responsibilities": "Build and run backend services.",
+            }
+            for n in range(jds)
+        ]
+        jd_ids = []
+        for batch in chunks(jd_rows, 2000):
+            result = await conn.execute(JobDescription.__table__.insert().values(batch).returning(JobDescription.__table__.c.id))
+            jd_ids.extend(result.scalars())
+
+        user_rows = [
+            {"user_email": f"bench-{run}-{n}{SEED_EMAIL_DOMAIN}", "full_name": f"Candidate {n}", "password": password, "role": "candidate"}
+            for n in range(candidates)
+        ]
+        user_ids = []
+        for batch in chunks(user_rows, 5000):
+            result = await conn.execute(User.__table__.insert().values(batch).returning(User.__table__.c.user_id))
+            user_ids.extend(result.scalars())
+
+        candidate_rows = [
+            {"user_id": user_id, "jd_id": rng.choice(jd_ids), "applied_at": (now - datetime.timedelta(days=rng.uniform(0, 180))).replace(tzinfo=None)}
+            for user_id in user_ids
+        ]
+        seeded = []
+        for batch in chunks(candidate_rows, 5000):
+            result = await conn.execute(
+                Candidate.__table__.insert().values(batch).returning(Candidate.__table__.c.id, Candidate.__table__.c.jd_id)
+            )
+            seeded.extend(result.all())
+
+        statuses, weights = zip(*STATUS_MIX)
+        interview_rows = []
+        for candidate_id, jd_id in seeded:
+            status = rng.choices(statuses, weights)[0]
+            start = now + datetime.timedelta(days=rng.uniform(-30, 30))
+            interview_rows.append({
+                "candidate_id": candidate_id,
+                "jd_id": jd_id,
+                "status": status.value,
+                "start_time": start if status != InterviewStatus.pending else None,
+                "end_time": start + datetime.timedelta(minutes=45) if status == InterviewStatus.completed else None,
+                "interview_qa": "[INTERVIEWER]: Tell me about yourself.\n[CANDIDATE]: ..." if status == InterviewStatus.completed else None,
+            })
+        for batch in chunks(interview_rows, 4000):
+            await conn.execute(Interview.__table__.insert().values(batch))
+
+        admin = await conn.scalar(select(User.__table__.c.user_id).where(User.email == ADMIN_EMAIL))
+        if admin is None:
+            await conn.execute(User.__table__.insert().values(
+                user_email=ADMIN_EMAIL, full_name="Benchmark Admin", password=password, role="admin"
+            ))
+
+
+# --- Load ---
+async def sample_ids(limit=200):
+    async with connection.AsyncSessionLocal() as db:
+        jd_ids = list((await db.execute(select(JobDescription.id).limit(limit))).scalars())
+        candidate_ids = list((await db.execute(select(Candidate.id).limit(limit))).scalars())
+    return jd_ids, candidate_ids
+
+
+def scenarios(jd_ids, candidate_ids):
+    """name -> function(rng) returning (method, path, json body)."""
+    return {
+        "auth_login": lambda rng: ("POST", "/api/auth/login", {"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}),
+        "auth_me": lambda rng: ("GET", "/api/auth/me", None),
+        "jd_list": lambda rng: ("GET", "/api/jd/?limit=50", None),
+        "jd_get": lambda rng: ("GET", f"/api/jd/{rng.choice(jd_ids)}", None),
+        "jd_count": lambda rng: ("GET", "/api/jd/count", None),
+        "candidates_list": lambda rng: ("GET", "/api/candidates/?limit=50", None),
+        "candidates_by_status": lambda rng: ("GET", "/api/candidates/?limit=50&status=scheduled", None),
+        "candidates_by_job": lambda rng: ("GET", f"/api/candidates/by-job?jd_id={rng.choice(jd_ids)}&limit=50", None),
+        "candidate_get": lambda rng: ("GET", f"/api/candidates/id/{rng.choice(candidate_ids)}", None),
+        "dashboard_stats": lambda rng: ("GET", "/api/dashboard/stats", None),
+        "search_jds": lambda rng: ("GET", f"/api/search/jds?q={rng.choice(SKILLS)}+{rng.choice(SKILLS)}&limit=20", None),
+        "search_candidates": lambda rng: ("GET", f"/api/search/candidates?q=candidate+{rng.randint(1, 9999)}&limit=20", None),
+    }
+
+
+async def run_scenario(client, name, make_request, requests, concurrency, token) -> dict:
+    rng = random.Random(name)
+    latencies, queries = [], []
+    errors = 0
+    remaining = iter(range(requests))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            method, path, body = make_request(rng)
+            counter = [0]
+            _query_count.set(counter)
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            queries.append(counter[0])
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    # Each worker is its own task, so it gets its own query counter context
+    await asyncio.gather(*(asyncio.create_task(worker()) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "scenario": name,
+        "requests": len(latencies),
+        "errors": errors,
+        "concurrency": concurrency,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_ms_p50": percentile(latencies, 50) * 1000,
+        "latency_ms_p95": percentile(latencies, 95) * 1000,
+        "latency_ms_p99": percentile(latencies, 99) * 1000,
+        "queries_per_request_avg": sum(queries) / len(queries) if queries else 0.0,
+        "queries_per_request_max": max(queries) if queries else 0,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {r["scenario"]: r for r in json.load(f)["results"]}
+    print(f"\ncompared with {baseline_path}:")
+    for r in results:
+        old = baseline.get(r["scenario"])
+        if not old:
+            continue
+        p95 = r["latency_ms_p95"] - old["latency_ms_p95"]
+        q = r["queries_per_request_avg"] - old["queries_per_request_avg"]
+        print(f"{r['scenario']:22s} p95 {p95:+8.1f}ms  queries/request {q:+5.1f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", action="store_true", help="load test data before running")
+    parser.add_argument("--reset", action="store_true", help="delete previously seeded data first")
+    parser.add_argument("--jds", type=int, default=1000)
+    parser.add_argument("--candidates", type=int, default=100000)
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--scenarios", help="comma-separated subset to run")
+    parser.add_argument("--output", default="api_benchmark.json")
+    parser.add_argument("--compare", help="earlier results file to diff against")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    if args.reset:
+        await reset()
+    if args.seed:
+        start = time.perf_counter()
+        await seed(args.jds, args.candidates)
+        print(f"seeded {args.jds} JDs and {args.candidates} candidates in {time.perf_counter() - start:.1f}s")
+
+    # Imported late: main pulls in the voice stack
+    from main import app
+
+    jd_ids, candidate_ids = await sample_ids()
+    if not jd_ids or not candidate_ids:
+        sys.exit("No JDs or candidates in the database; run with --seed first")
+
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        login = await client.post("/api/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+        if login.status_code != 200:
+            sys.exit(f"Login as {ADMIN_EMAIL} failed ({login.status_code}); run with --seed first")
+        token = login.json()["access_token"]
+
+        selected = scenarios(jd_ids, candidate_ids)
+        if args.scenarios:
+            selected = {name: selected[name] for name in args.scenarios.split(",")}
+        for name, make_request in selected.items():
+            result = await run_scenario(client, name, make_request, args.requests, args.concurrency, token)
+            results.append(result)
+            print(
+                f"{name:22s} {result['rps']:8.1f} req/s  p50={result['latency_ms_p50']:7.1f}ms  "
+                f"p95={result['latency_ms_p95']:7.1f}ms  p99={result['latency_ms_p99']:7.1f}ms  "
+                f"queries/req={result['queries_per_request_avg']:4.1f}  errors={result['errors']}"
+            )
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "revision": git_revision(),
+            "requests_per_scenario": args.requests,
+            "concurrency": args.concurrency,
+            "results": results,
+        }, f, indent=2)
+    print(f"wrote {args.output}")
+    if args.compare:
+        print_comparison(results, args.compare)
+    await connection.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
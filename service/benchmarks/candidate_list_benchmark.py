@@ -0,0 +1,131 @@
+# benchmarks/candidate_list_benchmark.py
+"""Rows/s of the candidate listing read path, ORM vs. column projection.
+
+Runs against the database in DATABASE_URL and times query + serialization to
+JSON bytes, the work done per request by GET /api/candidates/:
+
+  orm         crud.get_candidates, interview_status set in a Python loop,
+              CandidateListResponse validation, jsonable_encoder + JSONResponse
+  projection  crud.get_candidate_rows (status computed in SQL), rows turned
+              into dicts and rendered by FastJSONResponse
+
+Use --seed to create a benchmark JD with that many candidates first (through
+the bulk import path); --jd-id limits both paths to one JD.
+
+Usage (from the service directory):
+    python -m benchmarks.candidate_list_benchmark --seed 20000 --rows 5000
+"""
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import statistics
+import time
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app import crud, schemas  # noqa: E402
+from app.auth import get_password_hash  # noqa: E402
+from app.db import connection  # noqa: E402
+from app.models import JobDescription  # noqa: E402
+from app.serialization import FastJSONResponse, candidate_row_to_dict  # noqa: E402
+
+
+async def seed(count: int, chunk_size: int = 1000) -> int:
+    async with connection.AsyncSessionLocal() as db:
+        jd = JobDescription(
+            title="Benchmark JD", location="Remote", opening=1, required_skills="Python",
+            min_experience=0, responsibilities="Benchmarking",
+        )
+        db.add(jd)
+        await db.commit()
+        password_hash = get_password_hash(secrets.token_urlsafe(16))
+        run = secrets.token_hex(4)
+        for start in range(0, count, chunk_size):
+            rows = [
+                (n, schemas.CandidateImportRow(email=f"bench-{run}-{n}@example.com", jd_id=jd.id, full_name=f"Candidate {n}"))
+                for n in range(start, min(count, start + chunk_size))
+            ]
+            await crud.import_candidate_chunk(db, rows, password_hash)
+        return jd.id
+
+
+async def orm_page(db, rows: int, jd_id) -> bytes:
+    candidates = await crud.get_candidates(db, limit=rows, jd_id=jd_id)
+    for c in candidates:
+        c.interview_status = c.interview.status.value if c.interview else "pending"
+    response = schemas.CandidateListResponse(success=True, status_code=200, data=candidates, next_cursor=None)
+    return JSONResponse(jsonable_encoder(response)).body
+
+
+async def projection_page(db, rows: int, jd_id) -> bytes:
+    result = await crud.get_candidate_rows(db, limit=rows, jd_id=jd_id)
+    return FastJSONResponse({
+        "success": True,
+        "status_code": 200,
+        "data": [candidate_row_to_dict(row) for row in result],
+        "next_cursor": None,
+    }).body
+
+
+async def run_mode(mode: str, rows: int, jd_id, repeat: int) -> dict:
+    page = orm_page if mode == "orm" else projection_page
+    timings = []
+    returned = 0
+    for _ in range(repeat):
+        # Fresh session each time, like a request
+        async with connection.AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            body = await page(db, rows, jd_id)
+            timings.append(time.perf_counter() - start)
+        returned = len(json.loads(body)["data"])
+    median = statistics.median(timings)
+    return {
+        "mode": mode,
+        "rows": returned,
+        "repeat": repeat,
+        "median_ms": median * 1000,
+        "rows_per_second": returned / median if median else 0.0,
+        "bytes": len(body),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000, help="rows fetched per listing")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0, help="create a JD with this many candidates first")
+    parser.add_argument("--jd-id", type=int, help="only list this JD's candidates")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    jd_id = args.jd_id
+    if args.seed:
+        jd_id = await seed(args.seed)
+        print(f"seeded {args.seed} candidates for JD {jd_id}")
+
+    results = []
+    for mode in ("orm", "projection"):
+        # Warm-up run so connection setup is not timed
+        await run_mode(mode, args.rows, jd_id, 1)
+        result = await run_mode(mode, args.rows, jd_id, args.repeat)
+        results.append(result)
+        print(
+            f"{mode:11s} {result['rows']:6d} rows  median {result['median_ms']:8.1f}ms  "
+            f"{result['rows_per_second']:10.0f} rows/s  {result['bytes']} bytes"
+        )
+    if results[0]["rows_per_second"]:
+        print(f"speedup: {results[1]['rows_per_second'] / results[0]['rows_per_second']:.2f}x")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    await connection.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
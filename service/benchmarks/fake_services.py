@@ -0,0 +1,311 @@
+# benchmarks/fake_services.py
+"""Offline stand-ins for the interview's transport and AI services.
+
+Everything here runs locally with configurable latency, so whole interview
+pipelines can be load-tested on one box with no network:
+
+  FakeTransport          scripted candidate: streams synthetic microphone audio
+                         in real time and takes a turn after each bot turn
+  StubSTTService         final transcript ``latency`` seconds after speech ends
+  StubAnthropicClient    drop-in for ``AnthropicLLMService._client``; streams a
+                         canned reply after ``ttft`` seconds, so the real
+                         Anthropic service, context and caching code still run
+  StubTTSService         synthetic speech audio after ``ttfb`` seconds
+
+The candidate's turns are scripted rather than detected: synthetic audio is
+not speech to Silero, so the VAD analyzer (when given) runs for its CPU cost
+but the transport emits the speaking frames itself.
+"""
+import asyncio
+import functools
+import itertools
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import AsyncGenerator, List, Optional
+
+import numpy as np
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    Frame,
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    StartFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.services.stt_service import STTService
+from pipecat.services.tts_service import TTSService
+from pipecat.transports.base_input import BaseInputTransport
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import BaseTransport, TransportParams
+from pipecat.utils.time import time_now_iso8601
+
+CANDIDATE_ANSWERS = [
+    "I have five years of experience building backend services in Python.",
+    "I would start by profiling the hot path and then add a cache in front of the database.",
+    "We used Postgres with read replicas and moved reporting queries off the primary.",
+    "I prefer small pull requests with tests, reviewed by someone who knows the area.",
+]
+
+INTERVIEWER_REPLY = (
+    "Thanks, that is helpful. Can you walk me through a recent project where you "
+    "had to make a performance trade-off, and how you measured the result?"
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _tone_second(sample_rate: int, frequency: float, amplitude: int) -> bytes:
+    t = np.arange(sample_rate) / sample_rate
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype("<i2").tobytes()
+
+
+def synthetic_audio(sample_rate: int, seconds: float, frequency: float = 220.0, amplitude: int = 3000) -> bytes:
+    """16-bit mono tone standing in for speech (generated once per rate, then reused)."""
+    second = _tone_second(sample_rate, frequency, amplitude)
+    size = int(sample_rate * seconds) * 2
+    whole, rest = divmod(size, len(second))
+    return second * whole + second[:rest]
+
+
+class StubSTTService(STTService):
+    """Emits one final transcript ``latency`` seconds after the candidate's audio goes quiet."""
+
+    def __init__(self, latency: float = 0.15, **kwargs):
+        super().__init__(**kwargs)
+        self._latency = latency
+        self._answers = itertools.cycle(CANDIDATE_ANSWERS)
+        self._in_speech = False
+        self._finalize_task: Optional[asyncio.Task] = None
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        speech = bool(audio.strip(b"\0"))
+        if speech and not self._in_speech:
+            self._in_speech = True
+            if self._finalize_task:
+                await self.cancel_task(self._finalize_task)
+                self._finalize_task = None
+        elif not speech and self._in_speech:
+            self._in_speech = False
+            await self.start_ttfb_metrics()
+            self._finalize_task = self.create_task(self._finalize())
+        yield None
+
+    async def _finalize(self):
+        await asyncio.sleep(self._latency)
+        await self.stop_ttfb_metrics()
+        await self.push_frame(TranscriptionFrame(next(self._answers), "", time_now_iso8601()))
+        self._finalize_task = None
+
+
+class _StubStream:
+    def __init__(self, reply: str, tokens_per_second: float, input_tokens: int):
+        self._reply = reply
+        self._token_delay = 1.0 / tokens_per_second if tokens_per_second > 0 else 0.0
+        self._input_tokens = input_tokens
+        self.closed = False
+
+    def __aiter__(self):
+        return self._events()
+
+    async def close(self):
+        self.closed = True
+
+    async def _events(self):
+        words = self._reply.split(" ")
+        usage = SimpleNamespace(
+            input_tokens=self._input_tokens, output_tokens=0,
+            cache_creation_input_tokens=0, cache_read_input_tokens=0,
+        )
+        yield SimpleNamespace(type="message_start", message=SimpleNamespace(usage=usage))
+        for n, word in enumerate(words):
+            if n:
+                await asyncio.sleep(self._token_delay)
+            if self.closed:
+                return
+            text = word if n == 0 else f" {word}"
+            yield SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text=text))
+        yield SimpleNamespace(
+            type="message_delta",
+            delta=SimpleNamespace(stop_reason="end_turn"),
+            usage=SimpleNamespace(output_tokens=len(words)),
+        )
+
+
+class _StubMessages:
+    def __init__(self, client: "StubAnthropicClient"):
+        self._client = client
+
+    async def create(self, **params):
+        client = self._client
+        client.requests += 1
+        await asyncio.sleep(client.ttft)
+        input_tokens = sum(len(str(m.get("content", ""))) for m in params.get("messages", [])) // 4
+        return _StubStream(client.reply, client.tokens_per_second, input_tokens)
+
+
+class StubAnthropicClient:
+    """Replaces the AsyncAnthropic client: ``messages.create`` streams a canned reply."""
+
+    def __init__(self, ttft: float = 0.4, tokens_per_second: float = 80.0, reply: str = INTERVIEWER_REPLY):
+        self.ttft = ttft
+        self.tokens_per_second = tokens_per_second
+        self.reply = reply
+        self.requests = 0
+        # Only what AsyncAnthropic itself has, so the load test fails where production would
+        self.messages = _StubMessages(self)
+
+
+class StubTTSService(TTSService):
+    """Returns synthetic audio ``ttfb`` seconds after each sentence, sized to the text."""
+
+    def __init__(self, ttfb: float = 0.2, chars_per_second: float = 15.0, **kwargs):
+        super().__init__(**kwargs)
+        self._ttfb = ttfb
+        self._chars_per_second = chars_per_second
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        await self.start_ttfb_metrics()
+        await asyncio.sleep(self._ttfb)
+        await self.stop_ttfb_metrics()
+        yield TTSStartedFrame()
+        seconds = max(0.2, len(text) / self._chars_per_second)
+        yield TTSAudioRawFrame(synthetic_audio(self.sample_rate, seconds), self.sample_rate, 1)
+        yield TTSStoppedFrame()
+
+
+class FakeInputTransport(BaseInputTransport):
+    """Microphone of a scripted candidate who answers after every bot turn."""
+
+    def __init__(self, transport: "FakeTransport", params: TransportParams, **kwargs):
+        super().__init__(params, **kwargs)
+        self._transport = transport
+        self._bot_done = asyncio.Event()
+        self._bot_started = asyncio.Event()
+        self._speaking = False
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        await self.set_transport_ready(frame)
+        self._tasks = [self.create_task(self._microphone()), self.create_task(self._candidate())]
+
+    async def stop(self, frame):
+        await self._cancel_tasks()
+        await super().stop(frame)
+
+    async def cancel(self, frame):
+        await self._cancel_tasks()
+        await super().cancel(frame)
+
+    async def _cancel_tasks(self):
+        for task in self._tasks:
+            await self.cancel_task(task)
+        self._tasks = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, BotStartedSpeakingFrame):
+            self._bot_started.set()
+        elif isinstance(frame, BotStoppedSpeakingFrame):
+            self._bot_done.set()
+
+    async def _microphone(self):
+        """Stream 20 ms chunks in real time: tone while speaking, silence otherwise."""
+        chunk_secs = 0.02
+        speech = synthetic_audio(self.sample_rate, chunk_secs, frequency=180.0)
+        silence = b"\0" * len(speech)
+        next_at = time.monotonic()
+        while True:
+            audio = speech if self._speaking else silence
+            await self.push_audio_frame(InputAudioRawFrame(audio=audio, sample_rate=self.sample_rate, num_channels=1))
+            next_at += chunk_secs
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+
+    async def _candidate(self):
+        script = self._transport.script
+        await self._transport._call_event_handler("on_client_connected", None)
+        for _ in range(script.turns):
+            if script.barge_in_secs is not None:
+                # Talk over the interviewer this long after it starts speaking
+                await self._bot_started.wait()
+                await asyncio.sleep(script.barge_in_secs)
+            else:
+                await self._bot_done.wait()
+                await asyncio.sleep(script.think_secs)
+            self._bot_started.clear()
+            self._bot_done.clear()
+            await self._handle_user_interruption(UserStartedSpeakingFrame())
+            self._speaking = True
+            await asyncio.sleep(script.speak_secs)
+            self._speaking = False
+            # What the VAD would wait before declaring the turn over
+            await asyncio.sleep(script.vad_stop_secs)
+            await self._handle_user_interruption(UserStoppedSpeakingFrame())
+        # Let the last reply play out, then hang up
+        await self._bot_done.wait()
+        await self._transport._call_event_handler("on_client_disconnected", None)
+
+
+class FakeOutputTransport(BaseOutputTransport):
+    """Speaker that plays audio at real-time pace and throws it away."""
+
+    def __init__(self, params: TransportParams, **kwargs):
+        super().__init__(params, **kwargs)
+        self._next_send_time = 0.0
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        await self.set_transport_ready(frame)
+
+    async def write_audio_frame(self, frame: OutputAudioRawFrame):
+        # Simulate the playback clock like a network transport would
+        now = time.monotonic()
+        if self._next_send_time < now:
+            self._next_send_time = now
+        await asyncio.sleep(self._next_send_time - now)
+        self._next_send_time += len(frame.audio) / (2 * frame.num_channels * frame.sample_rate)
+
+
+@dataclass
+class CandidateScript:
+    turns: int = 3
+    think_secs: float = 0.5  # pause after the bot stops before answering
+    speak_secs: float = 2.0  # length of each answer
+    vad_stop_secs: float = 0.8  # silence before the turn counts as over (VADParams.stop_secs)
+    barge_in_secs: Optional[float] = None  # answer this long after the bot starts, talking over it
+
+
+class FakeTransport(BaseTransport):
+    """Transport with a scripted candidate on the other end."""
+
+    def __init__(self, params: TransportParams, script: CandidateScript):
+        super().__init__()
+        self._params = params
+        self.script = script
+        self._input: Optional[FakeInputTransport] = None
+        self._output: Optional[FakeOutputTransport] = None
+        self._register_event_handler("on_client_connected")
+        self._register_event_handler("on_client_disconnected")
+
+    def input(self) -> FakeInputTransport:
+        if not self._input:
+            self._input = FakeInputTransport(self, self._params)
+        return self._input
+
+    def output(self) -> FakeOutputTransport:
+        if not self._output:
+            self._output = FakeOutputTransport(self._params)
+        return self._output
@@ -0,0 +1,132 @@
+# benchmarks/import_time_benchmark.py
+"""Import cost of the REST app and of the voice stack, in fresh interpreters.
+
+Each target is imported ``--repeat`` times, each in a new ``python -X importtime``
+process so nothing is cached in memory between runs (the OS file cache still
+is). For each target it reports the median import time, the slowest top-level
+packages, and whether any voice-stack package was loaded:
+
+  main          what a REST-only replica (SERVICE_ROLE=api) imports
+  voice_stack   what an interview process adds at startup
+                (boot.load_voice_stack minus the VAD model load)
+
+``--max-api-ms`` fails the run if ``main`` gets slower than that, and importing
+``main`` must never pull in pipecat or an AI SDK; both make the exit status
+non-zero so CI can catch a heavy import creeping into the REST path.
+
+Usage (from the service directory):
+    python -m benchmarks.import_time_benchmark --repeat 5
+"""
+import argparse
+import functools
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+VOICE_PACKAGES = ("pipecat", "anthropic", "deepgram", "cartesia", "onnxruntime", "aiortc", "av")
+
+TARGETS = {
+    "main": "import main",
+    "voice_stack": (
+        "import pipecat.runner.types, pipecat.transports.network.webrtc_connection, app.bot, app.vad"
+    ),
+}
+
+# Same placeholders the app reads at import time; nothing connects anywhere
+ENV = {
+    "DEEPGRAM_API_KEY": "benchmark",
+    "CARTESIA_API_KEY": "benchmark",
+    "ANTHROPIC_API_KEY": "benchmark",
+    "JWT_SECRET_KEY": "benchmark",
+    "DATABASE_URL": "postgresql+asyncpg://localhost/benchmark",
+}
+
+
+def _importtime(statement: str):
+    """Yield (depth, module, cumulative_us) for every import in a fresh interpreter."""
+    env = {**os.environ, **{k: os.environ.get(k, v) for k, v in ENV.items()}, "SERVICE_ROLE": "api"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    for line in proc.stderr.splitlines():
+        # "import time:      self [us] |cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        yield len(name) - len(name.lstrip()), name.strip(), int(cumulative)
+
+
+@functools.lru_cache(maxsize=1)
+def startup_modules() -> frozenset:
+    """Modules the interpreter imports before running any statement."""
+    return frozenset(name for _, name, _ in _importtime("pass"))
+
+
+def run_import(statement: str) -> dict:
+    """Import in a fresh interpreter.
+
+    Returns the time spent on the statement's imports (interpreter startup
+    excluded) and, per top-level package, the cumulative time of its own import.
+    """
+    skip = startup_modules()
+    packages = {}
+    total = 0
+    for depth, name, cumulative in _importtime(statement):
+        if name in skip:
+            continue
+        if depth == 1:
+            total += cumulative
+        if "." not in name:
+            # A package is imported once; this line covers it and its dependencies
+            packages[name] = cumulative
+    return {"total_us": total, "packages": packages}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per target")
+    parser.add_argument("--top", type=int, default=8, help="slowest packages to list per target")
+    parser.add_argument("--max-api-ms", type=float, help="fail if importing main takes longer than this")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = {}
+    failed = False
+    for target, statement in TARGETS.items():
+        runs = [run_import(statement) for _ in range(args.repeat)]
+        median_ms = statistics.median(r["total_us"] for r in runs) / 1000
+        # Package times from the run closest to the median (cumulative, so they overlap)
+        typical = min(runs, key=lambda r: abs(r["total_us"] / 1000 - median_ms))
+        top = sorted(typical["packages"].items(), key=lambda item: item[1], reverse=True)[:args.top]
+        voice = sorted(p for p in typical["packages"] if p in VOICE_PACKAGES)
+        results[target] = {
+            "median_ms": median_ms,
+            "min_ms": min(r["total_us"] for r in runs) / 1000,
+            "max_ms": max(r["total_us"] for r in runs) / 1000,
+            "top_packages_ms": {name: us / 1000 for name, us in top},
+            "voice_packages": voice,
+        }
+
+        print(f"{target}: median {median_ms:7.0f}ms over {args.repeat} runs")
+        for name, us in top:
+            print(f"    {name:<28} {us / 1000:7.0f}ms")
+        if target == "main":
+            if voice:
+                print(f"    FAIL: REST app imports voice packages: {', '.join(voice)}")
+                failed = True
+            if args.max_api_ms is not None and median_ms > args.max_api_ms:
+                print(f"    FAIL: above --max-api-ms {args.max_api_ms:.0f}")
+                failed = True
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
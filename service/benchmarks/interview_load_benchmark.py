@@ -0,0 +1,232 @@
+# benchmarks/interview_load_benchmark.py
+"""How many concurrent interviews one worker process sustains.
+
+Runs N full ``InterviewFlow`` pipelines at once in this process, each with a
+scripted candidate on a fake transport (benchmarks.fake_services) and local
+stub STT, LLM and TTS services with configurable latency. No network or API
+keys are needed. For every level of N it reports:
+
+  turn latency   candidate stops speaking (VAD) -> interviewer audio starts,
+                 p50/p95/p99 over all turns of all sessions
+  cpu            process CPU time / wall time (1.0 = one core busy)
+  memory         RSS at the start and peak during the level
+  loop lag       how late a 5 ms timer fires on the shared event loop
+
+With the stub latencies (STT + LLM TTFT + TTS TTFB) fixed, any growth in turn
+latency as N rises is time lost inside this process. ``--max-turn-p95-ms`` and
+``--max-loop-lag-p99-ms`` make the exit status fail when a level exceeds them,
+so the run can gate a release.
+
+Usage (from the service directory):
+    python -m benchmarks.interview_load_benchmark --sessions 1,4,8,16 --turns 3
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import time
+
+# Real service objects are built (then replaced by stubs) and app modules
+# read these at import time; nothing here talks to a network or database
+for name in ("DEEPGRAM_API_KEY", "CARTESIA_API_KEY", "ANTHROPIC_API_KEY", "JWT_SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+os.environ.setdefault("DATABASE_URL", "postgresql+asyncpg://localhost/benchmark")
+
+from loguru import logger  # noqa: E402
+from pipecat.runner.types import RunnerArguments  # noqa: E402
+from pipecat.transports.base_transport import TransportParams  # noqa: E402
+
+from app import vad  # noqa: E402
+from app.bot import InterviewFlow  # noqa: E402
+from benchmarks.fake_services import (  # noqa: E402
+    CandidateScript,
+    FakeTransport,
+    StubAnthropicClient,
+    StubSTTService,
+    StubTTSService,
+)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class LoadTestInterviewFlow(InterviewFlow):
+    """InterviewFlow with stub AI services and turns kept in memory only."""
+
+    def __init__(self, transport, runner_args, stubs: argparse.Namespace):
+        super().__init__(transport, runner_args)
+        self._stubs = stubs
+
+    def _setup_ai_services(self):
+        # Keep the production LLM service and settings, only swap its client
+        _, _, llm = super()._setup_ai_services()
+        llm._client = StubAnthropicClient(ttft=self._stubs.llm_ttft, tokens_per_second=self._stubs.llm_tokens_per_second)
+        stt = StubSTTService(latency=self._stubs.stt_latency)
+        tts = StubTTSService(ttfb=self._stubs.tts_ttfb)
+        return stt, tts, llm
+
+    def _record_turn(self, role: str, content: str):
+        self.turns.append((role, content))
+
+
+async def run_session(args, script: CandidateScript, delay: float) -> dict:
+    await asyncio.sleep(delay)
+    params = TransportParams(
+        audio_in_enabled=True,
+        audio_out_enabled=True,
+        vad_analyzer=vad.create_vad_analyzer() if args.vad else None,
+    )
+    flow = LoadTestInterviewFlow(FakeTransport(params, script), RunnerArguments(), args)
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(flow.run(), timeout=args.session_timeout)
+        completed = True
+    except asyncio.TimeoutError:
+        completed = False
+    return {
+        "completed": completed,
+        "seconds": time.perf_counter() - start,
+        "turn_latency": list(flow.latency.turn_latency) if flow.latency else [],
+        "stage_ttfb": {k: list(v) for k, v in flow.latency.stage_ttfb.items()} if flow.latency else {},
+        "interruptions": flow.interruptions.summary() if flow.interruptions else {},
+    }
+
+
+async def run_level(args, sessions: int) -> dict:
+    script = CandidateScript(
+        turns=args.turns, think_secs=args.think_secs, speak_secs=args.speak_secs, vad_stop_secs=args.vad_stop_secs,
+        barge_in_secs=args.barge_in_secs,
+    )
+    lags = []
+    peak_rss = rss_bytes()
+    start_rss = peak_rss
+    stop = asyncio.Event()
+
+    async def probe(interval=0.005):
+        nonlocal peak_rss
+        while not stop.is_set():
+            t = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - t - interval)
+            if len(lags) % 20 == 0:
+                peak_rss = max(peak_rss, rss_bytes())
+
+    probe_task = asyncio.create_task(probe())
+    usage_start = resource.getrusage(resource.RUSAGE_SELF)
+    wall_start = time.perf_counter()
+
+    results = await asyncio.gather(*(
+        run_session(args, script, delay=i * args.ramp_secs / max(1, sessions)) for i in range(sessions)
+    ))
+
+    wall = time.perf_counter() - wall_start
+    usage_end = resource.getrusage(resource.RUSAGE_SELF)
+    stop.set()
+    await probe_task
+
+    cpu = (usage_end.ru_utime - usage_start.ru_utime) + (usage_end.ru_stime - usage_start.ru_stime)
+    turns = [latency for r in results for latency in r["turn_latency"]]
+    stages = {}
+    waste = {}
+    for r in results:
+        for key, value in r["interruptions"].items():
+            waste[key] = waste.get(key, 0) + value
+    for r in results:
+        for stage, values in r["stage_ttfb"].items():
+            stages.setdefault(stage, []).extend(values)
+    return {
+        "sessions": sessions,
+        "completed": sum(1 for r in results if r["completed"]),
+        "turns": len(turns),
+        "turn_latency_ms_p50": percentile(turns, 50) * 1000,
+        "turn_latency_ms_p95": percentile(turns, 95) * 1000,
+        "turn_latency_ms_p99": percentile(turns, 99) * 1000,
+        **{f"{stage}_ttfb_ms_p95": percentile(values, 95) * 1000 for stage, values in sorted(stages.items())},
+        **waste,
+        "cpu_cores": cpu / wall if wall else 0.0,
+        "cpu_percent_per_session": 100 * cpu / wall / sessions if wall else 0.0,
+        "rss_mb_start": start_rss / 2**20,
+        "rss_mb_peak": peak_rss / 2**20,
+        "loop_lag_ms_p50": percentile(lags, 50) * 1000,
+        "loop_lag_ms_p99": percentile(lags, 99) * 1000,
+        "loop_lag_ms_max": max(lags) * 1000 if lags else 0.0,
+        "seconds": wall,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", default="1,4,8", help="comma-separated concurrency levels")
+    parser.add_argument("--turns", type=int, default=3, help="candidate answers per session")
+    parser.add_argument("--think-secs", type=float, default=0.5)
+    parser.add_argument("--speak-secs", type=float, default=2.0)
+    parser.add_argument("--vad-stop-secs", type=float, default=0.8)
+    parser.add_argument("--barge-in-secs", type=float, help="candidate talks over each reply this long after it starts")
+    parser.add_argument("--stt-latency", type=float, default=0.15, help="seconds from end of speech to transcript")
+    parser.add_argument("--llm-ttft", type=float, default=0.4, help="seconds to the first LLM token")
+    parser.add_argument("--llm-tokens-per-second", type=float, default=80.0)
+    parser.add_argument("--tts-ttfb", type=float, default=0.2, help="seconds to the first TTS audio")
+    parser.add_argument("--no-vad", dest="vad", action="store_false", help="skip running Silero VAD on the audio")
+    parser.add_argument("--ramp-secs", type=float, default=1.0, help="spread session starts over this long")
+    parser.add_argument("--session-timeout", type=float, default=300.0)
+    parser.add_argument("--max-turn-p95-ms", type=float, help="fail if any level's p95 turn latency is above this")
+    parser.add_argument("--max-loop-lag-p99-ms", type=float, help="fail if any level's p99 loop lag is above this")
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level)
+
+    if args.vad:
+        vad.load_vad_model()
+
+    floor_ms = (args.stt_latency + args.llm_ttft + args.tts_ttfb) * 1000
+    print(f"stub latency floor (stt + llm ttft + tts ttfb): {floor_ms:.0f} ms")
+
+    results = []
+    failed = False
+    for level in (int(n) for n in args.sessions.split(",")):
+        result = await run_level(args, level)
+        results.append(result)
+        print(
+            f"N={level:3d}  done {result['completed']:3d}  turns {result['turns']:4d}  "
+            f"turn p50={result['turn_latency_ms_p50']:6.0f}ms p95={result['turn_latency_ms_p95']:6.0f}ms "
+            f"p99={result['turn_latency_ms_p99']:6.0f}ms  cpu {result['cpu_cores']:5.2f} cores "
+            f"({result['cpu_percent_per_session']:5.1f}%/session)  rss {result['rss_mb_peak']:6.0f}MB  "
+            f"loop lag p99={result['loop_lag_ms_p99']:6.1f}ms"
+        )
+        if result.get("interruptions"):
+            print(
+                f"       interruptions {result['interruptions']}  tokens wasted "
+                f"{result['tokens_wasted']}/{result['tokens_generated']}  audio wasted "
+                f"{result['audio_seconds_wasted']:.1f}/{result['audio_seconds_synthesized']:.1f}s"
+            )
+        if result["completed"] < level:
+            failed = True
+        if args.max_turn_p95_ms is not None and result["turn_latency_ms_p95"] > args.max_turn_p95_ms:
+            failed = True
+        if args.max_loop_lag_p99_ms is not None and result["loop_lag_ms_p99"] > args.max_loop_lag_p99_ms:
+            failed = True
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if failed:
+        print("FAILED: a level did not complete or exceeded its threshold")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
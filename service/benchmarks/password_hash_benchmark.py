@@ -0,0 +1,96 @@
+# benchmarks/password_hash_benchmark.py
+"""Event-loop lag during a login storm, before and after offloading bcrypt.
+
+Simulates ``--logins`` concurrent login requests, each verifying a bcrypt
+password hash, while a probe task measures how late the event loop wakes up
+(what a live interview pipeline on the same loop would feel).
+
+  inline    pwd_context.verify called directly in the handler (old behaviour)
+  offload   auth.verify_password_async on the bounded hashing pool
+
+Usage (from the service directory):
+    python -m benchmarks.password_hash_benchmark --logins 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+# app.auth needs these at import time; nothing here talks to the database
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "postgresql+asyncpg://localhost/benchmark")
+
+from app import auth  # noqa: E402
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def probe_loop_lag(stop: asyncio.Event, lags, interval=0.005):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def login(mode: str, password: str, hashed: str):
+    # Yield once like a real handler awaiting its DB lookup
+    await asyncio.sleep(0)
+    if mode == "inline":
+        return auth.verify_password(password, hashed)
+    return await auth.verify_password_async(password, hashed)
+
+
+async def run_mode(mode: str, logins: int, hashed: str) -> dict:
+    lags = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(stop, lags))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(login(mode, "correct horse", hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    return {
+        "mode": mode,
+        "logins": logins,
+        "workers": auth.PASSWORD_HASH_WORKERS,
+        "seconds": elapsed,
+        "logins_per_second": logins / elapsed,
+        "loop_lag_ms_p50": percentile(lags, 50) * 1000,
+        "loop_lag_ms_p99": percentile(lags, 99) * 1000,
+        "loop_lag_ms_max": max(lags) * 1000 if lags else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    hashed = auth.get_password_hash("correct horse")
+    results = []
+    for mode in ("inline", "offload"):
+        result = await run_mode(mode, args.logins, hashed)
+        results.append(result)
+        print(
+            f"{mode:8s} {result['logins_per_second']:6.1f} logins/s  "
+            f"loop lag p50={result['loop_lag_ms_p50']:7.1f}ms  "
+            f"p99={result['loop_lag_ms_p99']:7.1f}ms  max={result['loop_lag_ms_max']:7.1f}ms"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
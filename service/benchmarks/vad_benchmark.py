@@ -0,0 +1,137 @@
+# benchmarks/vad_benchmark.py
+"""Compare VAD strategies under many concurrent interview streams.
+
+Each simulated session behaves like a ``SmallWebRTCTransport`` input: every
+32 ms it hands a 512-sample frame to its VAD analyzer on a single-thread
+executor and awaits the result on the event loop. Meanwhile a probe task
+measures event-loop lag, which is what the REST handlers and the other
+pipeline stages would feel.
+
+Modes:
+  per-session  a fresh SileroVADAnalyzer (own ONNX session) per stream, as before
+  shared       one loaded model, per-session state (app.vad default)
+  batched      cross-session batched inference on one worker thread (VAD_BATCHING=1)
+
+Usage (from the service directory):
+    python -m benchmarks.vad_benchmark --sessions 1 10 50 --seconds 10
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+
+from app import vad
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 512
+FRAME_SECONDS = FRAME_SAMPLES / SAMPLE_RATE
+
+
+def make_analyzer(mode: str):
+    if mode == "per-session":
+        analyzer = SileroVADAnalyzer()
+    else:
+        analyzer = vad.create_vad_analyzer(batched=(mode == "batched"))
+    analyzer.set_sample_rate(SAMPLE_RATE)
+    return analyzer
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def run_session(analyzer, seconds, latencies, rng):
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1)
+    # Speech-like noise bursts alternating with near-silence
+    speech = (rng.standard_normal(FRAME_SAMPLES) * 6000).astype(np.int16).tobytes()
+    silence = (rng.standard_normal(FRAME_SAMPLES) * 30).astype(np.int16).tobytes()
+    deadline = time.perf_counter() + seconds
+    frame = 0
+    next_tick = time.perf_counter()
+    while time.perf_counter() < deadline:
+        buffer = speech if (frame // 30) % 2 == 0 else silence
+        start = time.perf_counter()
+        await loop.run_in_executor(executor, analyzer.voice_confidence, buffer)
+        latencies.append(time.perf_counter() - start)
+        frame += 1
+        next_tick += FRAME_SECONDS
+        await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+    executor.shutdown(wait=False)
+
+
+async def probe_loop_lag(stop: asyncio.Event, lags, interval=0.01):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run_mode(mode: str, sessions: int, seconds: float) -> dict:
+    setup_start = time.perf_counter()
+    analyzers = [make_analyzer(mode) for _ in range(sessions)]
+    setup_seconds = time.perf_counter() - setup_start
+
+    rng = np.random.default_rng(0)
+    latencies, lags = [], []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(stop, lags))
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(run_session(a, seconds, latencies, rng) for a in analyzers))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    stop.set()
+    await probe
+
+    return {
+        "mode": mode,
+        "sessions": sessions,
+        "setup_ms_per_session": setup_seconds / sessions * 1000,
+        "cpu_pct_per_session": cpu / wall / sessions * 100,
+        "frames": len(latencies),
+        "vad_latency_ms_p50": percentile(latencies, 50) * 1000,
+        "vad_latency_ms_p99": percentile(latencies, 99) * 1000,
+        "loop_lag_ms_p50": percentile(lags, 50) * 1000,
+        "loop_lag_ms_p99": percentile(lags, 99) * 1000,
+        "loop_lag_ms_mean": statistics.fmean(lags) * 1000 if lags else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 25, 50])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--modes", nargs="+", default=["per-session", "shared", "batched"])
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    vad.load_vad_model()
+    results = []
+    for sessions in args.sessions:
+        for mode in args.modes:
+            result = await run_mode(mode, sessions, args.seconds)
+            results.append(result)
+            print(
+                f"{mode:12s} n={sessions:3d}  cpu/session={result['cpu_pct_per_session']:5.2f}%  "
+                f"vad p99={result['vad_latency_ms_p99']:6.2f}ms  "
+                f"loop lag p99={result['loop_lag_ms_p99']:6.2f}ms"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
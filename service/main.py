@@ -1,17 +1,29 @@
+# Imported first so boot timing covers every other import
+from app import boot
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.security import OAuth2PasswordBearer
 from app.db import connection
-from app.models import Base
-from app.api import auth, jd, candidate
+from app import crud
+from app import auth as auth_service
+from app.models import Base, InterviewStatus, create_missing_indexes
+from app.api import auth, jd, candidate, dashboard, search, skills
+from app.session_manager import session_manager
+from app.worker_pool import worker_pool
+from app import metrics
+from app.transcript_writer import transcript_writer
+from app.assessment_worker import ASSESSMENT_WORKER, assessment_worker
 import asyncio
 from pydantic import BaseModel
-from starlette.responses import JSONResponse
+from typing import Optional
+from app.schemas import SessionStats
+from starlette.responses import JSONResponse, Response
 import uvicorn
 from loguru import logger
 
-
-# Add WebRTC import
-from pipecat.transports.network.webrtc_connection import SmallWebRTCConnection
+# The voice stack (pipecat, AI SDKs, Silero) is not imported here: processes
+# that run interviews load it at startup via boot.load_voice_stack
+boot.mark("imports")
 
 app = FastAPI(title="Interview Service")
 
@@ -28,21 +40,101 @@ app.add_middleware(
 app.include_router(auth.router)
 app.include_router(jd.router)
 app.include_router(candidate.router)
+app.include_router(dashboard.router)
+app.include_router(search.router)
+app.include_router(skills.router)
+
+# Prometheus scrape endpoint
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    body, content_type = metrics.render_latest()
+    return Response(content=body, media_type=content_type)
 
 # Model for WebRTC connection request
 class WebRTCConnectionRequest(BaseModel):
     offer: str
     type: str = "offer"  # Default to "offer" if not provided
     job_id: str = None   # Optional job ID for customizing the interview
+    candidate_id: Optional[int] = None  # Optional candidate whose interview this is; needs their token
+
+# Anonymous sessions are allowed (practice interviews not linked to a candidate)
+optional_token = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+async def authorize_interview(candidate_id: Optional[int], token: Optional[str]) -> Optional[JSONResponse]:
+    """Only the candidate's own account may start, and so complete, their interview.
+
+    Returns an error response, or None when the session may go ahead.
+    """
+    if candidate_id is None:
+        return None
+    if not token:
+        return JSONResponse(
+            status_code=401,
+            content={"status": "error", "message": "Sign in to start your interview"},
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    async with connection.AsyncSessionLocal() as db:
+        user = await auth_service.get_current_user(token, db)  # raises 401 for a bad token
+        access = await crud.get_candidate_interview_access(db, candidate_id)
+    if access is None or access.user_id != user.id:
+        return JSONResponse(
+            status_code=403,
+            content={"status": "error", "message": "This interview belongs to another candidate"},
+        )
+    if access.status == InterviewStatus.completed:
+        return JSONResponse(
+            status_code=409,
+            content={"status": "error", "message": "This interview has already been completed"},
+        )
+    return None
 
 # API endpoint to create a WebRTC connection
 @app.post("/api/connect")
-async def create_connection(request: WebRTCConnectionRequest):
+async def create_connection(request: WebRTCConnectionRequest, token: Optional[str] = Depends(optional_token)):
+    if not boot.serves_interviews():
+        return JSONResponse(
+            status_code=503,
+            content={"status": "error", "message": "This replica does not run interviews"},
+        )
+
+    denied = await authorize_interview(request.candidate_id, token)
+    if denied:
+        return denied
+
+    # Admit the session before doing any WebRTC work so an overloaded process
+    # spends nothing on offers it cannot serve
+    if not await session_manager.acquire():
+        retry_after = session_manager.retry_after
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "busy",
+                "message": "Interview capacity reached, please retry shortly",
+                "retry_after": retry_after,
+            },
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    # The slot belongs to the session once it is handed off; until then it is
+    # ours to free, including when this request is cancelled (client gone),
+    # which raises CancelledError and skips ``except Exception``
+    handed_off = False
     try:
         logger.info("Received connection request")
         if request.job_id:
             logger.info(f"Job ID: {request.job_id}")
+
+        if worker_pool.enabled:
+            # Signaling only: a worker process answers the offer and runs the
+            # bot, and the pool frees the slot when that session ends
+            answer = await worker_pool.start_session(
+                request.offer, request.type, request.job_id, request.candidate_id
+            )
+            handed_off = True
+            return answer
         
+        from pipecat.transports.network.webrtc_connection import SmallWebRTCConnection
+
         # Create a proper WebRTC connection object
         pipecat_connection = SmallWebRTCConnection()
         
@@ -60,11 +152,10 @@ async def create_connection(request: WebRTCConnectionRequest):
         # Create runner arguments with the connection
         runner_args = SmallWebRTCRunnerArguments(webrtc_connection=pipecat_connection)
         
-        # Run the bot in a background task, optionally passing job_id
-        if request.job_id:
-            asyncio.create_task(bot(runner_args, request.job_id))
-        else:
-            asyncio.create_task(bot(runner_args))
+        # Run the bot in a background task, optionally passing job_id.
+        # The session manager frees the slot when the bot finishes.
+        session_manager.spawn(bot(runner_args, request.job_id, request.candidate_id))
+        handed_off = True
         
         # Return the answer to the client
         return answer
@@ -72,6 +163,19 @@ async def create_connection(request: WebRTCConnectionRequest):
     except Exception as e:
         logger.error(f"Error connecting: {str(e)}")
         return JSONResponse({"status": "error", "message": str(e)})
+    finally:
+        if not handed_off:
+            session_manager.release()
+
+# Live session counts for this process
+@app.get("/api/sessions/stats", response_model=SessionStats)
+async def session_stats():
+    if worker_pool.enabled:
+        return {**session_manager.stats(), "workers": worker_pool.stats()}
+    if boot.voice_loaded():
+        from app import vad
+        return {**session_manager.stats(), "vad": vad.stats()}
+    return session_manager.stats()
 
 # Health check endpoint
 @app.get("/health")
@@ -84,6 +188,35 @@ async def on_startup():
     # This avoids using the sync engine and driver
     async with connection.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_missing_indexes)
+
+    # Install the dashboard counter and skill index triggers; the first install covers existing data
+    async with connection.AsyncSessionLocal() as db:
+        await crud.ensure_interview_stats(db)
+        await crud.ensure_skill_index(db)
+    boot.mark("database")
+
+    if boot.serves_interviews():
+        if worker_pool.enabled:
+            # Bots run in worker processes, which load the voice stack themselves
+            await worker_pool.start()
+            boot.mark("workers_started")
+        else:
+            # Import the pipeline and prewarm the shared VAD model now so the
+            # first candidate doesn't pay for either
+            await asyncio.to_thread(boot.load_voice_stack)
+    if ASSESSMENT_WORKER:
+        # Transcript scoring; keep it off replicas that run live interviews
+        await assessment_worker.start()
+    boot.log_report()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    # Let worker sessions wind down, then write out any interview turns still queued
+    if worker_pool.enabled:
+        await worker_pool.stop()
+    await transcript_writer.stop()
+    await assessment_worker.stop()
 
 @app.get("/")
 async def root():